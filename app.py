@@ -4,13 +4,113 @@
 # Created on: Apr 27, 2024
 #
 
-from flask import Flask, render_template, request
-from sudoku.model import SudokuBoard
-from copy import deepcopy
-from chess import *
+import base64
+import binascii
+import json
+import threading
+import time
+
+from flask import Flask, Response, g, jsonify, render_template, request, stream_with_context, url_for
+from metrics import CONTENT_TYPE, Metrics
+
+# The solvers, the job manager and the chess modules are imported by the routes
+# that use them, so that a worker starts with little more than Flask loaded
+# (see `benchmarks/import_time.py`)
 
 app = Flask(__name__)
 
+
+def _lazy(factory):
+    """
+    Turns a factory into a function that calls it on first use and returns the same object ever after.
+    """
+    lock = threading.Lock()
+    created = []
+
+    def get():
+        if not created:
+            with lock:
+                if not created:
+                    created.append(factory())
+        return created[0]
+
+    get.__doc__ = factory.__doc__
+    return get
+
+@_lazy
+def puzzle_pool():
+    """
+    Ready-made puzzles (about half of the numbers given) for the "random puzzle" path of `/solve_sudoku`;
+    the pool starts generating on its first use, not when a worker imports the app.
+    """
+    from sudoku.generator import PuzzleGenerator
+    from sudoku.pool import PuzzlePool
+    return PuzzlePool(capacity=32, low_water=8, generator=PuzzleGenerator(clues=41))
+
+@_lazy
+def solution_cache():
+    """
+    Solutions of submitted boards, shared by all their relabeled/permuted/transposed variants.
+    """
+    from sudoku.cache import SolutionCache
+    return SolutionCache(capacity=4096, ttl=24 * 60 * 60)
+
+# Submitted boards are solved in the background, a few at a time and within a budget,
+# so that no board can tie up a request thread for long
+SOLVE_MAX_NODES = 200000
+SOLVE_TIMEOUT = 5.0
+
+@_lazy
+def solve_jobs():
+    """
+    The job manager that solves submitted boards.
+    """
+    from jobs import JobManager
+    return JobManager(max_workers=2, max_queued=32, max_nodes=SOLVE_MAX_NODES, timeout=SOLVE_TIMEOUT)
+
+# Latency of every route and the search statistics of every solve, served from `/metrics`
+metrics = Metrics()
+
+# `/sudoku/steps` streams the search in batches of this many nodes, for at most this
+# many seconds; the client can resume a stopped stream from its last snapshot
+STEP_BATCH = 25
+STEP_TIMEOUT = 60.0
+
+
+def _solve_job(stats, cells, route):
+    """
+    Solves a board in a job; the result says how many solutions it has (capped at 2) and gives one.
+
+    The search statistics are recorded under `route`, whether the solve finishes or not.
+    """
+    from sudoku.model import SudokuBoard
+
+    sudoku_board = SudokuBoard(cells)
+    try:
+        num_solutions = solution_cache().solve(sudoku_board, stats=stats)
+    finally:
+        metrics.observe_search(route, stats)
+    return {
+        "num_solutions": num_solutions,
+        "solution": sudoku_board.to_string() if num_solutions else None,
+    }
+
+def _sse(event, data):
+    """
+    Formats one server-sent event with a JSON payload.
+    """
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+@app.before_request
+def _start_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def _record_request(response):
+    route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    metrics.observe_request(route, response.status_code, time.perf_counter() - g.request_start)
+    return response
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -21,53 +121,220 @@ def sudoku():
 
 @app.route('/solve_sudoku', methods=['POST'])
 def solve_sudoku():
+    from jobs import JobQueueFull
+    from sudoku.model import SudokuBoard
+
     given_board = [[0 for _ in range(9)] for _ in range(9)]
     for i in range(9):
         for j in range(9):
             cell_value = request.form.get(f'cell{i}{j}')
-            if cell_value.isdigit():
+            if cell_value.isdecimal():
                 given_board[i][j] = int(cell_value)
 
-    # Check if all elements in the given_board are 0
-    all_zero = all(all(cell == 0 for cell in row) for row in given_board)
+    # An all-zero board asks for a random puzzle, which the pool has ready together with its solution
+    if all(all(cell == 0 for cell in row) for row in given_board):
+        puzzle, solution = puzzle_pool().get()
+        return render_template(
+            'sudoku.html',
+            puzzle=puzzle.to_string(),
+            puzzle_board=puzzle.board,
+            solved_board=solution.board
+        )
 
-    # Generate a Sudoku board
-    sudoku_board = (
-        SudokuBoard.get_random_puzzle()
-        if all_zero
-        else SudokuBoard(given_board)
-    )
-    puzzle_board = deepcopy(sudoku_board.board)
+    try:
+        sudoku_board = SudokuBoard(given_board)
+    except ValueError:
+        return render_template(
+            'input_sudoku.html',
+            error="Every given number must be between 1 and 9.",
+            given_board=given_board,
+            conflicts=[]
+        ), 400
+    puzzle_board = sudoku_board.board
+
+    # Reject clashing clues before any search, then boards without exactly one solution
+    error = None
+    conflicts = sudoku_board.find_conflicts()
+    if conflicts:
+        error = "Some of the given numbers clash with each other."
+    else:
+        # Solve in a job and wait for it; the job stops itself at its deadline or node budget
+        try:
+            job = solve_jobs().submit(_solve_job, bytes(sudoku_board), request.url_rule.rule)
+        except JobQueueFull:
+            error = "The solver is busy right now. Please try again in a moment."
+        else:
+            # The job's deadline runs from its submission, so this waits at most
+            # SOLVE_TIMEOUT in all, plus the moment a stopped search needs to notice
+            if not job.wait(SOLVE_TIMEOUT + 0.1):
+                solve_jobs().cancel(job.id)
+                job.wait(0.1)
 
-    # TODO: Check whether it is solvable or not
+            if job.started is None:
+                error = "The solver is busy right now. Please try again in a moment."
+            elif job.status == "failed":
+                error = "The solver failed on this board."
+            elif job.status != "done":
+                error = "This board is too hard: the solver timed out."
+            elif job.result["num_solutions"] == 0:
+                error = "This board has no solution."
+            elif job.result["num_solutions"] > 1:
+                error = "This board has more than one solution. Please add more numbers."
 
-    # Solve the puzzle board
-    sudoku_board.solve()
+    if error:
+        return render_template(
+            'input_sudoku.html',
+            error=error,
+            given_board=given_board,
+            conflicts=conflicts
+        ), 400
 
-    solved_board = sudoku_board.board  # This is solved
+    solved_board = SudokuBoard.from_string(job.result["solution"]).board
 
     # Pass both the puzzle board and the solved board to the template
     return render_template(
         'sudoku.html', 
+        puzzle=sudoku_board.to_string(),
         puzzle_board=puzzle_board,
         solved_board=solved_board
     )
 
+@app.route('/sudoku/steps')
+def sudoku_steps():
+    """
+    Streams the search for a solution as server-sent events.
+
+    Query parameters: `board` (the 81-character puzzle), `batch` (nodes per event),
+    `delay` (seconds between events, for animation) and `resume` (the `snapshot` of
+    an earlier event, to carry on from there). The stream sends a `start` event, then
+    `diff` events with the cells filled (`[idx, num]`) and emptied (`[idx, 0]`) since
+    the previous one, and ends with `done`, or `stopped` if the node or time budget
+    ran out.
+    """
+    from backtracking import SearchAborted
+    from sudoku.model import SudokuBoard
+    from sudoku.steps import SudokuStepper
+
+    try:
+        sudoku_board = SudokuBoard.from_string(request.args.get('board', ''))
+        resume = request.args.get('resume')
+        snapshot = base64.urlsafe_b64decode(resume) if resume else None
+        stepper = SudokuStepper(bytes(sudoku_board), max_nodes=SOLVE_MAX_NODES, snapshot=snapshot)
+    except (ValueError, IndexError, binascii.Error) as e:
+        return jsonify(error=str(e) or "Invalid snapshot"), 400
+
+    batch = min(max(request.args.get('batch', STEP_BATCH, type=int), 1), 1000)
+    delay = min(max(request.args.get('delay', 0.0, type=float), 0.0), 1.0)
+    route = request.url_rule.rule
+
+    def progress():
+        return {
+            "ops": stepper.diffs(),
+            "filled": stepper.filled,
+            "nodes": stepper.stats.nodes,
+            "depth": stepper.depth,
+            "progress": round(stepper.progress, 6),
+            "snapshot": base64.urlsafe_b64encode(stepper.snapshot()).decode(),
+        }
+
+    def events():
+        deadline = time.monotonic() + STEP_TIMEOUT
+        try:
+            yield _sse("start", {"board": sudoku_board.to_string(), "size": stepper.size})
+            yield _sse("diff", progress())
+            while not stepper.done:
+                if time.monotonic() > deadline:
+                    yield _sse("stopped", {"error": "The search ran out of time.", **progress()})
+                    return
+                stepper.advance(batch)
+                yield _sse("diff", progress())
+                if delay:
+                    time.sleep(delay)
+        except SearchAborted:
+            yield _sse("stopped", {"error": "The search ran out of nodes.", **progress()})
+            return
+        finally:
+            metrics.observe_search(route, stepper.stats)
+        yield _sse("done", {"solved": stepper.solution is not None, "nodes": stepper.stats.nodes})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.route('/sudoku/pool_stats')
+def sudoku_pool_stats():
+    return jsonify(puzzle_pool().stats())
+
+@app.route('/sudoku/cache_stats')
+def sudoku_cache_stats():
+    return jsonify(solution_cache().stats())
+
+@app.route('/sudoku/jobs', methods=['POST'])
+def sudoku_submit_job():
+    from jobs import JobQueueFull
+    from sudoku.model import SudokuBoard
+
+    # The board as an 81-character string, in a form field or a JSON body
+    data = request.get_json(silent=True) or request.form
+    try:
+        sudoku_board = SudokuBoard.from_string(str(data.get('board', '')))
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+
+    conflicts = sudoku_board.find_conflicts()
+    if conflicts:
+        return jsonify(error="Some of the given numbers clash with each other.", conflicts=conflicts), 400
+
+    try:
+        job = solve_jobs().submit(_solve_job, bytes(sudoku_board), request.url_rule.rule)
+    except JobQueueFull as e:
+        return jsonify(error=str(e)), 503
+
+    response = jsonify(job.to_dict())
+    response.status_code = 202
+    response.headers['Location'] = url_for('sudoku_job', job_id=job.id)
+    return response
+
+@app.route('/sudoku/jobs/<job_id>')
+def sudoku_job(job_id):
+    job = solve_jobs().get(job_id)
+    if job is None:
+        return jsonify(error="Unknown job"), 404
+    return jsonify(job.to_dict())
+
+@app.route('/sudoku/jobs/<job_id>/cancel', methods=['POST'])
+def sudoku_cancel_job(job_id):
+    job = solve_jobs().get(job_id)
+    if job is None:
+        return jsonify(error="Unknown job"), 404
+    return jsonify(cancelled=solve_jobs().cancel(job_id), job=job.to_dict())
+
+@app.route('/sudoku/jobs/stats')
+def sudoku_job_stats():
+    return jsonify(solve_jobs().stats())
+
+@app.route('/metrics')
+def prometheus_metrics():
+    return Response(metrics.render(), content_type=CONTENT_TYPE)
+
 @app.route('/chessboard')
 def chessboard():
-    chess_board_obj = ChessBoard.from_list(eight_queens_board)
+    from chess.boards import eight_queens_board
+    from chess.chessboard import ChessBoard
+    from chess.knights_tour import find_tour, tour_to_board
 
-    board = [
-        [57, 12, 20, 23, 49, 11, 31, 36],
-        [45, 6, 4, 24, 52, 2, 22, 54],
-        [17, 26, 59, 16, 10, 29, 64, 47],
-        [38, 63, 41, 61, 14, 53, 18, 44],
-        [9, 35, 62, 34, 55, 1, 7, 19],
-        [40, 5, 32, 43, 56, 28, 60, 46],
-        [50, 15, 27, 58, 51, 30, 3, 37],
-        [39, 13, 33, 21, 42, 8, 48, 25]
-    ]
+    # `?problem=knights_tour` shows a closed knight's tour, numbered move by move
+    if request.args.get('problem') == 'knights_tour':
+        tour = find_tour(8, closed=True)
+        return render_template(
+            'chessboard.html',
+            chess_board=tour_to_board(tour),
+            numbered=True
+        )
 
+    chess_board_obj = ChessBoard.from_list(eight_queens_board)
 
     return render_template(
         'chessboard.html',
@@ -0,0 +1,11 @@
+# backtracking/__init__.py
+#
+# Pieces shared by the solvers of every puzzle.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from .stats import *
+from .engine import *
+from .stepper import *
@@ -0,0 +1,149 @@
+# backtracking/engine.py
+#
+# A generic depth-first backtracking search on an explicit stack.
+#
+# The puzzle is described by a problem object with five methods:
+#
+#   select()            -> the next variable to decide, or None once the
+#                          assignment is complete
+#   order(var)          -> the values to try for `var`, in order
+#   assign(var, value)  -> makes the assignment (and any inference that comes
+#                          with it); returns False if it breaks a constraint
+#   undo(var, value)    -> takes back the last assignment; called after every
+#                          `assign`, whether it succeeded or not
+#   solution()          -> a snapshot of the complete assignment
+#
+# Variable ordering, value ordering, constraint checks and undo are therefore
+# all up to the problem, while the engine owns the search itself: one entry
+# per decision on explicit stacks, so the depth is not limited by Python's
+# recursion limit, and the same `SearchStats` counters, node budget and hooks
+# for every puzzle.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from .stats import SearchAborted, SearchStats
+
+__all__ = ["MODES", "iter_solutions", "search"]
+
+MODES = ("first", "all", "count")
+
+def _values(values):
+    # The values of a variable as a sequence that can be indexed
+    return values if isinstance(values, (list, tuple, range)) else list(values)
+
+
+def iter_solutions(problem, stats=None, snapshot=True):
+    """
+    Enumerates the solutions of a problem by depth-first search.
+
+    Parameters:
+        problem: The problem (see the module notes).
+        stats (SearchStats, optional): Counters updated while searching; `SearchAborted`
+            is raised once they exceed `stats.limit`, and `stats.hooks`, if set, is told
+            about every assignment made and taken back.
+        snapshot (bool): Yield `problem.solution()` for every solution; if False, yield
+            True and leave the complete assignment in place until the next step.
+
+    Yields:
+        The solutions, in the order the search reaches them. After the last one the
+        problem is back in its initial state; if the generator is closed early, the
+        assignments of the current branch are left in place.
+    """
+    if stats is None:
+        stats = SearchStats()
+    hooks = stats.hooks
+    select, order, assign, undo = problem.select, problem.order, problem.assign, problem.undo
+
+    var = select()
+    if var is None:
+        yield problem.solution() if snapshot else True
+        return
+
+    # One entry per decision in each of three parallel stacks: the variable, its
+    # values and the position of the value in effect (-1 before the first one).
+    # Positions rather than iterators keep a level down to a small int.
+    variables = [var]
+    values = [_values(order(var))]
+    positions = [-1]
+    if stats.max_depth < 1:
+        stats.max_depth = 1
+    while values:
+        level, position = values[-1], positions[-1]
+        if position >= 0:
+            # Take back the previous value of this variable before trying the next
+            undo(variables[-1], level[position])
+            stats.backtracks += 1
+            if hooks is not None:
+                hooks.undo(len(values) - 1, variables[-1], level[position])
+
+        position += 1
+        if position >= len(level):
+            variables.pop()
+            values.pop()
+            positions.pop()
+            continue
+
+        stats.nodes += 1
+        if stats.nodes > stats.limit:
+            raise SearchAborted(f"Search stopped after {stats.limit} nodes")
+        positions[-1] = position
+        var, value = variables[-1], level[position]
+        if hooks is not None:
+            hooks.place(len(values) - 1, var, value)
+        if not assign(var, value):
+            continue
+
+        var = select()
+        if var is None:
+            yield problem.solution() if snapshot else True
+            continue
+
+        variables.append(var)
+        values.append(_values(order(var)))
+        positions.append(-1)
+        if len(values) > stats.max_depth:
+            stats.max_depth = len(values)
+
+
+def search(problem, mode="first", limit=None, max_nodes=None, stats=None):
+    """
+    Solves a problem by depth-first search.
+
+    Parameters:
+        problem: The problem (see the module notes).
+        mode (str): "first" for the first solution, "all" for the list of solutions,
+            or "count" for their number.
+        limit (int, optional): Stop after this many solutions ("all" and "count").
+        max_nodes (int, optional): Give up after trying this many values.
+        stats (SearchStats, optional): Counters updated while searching (a new one is
+            used if not given); `max_nodes`, if given, becomes its limit.
+
+    Returns:
+        The first solution (or None), the list of solutions, or their number. In
+        "first" mode the problem is left holding the solution.
+
+    Raises:
+        SearchAborted: If more than `max_nodes` values had to be tried.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode!r}")
+    if stats is None:
+        stats = SearchStats(max_nodes)
+    elif max_nodes is not None:
+        stats.limit = max_nodes
+
+    if mode == "first":
+        return next(iter_solutions(problem, stats), None)
+
+    solutions = iter_solutions(problem, stats, snapshot=mode == "all")
+    found = []
+    count = 0
+    for solution in solutions:
+        count += 1
+        if mode == "all":
+            found.append(solution)
+        if limit is not None and count >= limit:
+            break
+    return found if mode == "all" else count
@@ -0,0 +1,100 @@
+# backtracking/stats.py
+#
+# Search statistics and instrumentation hooks shared by every solver.
+#
+# A solver takes a `SearchStats` and updates its counters as it goes; they
+# cost an attribute increment per node. Callbacks are opt-in: a solver reads
+# `stats.hooks` once and, while it is None, pays a single `is None` test per
+# node for them.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import math
+import time
+from contextlib import contextmanager
+
+__all__ = ["SearchAborted", "SearchStats", "SearchHooks"]
+
+
+class SearchAborted(Exception):
+    """
+    Raised by a search whose `SearchStats.limit` has been exceeded.
+    """
+
+
+class SearchHooks:
+    """
+    Callbacks invoked by a search on every branch decision; the methods do nothing
+    unless overridden.
+
+    `depth` is the number of decisions above the current one (0 for the first),
+    `var` the variable decided (a cell index, a column, ...) and `value` the value
+    given to it. Placements forced by constraint propagation are not reported.
+    """
+
+    def place(self, depth, var, value):
+        """Called when the search assigns `value` to `var`."""
+
+    def undo(self, depth, var, value):
+        """Called when the search takes back the assignment of `value` to `var`."""
+
+
+class SearchStats:
+    """
+    Counters collected during a single search.
+
+    Attributes:
+        nodes (int): Number of values tried, i.e. nodes of the search tree explored.
+        backtracks (int): Number of placements that had to be undone.
+        max_depth (int): Largest number of branch decisions in effect at once.
+        propagated (int): Number of variables fixed by constraint propagation.
+        eliminated (int): Number of candidate eliminations made by constraint propagation.
+        phases (dict): Seconds spent in every phase of the solve, e.g. "setup" or "search".
+        limit (float): The search raises `SearchAborted` once `nodes` exceeds it; lowering
+            it to 0 from another thread stops a running search at its next node.
+        hooks (SearchHooks or None): Callbacks for every branch decision.
+    """
+
+    __slots__ = ("nodes", "backtracks", "max_depth", "propagated", "eliminated", "phases", "limit", "hooks")
+
+    def __init__(self, limit=None, hooks=None):
+        self.nodes = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.propagated = 0
+        self.eliminated = 0
+        self.phases = {}
+        self.limit = math.inf if limit is None else limit
+        self.hooks = hooks
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Adds the time spent in the `with` block to `phases[name]`.
+        """
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def to_dict(self):
+        """
+        Returns the counters and phase times as a JSON-serializable dict.
+        """
+        return {
+            "nodes": self.nodes,
+            "backtracks": self.backtracks,
+            "max_depth": self.max_depth,
+            "propagated": self.propagated,
+            "eliminated": self.eliminated,
+            "phases": dict(self.phases),
+        }
+
+    def __repr__(self):
+        return (
+            f"SearchStats(nodes={self.nodes}, backtracks={self.backtracks}, max_depth={self.max_depth}, "
+            f"propagated={self.propagated}, eliminated={self.eliminated})"
+        )
@@ -0,0 +1,235 @@
+# backtracking/stepper.py
+#
+# A resumable, step-wise version of the backtracking engine.
+#
+# `Stepper` runs the same depth-first search as `backtracking.engine` on the
+# same problem objects, but a few nodes at a time: `advance(steps)` tries at
+# most `steps` values and returns, leaving the search paused where it stopped.
+# Between calls every decision but the last is in effect on the problem, so
+# the problem itself can be shown (or diffed) as the search goes.
+#
+# Instead of value iterators, every level keeps the list of its values and the
+# position of the value in effect. The variables and positions alone describe
+# where the search is, so `snapshot()` is a few bytes per decision and a new
+# stepper on a fresh copy of the problem resumes from it by replaying those
+# decisions; it also records whether the search is done, so a snapshot taken
+# at a solution resumes to that solution. This needs variables that are
+# non-negative integers, and a `select` and `order` that depend only on the
+# decisions in effect (not on what was tried and undone before). Every replayed
+# variable must be the one `select` picks, so a snapshot of another problem (or
+# a crafted one) is rejected instead of searching from an arbitrary state.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from array import array
+
+from .stats import SearchAborted, SearchStats
+
+__all__ = ["Stepper"]
+
+# State of the search, stored in a snapshot after the typecode
+_RUNNING, _SOLVED, _EXHAUSTED = range(3)
+
+
+class Stepper:
+    """
+    A depth-first search that can be advanced a few nodes at a time, paused and resumed.
+
+    Attributes:
+        problem: The problem being solved (see `backtracking.engine`).
+        stats (SearchStats): Counters of the search so far; its hooks are called as usual.
+        done (bool): True once a solution was found or the search space is exhausted.
+        solution: `problem.solution()` of the solution found, or None.
+    """
+
+    def __init__(self, problem, stats=None, snapshot=None):
+        """
+        Starts (or, from a snapshot, resumes) the search of `problem`.
+
+        Parameters:
+            problem: The problem, in its initial state.
+            stats (SearchStats, optional): Counters updated while searching.
+            snapshot (bytes, optional): The output of `snapshot()` of a stepper on the
+                same problem; its decisions are replayed without counting them as nodes.
+
+        Raises:
+            ValueError: If the snapshot is malformed or does not match the problem.
+        """
+        self.problem = problem
+        self.stats = SearchStats() if stats is None else stats
+        self.done = False
+        self.solution = None
+        self._variables = []
+        self._values = []
+        self._positions = []  # index of the value in effect, or of the last one tried at the top
+
+        if snapshot:
+            self._replay(*self._decode(snapshot))
+            return
+
+        var = problem.select()
+        if var is None:
+            self.done = True
+            self.solution = problem.solution()
+        else:
+            self._push(var, list(problem.order(var)))
+
+    def _replay(self, state, decisions):
+        # Redo the decisions of a snapshot; all of them are in effect at a solution,
+        # all but the last (the value being tried) otherwise
+        problem = self.problem
+        if state == _EXHAUSTED:
+            if decisions:
+                raise ValueError("Invalid snapshot")
+            self.done = True
+            return
+
+        in_effect = len(decisions) if state == _SOLVED else len(decisions) - 1
+        for level, (var, position) in enumerate(decisions):
+            if var != problem.select():
+                raise ValueError("The snapshot does not match the problem")
+            values = list(problem.order(var))
+            if not (0 if level < in_effect else -1) <= position < len(values):
+                raise ValueError("The snapshot does not match the problem")
+            self._push(var, values, position)
+            if level < in_effect and not problem.assign(var, values[position]):
+                raise ValueError("The snapshot does not match the problem")
+
+        if state == _SOLVED:
+            if problem.select() is not None:
+                raise ValueError("The snapshot does not match the problem")
+            self.done = True
+            self.solution = problem.solution()
+        elif not decisions:
+            raise ValueError("Invalid snapshot")
+
+    def _push(self, var, values, position=-1):
+        self._variables.append(var)
+        self._values.append(values)
+        self._positions.append(position)
+        if len(self._values) > self.stats.max_depth:
+            self.stats.max_depth = len(self._values)
+
+    @property
+    def depth(self):
+        """The number of decisions in effect."""
+        return max(len(self._values) - 1, 0)
+
+    def _undo_top(self):
+        # Take back the value in effect at the top level
+        var, value = self._variables[-1], self._values[-1][self._positions[-1]]
+        self.problem.undo(var, value)
+        self.stats.backtracks += 1
+        if self.stats.hooks is not None:
+            self.stats.hooks.undo(len(self._values) - 1, var, value)
+
+    def advance(self, steps=1):
+        """
+        Tries at most `steps` values, stopping early at the first solution.
+
+        Returns:
+            int: The number of values tried.
+
+        Raises:
+            SearchAborted: If `stats.limit` nodes have been tried; the stepper stays
+                paused and can be advanced again after raising the limit.
+        """
+        stats, problem = self.stats, self.problem
+        hooks = stats.hooks
+        variables, values, positions = self._variables, self._values, self._positions
+        tried = 0
+        while tried < steps and not self.done:
+            positions[-1] += 1
+            if positions[-1] >= len(values[-1]):
+                # Every value of the top variable failed: go back one decision
+                variables.pop()
+                values.pop()
+                positions.pop()
+                if not values:
+                    self.done = True
+                    break
+                self._undo_top()
+                continue
+
+            if stats.nodes >= stats.limit:
+                positions[-1] -= 1
+                raise SearchAborted(f"Search stopped after {stats.limit} nodes")
+            stats.nodes += 1
+            tried += 1
+            var, value = variables[-1], values[-1][positions[-1]]
+            if hooks is not None:
+                hooks.place(len(values) - 1, var, value)
+            if not problem.assign(var, value):
+                self._undo_top()
+                continue
+
+            var = problem.select()
+            if var is None:
+                self.done = True
+                self.solution = problem.solution()
+                break
+            self._push(var, list(problem.order(var)))
+        return tried
+
+    def run(self):
+        """
+        Advances until the search is done.
+
+        Returns:
+            The solution, or None if there is none.
+        """
+        while not self.done:
+            self.advance(1 << 16)
+        return self.solution
+
+    @property
+    def progress(self):
+        """
+        Estimates the fraction of the search tree explored so far.
+
+        Every level splits the share of its parent evenly among its values, so the
+        estimate never decreases and reaches 1.0 once the search space is exhausted.
+        It takes one pass over the current decisions.
+        """
+        if self.done and self.solution is None:
+            return 1.0
+        explored, share = 0.0, 1.0
+        top = len(self._values) - 1
+        for level, (values, position) in enumerate(zip(self._values, self._positions)):
+            if not values:
+                break
+            share /= len(values)
+            # Below the top the value at `position` is still being explored
+            explored += share * (position + 1 if level == top else position)
+        return explored
+
+    def snapshot(self):
+        """
+        Returns where the search is, as a few bytes per decision (see the module notes).
+
+        Returns:
+            bytes: A typecode byte, a byte for the state of the search (running, solved
+            or exhausted), then the variable and position + 1 of every level.
+        """
+        numbers = []
+        for var, position in zip(self._variables, self._positions):
+            numbers += (var, position + 1)
+        if not self.done:
+            state = _RUNNING
+        else:
+            state = _EXHAUSTED if self.solution is None else _SOLVED
+        typecode = "B" if max(numbers, default=0) < 256 else "I"
+        return typecode.encode() + bytes([state]) + array(typecode, numbers).tobytes()
+
+    @staticmethod
+    def _decode(snapshot):
+        if len(snapshot) < 2:
+            raise ValueError("Invalid snapshot")
+        typecode, state = chr(snapshot[0]), snapshot[1]
+        if typecode not in "BI" or state > _EXHAUSTED or (len(snapshot) - 2) % (2 * array(typecode).itemsize):
+            raise ValueError("Invalid snapshot")
+        numbers = array(typecode)
+        numbers.frombytes(snapshot[2:])
+        return state, [(numbers[i], numbers[i + 1] - 1) for i in range(0, len(numbers), 2)]
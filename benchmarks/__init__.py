@@ -0,0 +1,11 @@
+# benchmarks
+#
+# Benchmark harness and bundled corpora for the Sudoku, N-Queens and chess modules.
+#
+# Usage:
+#   python -m benchmarks.run --output results.json --baseline benchmarks/baseline.json
+#   python -m benchmarks.make_corpora
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
@@ -0,0 +1,133 @@
+# benchmarks/import_time.py
+#
+# Import-time benchmark for the web app, i.e. the cold start of a worker.
+#
+# Every run imports `app` in a fresh interpreter under `python -X importtime`
+# and reads back the time of each module. The harness keeps the fastest of
+# `--repeat` runs and reports the total, the share spent in this repository's
+# own modules (the rest is Flask and the standard library) and the slowest of
+# those modules. It exits with status 1 if the total or the own share is over
+# its budget, or if a module that should only load on first use (NumPy, the
+# solvers, the job manager, the chess modules) was imported.
+#
+# Most of the total is Flask and the standard library, whose import time varies
+# a lot between machines, so the default total budget is loose; the own share
+# and the list of lazy modules are what catch a regression in this repository.
+#
+# Usage:
+#   python -m benchmarks.import_time
+#   python -m benchmarks.import_time --budget-ms 250 --repeat 10
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import argparse
+import os
+import subprocess
+import sys
+
+__all__ = ["OWN_PACKAGES", "LAZY_MODULES", "measure", "check", "main"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Top-level modules and packages of this repository
+OWN_PACKAGES = ("app", "backtracking", "chess", "jobs", "metrics", "sudoku")
+
+# Modules that importing the app must not load; the routes import them on first use
+LAZY_MODULES = ("numpy", "backtracking", "chess", "jobs", "sudoku")
+
+
+def _is_own(module):
+    return module.split(".")[0] in OWN_PACKAGES
+
+
+def measure(module="app"):
+    """
+    Imports a module in a fresh interpreter and times every import.
+
+    Parameters:
+        module (str): The module to import.
+
+    Returns:
+        dict: `total_ms` (the import of `module`, everything included), `own_ms` (the
+        time spent in this repository's modules themselves) and `modules` (the self
+        time in ms of every module imported, by name).
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+    modules, total = {}, None
+    for line in result.stderr.splitlines():
+        # import time: <self us> | <cumulative us> | <indented module name>
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        modules[name] = int(own) / 1000
+        if name == module:
+            total = int(cumulative) / 1000
+    if total is None:
+        raise RuntimeError(f"No import time reported for {module!r}")
+
+    return {
+        "total_ms": total,
+        "own_ms": sum(ms for name, ms in modules.items() if _is_own(name)),
+        "modules": modules,
+    }
+
+
+def check(result, budget_ms, own_budget_ms):
+    """
+    Lists the ways an import-time result breaks its budgets.
+
+    Returns:
+        list: One message per problem (empty if there is none).
+    """
+    problems = []
+    if result["total_ms"] > budget_ms:
+        problems.append(f"importing the app took {result['total_ms']:.1f} ms (budget {budget_ms:.0f} ms)")
+    if result["own_ms"] > own_budget_ms:
+        problems.append(f"the app's own modules took {result['own_ms']:.1f} ms (budget {own_budget_ms:.0f} ms)")
+    for name in LAZY_MODULES:
+        if name in result["modules"]:
+            problems.append(f"{name} was imported, but should only load on first use")
+    return problems
+
+
+def main(argv=None):
+    """
+    Runs the check from the command line.
+
+    Returns:
+        int: The exit status, 1 if a budget is broken and 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Check the import time of the web app.")
+    parser.add_argument("--module", default="app", help="module to import (default: app)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters to run, the best is kept (default: 5)")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="budget for the whole import (default: 1000)")
+    parser.add_argument("--own-budget-ms", type=float, default=50.0, help="budget for this repository's modules (default: 50)")
+    parser.add_argument("--top", type=int, default=10, help="number of the slowest own modules to list (default: 10)")
+    args = parser.parse_args(argv)
+
+    result = min((measure(args.module) for _ in range(max(args.repeat, 1))), key=lambda r: r["total_ms"])
+
+    print(f"import {args.module}: {result['total_ms']:.1f} ms, of which {result['own_ms']:.1f} ms in this repository")
+    own = sorted(((ms, name) for name, ms in result["modules"].items() if _is_own(name)), reverse=True)
+    for ms, name in own[:args.top]:
+        print(f"  {name:<24} {ms:7.2f} ms")
+
+    problems = check(result, args.budget_ms, args.own_budget_ms)
+    for problem in problems:
+        print(f"OVER BUDGET: {problem}")
+    if problems:
+        return 1
+    print(f"Within budget ({args.budget_ms:.0f} ms, {args.own_budget_ms:.0f} ms own).")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# benchmarks/make_corpora.py
+#
+# Rebuilds the bundled benchmark corpora from fixed seeds.
+#
+# The easy and hard Sudoku lists come from the puzzle generator, the unsolvable
+# grids are hard puzzles with one extra clue that clashes with no other clue
+# but leaves no solution, and the "hardest" list is a fixed selection of
+# well-known hard puzzles (Inkala's puzzles and the hardest of Norvig's
+# collection). Every puzzle is checked before it is written. The N-Queens and
+# knight's tour corpora are lists of board sizes.
+#
+# Usage:
+#   python -m benchmarks.make_corpora
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import os
+import random
+
+from sudoku.generator import PuzzleGenerator
+from sudoku.model import SudokuBoard
+
+CORPORA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+
+HARDEST = (
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+    "1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3..",
+    "85...24..72......9..4.........1.7..23.5...9...4...........8..7..17..........36.4.",
+    "..53.....8......2..7..1.5..4....53...1..7...6..32...8..6.5....9..4....3......97..",
+    "12..4......5.69.1...9...5.........7.7...52.9..3......2.9.6...5.4..9..8.1..3...9.4",
+    "...57..3.1......2.7...234......8...4..7..4...49....6.5.42...3.....7..9....18.....",
+    "7..1523........92....3.....1....47.8.......6............9...5.6.4.9.7...8....6.1.",
+    "1...34.8....8..5....4.6..21.18......3..1.2..6......81.52..7.9....6..9....9.64...2",
+    "...92......68.3...19..7...623..4.1....1...7....8.3..297...8..91...5.72......64...",
+    ".6.5.4.3.1...9...8.........9...5...6.4.6.2.7.7...4...5.........4...8...1.5.2.3.4.",
+    "7.....4...2..7..8...3..8.799..5..3...6..2..9...1.97..6...3..9...3..4..6...9..1.35",
+    "....7..2.8.......6.1.2.5...9.54....8.........3....85.1...3.2.8.4.......9.7..6....",
+)
+
+# Board sizes of the N-Queens benchmarks: complete search, and local search on large boards
+QUEENS = tuple(range(4, 13))
+LARGE_QUEENS = (8, 100, 1000, 5000, 20000)
+
+# Board sizes (rows, cols) of the knight's tour benchmarks; closed tours need an even number of squares
+OPEN_TOURS = ((3, 4), (5, 5), (5, 6), (6, 8), (7, 7), (8, 8), (10, 10), (12, 12), (16, 16))
+CLOSED_TOURS = ((6, 6), (6, 8), (8, 8), (8, 10), (10, 10), (12, 12), (16, 16), (20, 20))
+
+
+def _write(name, lines):
+    path = os.path.join(CORPORA, name)
+    with open(path, "w") as f:
+        f.writelines(f"{line}\n" for line in lines)
+    print(f"{path}: {len(lines)} entries")
+
+
+def _unsolvable(puzzles, count, seed):
+    """
+    Adds to hard puzzles one clue that clashes with no clue but leaves no solution.
+    """
+    rng = random.Random(seed)
+    grids = []
+    for puzzle in puzzles:
+        board = SudokuBoard.from_string(puzzle)
+        empty = [idx for idx, num in enumerate(bytes(board)) if num == 0]
+        rng.shuffle(empty)
+        for idx in empty:
+            row, col = divmod(idx, 9)
+            nums = [num for num in range(1, 10) if board.is_valid(num, (row, col))]
+            rng.shuffle(nums)
+            for num in nums:
+                board.row(row)[col] = num
+                if board.count_solutions(limit=1) == 0:
+                    grids.append(board.to_string("."))
+                    break
+                board.row(row)[col] = 0
+            else:
+                continue
+            break
+        if len(grids) == count:
+            break
+    return grids
+
+
+def main():
+    easy = [p.to_string(".") for p, _ in PuzzleGenerator(difficulty="easy", seed=2026).generate(50)]
+    hard = [p.to_string(".") for p, _ in PuzzleGenerator(difficulty="hard", seed=2027).generate(50)]
+    for puzzle in easy + hard + list(HARDEST):
+        if not SudokuBoard.from_string(puzzle).has_unique_solution():
+            raise RuntimeError(f"Not a proper puzzle: {puzzle}")
+
+    _write("sudoku_easy.txt", easy)
+    _write("sudoku_hard.txt", hard)
+    _write("sudoku_hardest.txt", HARDEST)
+    _write("sudoku_unsolvable.txt", _unsolvable(hard, 20, seed=2028))
+    _write("nqueens.txt", [str(n) for n in QUEENS])
+    _write("nqueens_large.txt", [str(n) for n in LARGE_QUEENS])
+    _write("knights_open.txt", [f"{rows} {cols}" for rows, cols in OPEN_TOURS])
+    _write("knights_closed.txt", [f"{rows} {cols}" for rows, cols in CLOSED_TOURS])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+# benchmarks/run.py
+#
+# Benchmark harness for the Sudoku, N-Queens and knight's tour solvers.
+#
+# Every suite is a bundled corpus (see `corpora/`) solved by several engines,
+# side by side. For each suite and engine the harness records the wall time
+# (best of `--repeat` runs of the whole corpus), the search nodes and nodes per
+# second, and, in a separate run under `tracemalloc`, the peak memory of a
+# solve, the memory it leaves allocated and the number of memory blocks it
+# leaves allocated (the change of `sys.getallocatedblocks()`; CPython counts
+# the blocks in use, not every allocation made).
+#
+# Results are written as JSON. Given a stored baseline, the harness exits with
+# status 1 when a result needs more nodes or more peak memory than the baseline
+# by more than `--threshold`, and with `--compare-time` also when it is slower.
+# Node counts and memory are the same on every machine, but timings are not:
+# compare times only with a baseline saved on the same machine, after
+# regenerating it there with `--save-baseline` on a clean tree.
+#
+# Usage:
+#   python -m benchmarks.run
+#   python -m benchmarks.run --output results.json --baseline benchmarks/baseline.json
+#   python -m benchmarks.run --save-baseline /tmp/baseline.json  # on a clean checkout
+#   python -m benchmarks.run --baseline /tmp/baseline.json --compare-time
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from backtracking.stats import SearchStats
+from chess.knights_tour import find_tour, is_tour
+from chess.min_conflicts import min_conflicts, verify_queens
+from chess.n_queens import count_completions, first_solution, solve_n_queens
+from sudoku.model import SudokuBoard
+
+__all__ = ["SUITES", "METRICS", "TIME_METRICS", "load_corpus", "run_case", "run", "compare", "main"]
+
+CORPORA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+
+
+def _sudoku(**options):
+    def solve(puzzle):
+        board = SudokuBoard.from_string(puzzle)
+        solved = board.solve(**options)
+        return solved and board.is_solved(), board.stats.nodes
+    return solve
+
+
+def _queens_numpy(n):
+    stats = SearchStats()
+    return solve_n_queens(np.zeros((n, n)), 0, stats), stats.nodes
+
+
+def _queens_bitboard(n):
+    stats = SearchStats()
+    return first_solution(n, stats=stats) is not None, stats.nodes
+
+
+def _queens_count(n):
+    return count_completions(n) > 0, None
+
+
+def _queens_min_conflicts(n):
+    return verify_queens(min_conflicts(n, seed=0)), None
+
+
+def _knights(closed, **options):
+    def solve(size):
+        rows, cols = size
+        tour = find_tour(rows, cols, closed=closed, seed=0, **options)
+        return tour is not None and is_tour(tour, rows, cols, closed), None
+    return solve
+
+
+def _size(line):
+    # "rows cols" -> (rows, cols)
+    rows, cols = map(int, line.split())
+    return rows, cols
+
+
+SUDOKU_ENGINES = {
+    "backtrack": _sudoku(),
+    "backtrack-nopropagate": _sudoku(propagate=False),
+    "dlx": _sudoku(engine="dlx"),
+}
+
+QUEENS_ENGINES = {
+    "numpy": _queens_numpy,
+    "bitboard": _queens_bitboard,
+    "count-all": _queens_count,
+}
+
+LARGE_QUEENS_ENGINES = {
+    "min-conflicts": _queens_min_conflicts,
+}
+
+# Warnsdorff's rule with random retries, and the backtracking search alone
+# (`attempts=0`), which only finds open tours within its budget
+OPEN_TOUR_ENGINES = {
+    "warnsdorff": _knights(closed=False),
+    "backtrack": _knights(closed=False, attempts=0),
+}
+
+CLOSED_TOUR_ENGINES = {
+    "warnsdorff": _knights(closed=True),
+}
+
+# Suite name -> (corpus file, item parser, expected result of every solve, engines)
+SUITES = {
+    "sudoku_easy": ("sudoku_easy.txt", str, True, SUDOKU_ENGINES),
+    "sudoku_hard": ("sudoku_hard.txt", str, True, SUDOKU_ENGINES),
+    "sudoku_hardest": ("sudoku_hardest.txt", str, True, SUDOKU_ENGINES),
+    "sudoku_unsolvable": ("sudoku_unsolvable.txt", str, False, SUDOKU_ENGINES),
+    "nqueens": ("nqueens.txt", int, True, QUEENS_ENGINES),
+    "nqueens_large": ("nqueens_large.txt", int, True, LARGE_QUEENS_ENGINES),
+    "knights_open": ("knights_open.txt", _size, True, OPEN_TOUR_ENGINES),
+    "knights_closed": ("knights_closed.txt", _size, True, CLOSED_TOUR_ENGINES),
+}
+
+# Metrics compared against the baseline; larger is worse for all of them. The
+# time is machine-specific, so it is only compared on request
+METRICS = ("nodes", "peak_kib")
+TIME_METRICS = ("mean_ms",)
+
+
+def load_corpus(name, parse=str):
+    """
+    Reads a corpus file, one item per line (blank lines and '#' comments are skipped).
+
+    Returns:
+        list: The parsed items.
+    """
+    with open(os.path.join(CORPORA, name)) as f:
+        return [parse(line.strip()) for line in f if line.strip() and not line.startswith("#")]
+
+
+def run_case(solve, items, expected, repeat=3):
+    """
+    Benchmarks one engine on one corpus.
+
+    Parameters:
+        solve (callable): `solve(item) -> (result, nodes)`, with `nodes` None if not counted.
+        items (list): The corpus.
+        expected (bool): The result every solve must return.
+        repeat (int): Number of timed runs over the corpus; the fastest one is kept.
+
+    Returns:
+        dict: The measurements (see the module notes).
+    """
+    wall = float("inf")
+    for _ in range(repeat):
+        counts = []
+        start = time.perf_counter()
+        for item in items:
+            result, count = solve(item)
+            if result != expected:
+                raise RuntimeError(f"Wrong result {result!r} for {item!r}")
+            counts.append(count)
+        wall = min(wall, time.perf_counter() - start)
+    nodes = None if None in counts else sum(counts)
+
+    # Memory is measured apart from the timing, since tracing slows every allocation
+    peak = retained = blocks = 0
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        for item in items:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            blocks_before = sys.getallocatedblocks()
+            solve(item)
+            blocks += sys.getallocatedblocks() - blocks_before
+            current, top = tracemalloc.get_traced_memory()
+            peak = max(peak, top - before)
+            retained += current - before
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return {
+        "items": len(items),
+        "wall_s": wall,
+        "mean_ms": 1000 * wall / len(items),
+        "nodes": nodes,
+        "nodes_per_s": nodes / wall if nodes is not None and wall else None,
+        "peak_kib": peak / 1024,
+        "retained_kib": retained / 1024 / len(items),
+        "retained_blocks": blocks / len(items),
+    }
+
+
+def run(suites=None, engines=None, repeat=3, progress=None):
+    """
+    Runs the benchmark suites.
+
+    Parameters:
+        suites (list, optional): Names of the suites to run, defaults to all of `SUITES`.
+        engines (list, optional): Names of the engines to run, defaults to all.
+        repeat (int): Number of timed runs per case.
+        progress (callable, optional): Called with every result as it is measured.
+
+    Returns:
+        dict: The machine description and the list of results.
+    """
+    results = []
+    for suite in suites or SUITES:
+        corpus, parse, expected, suite_engines = SUITES[suite]
+        items = load_corpus(corpus, parse)
+        for engine, solve in suite_engines.items():
+            if engines and engine not in engines:
+                continue
+            result = {"suite": suite, "engine": engine}
+            result.update(run_case(solve, items, expected, repeat))
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=0.25, min_ms=0.05, metrics=METRICS):
+    """
+    Compares a report with a baseline report.
+
+    Parameters:
+        report (dict): The output of `run`.
+        baseline (dict): An earlier output of `run`.
+        threshold (float): Allowed relative increase of every metric, e.g. 0.25 for 25%.
+        min_ms (float): Time differences below this many milliseconds per solve are noise.
+        metrics (tuple): The metrics to compare, e.g. `METRICS + TIME_METRICS`.
+
+    Returns:
+        list: (suite, engine, metric, baseline value, new value) for every regression.
+    """
+    old = {(r["suite"], r["engine"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        base = old.get((result["suite"], result["engine"]))
+        if base is None:
+            continue
+        for metric in metrics:
+            before, after = base.get(metric), result.get(metric)
+            if before is None or after is None:
+                continue
+            if metric == "mean_ms" and after - before < min_ms:
+                continue
+            if after > before * (1 + threshold):
+                regressions.append((result["suite"], result["engine"], metric, before, after))
+    return regressions
+
+
+def _format(result):
+    nodes = "-" if result["nodes"] is None else f"{result['nodes']}"
+    rate = "-" if result["nodes_per_s"] is None else f"{result['nodes_per_s']:,.0f}"
+    return (
+        f"{result['suite']:<18} {result['engine']:<22} {result['items']:>5} "
+        f"{result['mean_ms']:>10.3f} {nodes:>9} {rate:>12} "
+        f"{result['peak_kib']:>10.1f} {result['retained_kib']:>9.1f} {result['retained_blocks']:>8.1f}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Sudoku, N-Queens and knight's tour solvers.")
+    parser.add_argument("--suites", nargs="+", choices=list(SUITES), help="suites to run (default: all)")
+    parser.add_argument("--engines", nargs="+", help="engines to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case, the best is kept (default: 3)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with this JSON file and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative regression (default: 0.25)")
+    parser.add_argument(
+        "--compare-time", action="store_true",
+        help="also fail on slower solves (only meaningful with a baseline saved on this machine)",
+    )
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'suite':<18} {'engine':<22} {'items':>5} {'ms/solve':>10} {'nodes':>9} "
+        f"{'nodes/s':>12} {'peak KiB':>10} {'retained':>9} {'blocks':>8}"
+    )
+    report = run(args.suites, args.engines, args.repeat, progress=lambda r: print(_format(r), flush=True))
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        metrics = METRICS + TIME_METRICS if args.compare_time else METRICS
+        regressions = compare(report, baseline, args.threshold, metrics=metrics)
+        for suite, engine, metric, before, after in regressions:
+            print(f"REGRESSION {suite}/{engine} {metric}: {before:.3f} -> {after:.3f}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions in {', '.join(metrics)} against {args.baseline} (threshold {args.threshold:.0%}).")
+
+
+if __name__ == '__main__':
+    main()
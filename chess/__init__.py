@@ -1,2 +1,44 @@
-from .chessboard import *
-from .boards import *
\ No newline at end of file
+# chess/__init__.py
+#
+# The chess package. Its names are imported from the submodules on first use
+# (PEP 562), so `import chess` is cheap and a worker that only needs, say,
+# the example boards never loads the FEN and packed formats.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import importlib
+
+# Submodule of every package-level name
+_EXPORTS = {
+    "ChessPiece": "chessboard",
+    "ChessBoard": "chessboard",
+    "SQUARE_NAMES": "chessboard",
+    "eight_queens_board": "boards",
+    "initial_chessboard": "boards",
+    "from_fen": "positions",
+    "to_fen": "positions",
+    "pack": "positions",
+    "unpack": "positions",
+    "write_positions": "positions",
+    "read_positions": "positions",
+    "PositionFile": "positions",
+    "PACKED_SIZE": "positions",
+    "INITIAL_FEN": "positions",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,10 +2,33 @@
 # Author: Indrajit Ghosh
 # Created On: Apr 28, 2024
 #
+# A board is a flat array of 64 signed bytes holding the piece values of
+# `ChessPiece.chess_pieces` (0 for an empty square), plus one 64-bit bitboard
+# per piece type. Squares are numbered `8 * row + col`, with row 0 the eighth
+# rank and col 0 the a-file, so a8 is square 0 and h1 is square 63; bit `i` of
+# a bitboard stands for square `i`.
+#
+
+from array import array
+
+__all__ = ["ChessPiece", "ChessBoard", "SQUARE_NAMES"]
+
+FILES = "abcdefgh"
+
+# Square names by square number, and the square number of every name
+SQUARE_NAMES = tuple(f"{file}{8 - row}" for row in range(8) for file in FILES)
+_SQUARE_INDEX = {name: idx for idx, name in enumerate(SQUARE_NAMES)}
+_SQUARE_INDEX.update({name.upper(): idx for name, idx in _SQUARE_INDEX.items()})
+_FILE_INDEX = {file: col for col, file in enumerate(FILES)}
+_FILE_INDEX.update({file.upper(): col for file, col in _FILE_INDEX.items()})
+
 
 class ChessPiece:
     """
     A class to represent a chess piece.
+
+    Pieces are immutable flyweights: `ChessPiece('white_queen')` always returns the
+    same shared instance.
     """
 
     chess_pieces = {
@@ -23,18 +46,49 @@ class ChessPiece:
         'white_king': {'symbol': '♔', 'color': 'white', 'value': 6},
     }
 
-    def __init__(self, name: str = 'white_king'):
+    __slots__ = ("_name", "_value", "_symbol", "_color")
+
+    _instances = {}
+
+    def __new__(cls, name: str = 'white_king'):
         """
-        Initialize a chess piece object.
-        
+        Return the chess piece object with the given name.
+
         Args:
             name (str): The name of the piece, defaults to 'white_king'.
         """
-        name = name.lower()
-        if name not in self.chess_pieces:
-            raise ValueError("Invalid piece name")
+        piece = cls._instances.get(name)
+        if piece is None:
+            key = name.lower()
+            if key not in cls.chess_pieces:
+                raise ValueError("Invalid piece name")
+            piece = cls._instances.get(key)
+            if piece is None:
+                data = cls.chess_pieces[key]
+                piece = super().__new__(cls)
+                piece._name = key
+                piece._value = data['value']
+                piece._symbol = data['symbol']
+                piece._color = data['color']
+                cls._instances[key] = piece
+            cls._instances[name] = piece
+        return piece
 
-        self._name = name
+    @classmethod
+    def from_value(cls, value: int):
+        """
+        Get the piece with the given value (see `chess_pieces`).
+
+        Args:
+            value (int): The value of the piece, from -6 to -1 or 1 to 6.
+
+        Returns:
+            ChessPiece: The piece with that value.
+        """
+        piece = _PIECES[value + 6] if -6 <= value <= 6 else None
+        if piece is None:
+            raise ValueError(f"Invalid piece value: {value}")
+        return piece
 
     @property
     def name(self):
@@ -44,47 +98,216 @@ class ChessPiece:
     @property
     def value(self):
         """Get the value of the piece."""
-        return self.chess_pieces[self._name]['value']
+        return self._value
 
     @property
     def symbol(self):
         """Get the symbol representing the piece."""
-        return self.chess_pieces[self._name]['symbol']
-    
+        return self._symbol
+
+    @property
+    def color(self):
+        """Get the color of the piece."""
+        return self._color
+
     def __str__(self):
         """Return a string representation of the piece."""
         return f"{self.symbol} ({self.name})"
 
+    def __repr__(self):
+        return f"ChessPiece({self._name!r})"
+
+    def __reduce__(self):
+        # Unpickle to the shared instance
+        return ChessPiece, (self._name,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+# Pieces and symbols by value + 6 (index 6 is the empty square)
+_PIECES = [None] * 13
+for _name, _data in ChessPiece.chess_pieces.items():
+    _PIECES[_data['value'] + 6] = ChessPiece(_name)
+_PIECES = tuple(_PIECES)
+_SYMBOLS = tuple(piece.symbol if piece else None for piece in _PIECES)
+
+
+class _BoardRow:
+    """
+    A row of a ChessBoard that reads and writes the board's squares.
+    """
+
+    __slots__ = ("_board", "_start")
+
+    def __init__(self, board, row):
+        self._board = board
+        self._start = 8 * row
+
+    def _index(self, col):
+        if not -8 <= col < 8:
+            raise IndexError("Chessboard row index out of range")
+        return self._start + col % 8
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return list(self)[col]
+        return _PIECES[self._board._squares[self._index(col)] + 6]
+
+    def __setitem__(self, col, piece):
+        if piece is not None and not isinstance(piece, ChessPiece):
+            raise TypeError("A square holds a ChessPiece or None")
+        self._board._put(self._index(col), piece.value if piece else 0)
+
+    def __len__(self):
+        return 8
+
+    def __iter__(self):
+        squares = self._board._squares
+        return (_PIECES[squares[idx] + 6] for idx in range(self._start, self._start + 8))
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _BoardView:
+    """
+    The rows of a ChessBoard, as returned by `ChessBoard.board`.
+    """
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return list(self)[row]
+        if not -8 <= row < 8:
+            raise IndexError("Chessboard index out of range")
+        return _BoardRow(self._board, row % 8)
+
+    def __setitem__(self, row, pieces):
+        target = self[row]
+        pieces = list(pieces)
+        if len(pieces) != 8:
+            raise ValueError("A row must have 8 squares")
+        for col, piece in enumerate(pieces):
+            target[col] = piece
+
+    def __len__(self):
+        return 8
+
+    def __iter__(self):
+        return (_BoardRow(self._board, row) for row in range(8))
+
+    def __eq__(self, other):
+        try:
+            return [list(row) for row in self] == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
 
 class ChessBoard:
     """
     A class to represent a chessboard.
 
     Attributes:
-        board (list): A 2D list representing the state of the chessboard.
+        board: The 8x8 rows of ChessPiece objects (None for an empty square), a view
+            that reads and writes the chessboard.
     """
 
+    __slots__ = ("_squares", "_bitboards")
+
     def __init__(self, data=None):
         """
         Initialize the chessboard with an 8x8 grid.
 
         Args:
-            board (list, optional): A 2D list representing the initial state of the chessboard. Defaults to None.
+            data (dict or list, optional): The pieces to place, either as a dict mapping
+                square names to pieces, e.g. {'a2': ChessPiece('white_pawn')}, or as a
+                2D list of ChessPiece objects (None for an empty square). Defaults to None.
         """
-        # `data` could be a `dict` or a `2D-list`
-        # If the `data` is a `dict` then it should be of the form
-        # {'a2': ChessPiece('white_pawn'), 'b4': ChessPiece('black_king')}
-        self.board = [[None for _ in range(8)] for _ in range(8)]
+        self._squares = array('b', bytes(64))
+        self._bitboards = [0] * 13
 
         if isinstance(data, dict):
-            # Add pieces to the self.board
+            # Add pieces to the board
             for square_name, piece in data.items():
-                row, col = self.square_name_to_indices(square_name)
-                self.board[row][col] = piece
+                self._put(self._square_index(square_name), piece.value if piece else 0)
 
-        elif isinstance(data, list):
+        elif isinstance(data, (list, _BoardView)):
             self.board = data
 
+    @classmethod
+    def _from_squares(cls, squares):
+        """
+        Create a ChessBoard from 64 piece values (an `array('b')`, taken over without copying).
+        """
+        board = cls.__new__(cls)
+        board._squares = squares
+        board._bitboards = bitboards = [0] * 13
+        for idx, value in enumerate(squares):
+            if value:
+                bitboards[value + 6] |= 1 << idx
+        return board
+
+    @staticmethod
+    def _square_index(square_name: str):
+        idx = _SQUARE_INDEX.get(square_name)
+        if idx is None:
+            raise ValueError("Invalid square name")
+        return idx
+
+    def _put(self, idx: int, value: int):
+        """
+        Put the piece with the given value (0 to empty it) on the square `idx`.
+        """
+        old = self._squares[idx]
+        if old:
+            self._bitboards[old + 6] &= ~(1 << idx)
+        self._squares[idx] = value
+        if value:
+            self._bitboards[value + 6] |= 1 << idx
+
+    @property
+    def board(self):
+        """
+        Get the board as 8x8 rows of ChessPiece objects (None for an empty square).
+
+        The rows are views of the chessboard, so `board.board[row][col] = piece`
+        changes the chessboard itself.
+        """
+        return _BoardView(self)
+
+    @board.setter
+    def board(self, data):
+        """
+        Set the board from an 8x8 list of ChessPiece objects (None for an empty square).
+        """
+        data = [list(pieces) for pieces in data]  # `data` may be a view of this board
+        self._squares = array('b', bytes(64))
+        self._bitboards = [0] * 13
+        for row, pieces in enumerate(data):
+            for col, piece in enumerate(pieces):
+                if piece is not None:
+                    self._put(8 * row + col, piece.value)
 
     def __str__(self):
         """Return a string representation of the chessboard."""
@@ -93,18 +316,64 @@ class ChessBoard:
             rank = 8 - row
             board_str += f"{rank}|"
             for col in range(8):
-                piece = self.board[row][col]
-                if piece is None:
+                symbol = _SYMBOLS[self._squares[8 * row + col] + 6]
+                if symbol is None:
                     board_str += " - "
                 else:
-                    board_str += f" {piece.symbol} "
+                    board_str += f" {symbol} "
             board_str += "\n"
 
         # Add bottom border and column labels
         board_str += "  -------------------------\n"
         board_str += "   a  b  c  d  e  f  g  h\n"
         return board_str
-   
+
+    def __eq__(self, other):
+        if not isinstance(other, ChessBoard):
+            return NotImplemented
+        return self._squares == other._squares
+
+    __hash__ = None
+
+    def __bytes__(self):
+        """Return the 64 piece values as signed bytes."""
+        return self._squares.tobytes()
+
+    def copy(self):
+        """
+        Return an independent copy of the board.
+        """
+        board = self.__class__.__new__(self.__class__)
+        board._squares = array('b', self._squares)
+        board._bitboards = self._bitboards[:]
+        return board
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def bitboard(self, piece):
+        """
+        Get the bitboard of a piece type.
+
+        Args:
+            piece (ChessPiece or str): The piece, or its name.
+
+        Returns:
+            int: A 64-bit integer with bit `8 * row + col` set for every square holding the piece.
+        """
+        if isinstance(piece, str):
+            piece = ChessPiece(piece)
+        return self._bitboards[piece.value + 6]
+
+    @property
+    def occupied(self):
+        """Get the bitboard of all occupied squares."""
+        occupied = 0
+        for bits in self._bitboards:
+            occupied |= bits
+        return occupied
 
     def set_square(self, file:str, rank:int, piece:ChessPiece):
         """
@@ -113,13 +382,14 @@ class ChessBoard:
         Args:
             file (str): The file of the chessboard (a-h).
             rank (int): The rank of the chessboard (1-8).
-            piece (ChessPiece): The chess piece object to be placed on the specified cell.
+            piece (ChessPiece): The chess piece object to be placed on the specified cell,
+                or None to empty it.
         """
-        files = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7}
-        row = 8 - rank
-        col = files[file.lower()]
+        col = _FILE_INDEX.get(file)
+        if col is None or not 1 <= rank <= 8:
+            raise ValueError("Invalid square")
 
-        self.board[row][col] = piece
+        self._put(8 * (8 - rank) + col, piece.value if piece else 0)
 
 
     def get_piece_at_square(self, square_name: str):
@@ -132,15 +402,10 @@ class ChessBoard:
         Returns:
             ChessPiece or None: The chess piece at the specified square, or None if the square is empty.
         """
-        files = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7}
-        
-        file_index = files.get(square_name[0].lower())
-        rank_index = 8 - int(square_name[1])
-        
-        if file_index is not None and 0 <= rank_index < 8:
-            return self.board[rank_index][file_index]
-        else:
+        idx = _SQUARE_INDEX.get(square_name)
+        if idx is None:
             return None
+        return _PIECES[self._squares[idx] + 6]
 
     @staticmethod
     def integer_to_square_name(row:int, col:int):
@@ -154,15 +419,11 @@ class ChessBoard:
         Returns:
             str: The square name in algebraic notation (e.g., 'a4', 'h5').
         """
-        files = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
         if row < 0 or row > 7 or col < 0 or col > 7:
             raise ValueError("Row and column indices must be between 0 and 7")
 
-        file = files[col]
-        rank = 8 - row
+        return SQUARE_NAMES[8 * row + col]
 
-        return file + str(rank)
-    
     @staticmethod
     def square_name_to_indices(square_name: str):
         """
@@ -174,16 +435,8 @@ class ChessBoard:
         Returns:
             tuple: A tuple containing the row index and column index, both ranging from 0 to 7.
         """
-        files = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7}
+        return divmod(ChessBoard._square_index(square_name), 8)
 
-        file_index = files.get(square_name[0].lower())
-        rank_index = 8 - int(square_name[1])
-
-        if file_index is not None and 0 <= rank_index < 8:
-            return rank_index, file_index
-        else:
-            raise ValueError("Invalid square name")
-        
 
     def get_board_string_representation(self):
         """
@@ -193,37 +446,47 @@ class ChessBoard:
             list: A 2D list representing the current board state, with each element being the symbol
             of the piece or None if the square is empty.
         """
-        board_data = [[None for _ in range(8)] for _ in range(8)]
-
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
+        symbols, squares = _SYMBOLS, self._squares
+        return [[symbols[squares[idx] + 6] for idx in range(row, row + 8)] for row in range(0, 64, 8)]
 
-                if piece:
-                    board_data[row][col] = piece.symbol
 
-        return board_data
-
-    
     def get_integer_board(self):
         """
         Get the integer representation of the current board state.
 
         Returns:
-            list: A 2D list representing the current board state, with each element being 
+            list: A 2D list representing the current board state, with each element being
             the value of the piece or 0 if the square is empty.
         """
-        board_data = [[0 for _ in range(8)] for _ in range(8)]
+        squares = self._squares
+        return [squares[row:row + 8].tolist() for row in range(0, 64, 8)]
 
-        for row in range(8):
-            for col in range(8):
-                piece = self.board[row][col]
 
-                if piece:
-                    board_data[row][col] = piece.value
+    @classmethod
+    def from_fen(cls, fen: str):
+        """
+        Create a ChessBoard instance from a FEN string (see `chess.positions.from_fen`).
+
+        Args:
+            fen (str): A full FEN record, or just its piece placement field.
+
+        Returns:
+            ChessBoard: A ChessBoard instance with the pieces of the position.
+        """
+        from .positions import from_fen
+
+        return from_fen(fen)
+
+    def to_fen(self, **fields):
+        """
+        Get the FEN string of the board (see `chess.positions.to_fen` for the other fields).
+
+        Returns:
+            str: The FEN record of the position, white to move by default.
+        """
+        from .positions import to_fen
 
-        return board_data
-    
+        return to_fen(self, **fields)
 
     @classmethod
     def from_list(cls, board_data):
@@ -240,15 +503,10 @@ class ChessBoard:
         if len(board_data) != 8 or any(len(row) != 8 for row in board_data):
             raise ValueError("Invalid board dimensions. Board must be 8x8.")
 
-        board = cls()  # Initialize an empty board
-        for row_index, row in enumerate(board_data):
-            for col_index, piece_value in enumerate(row):
-                if piece_value != 0:  # Skip empty squares
-                    # Map piece values to ChessPiece names
-                    piece_name = next(name for name, data in ChessPiece.chess_pieces.items() if data['value'] == piece_value)
-                    piece = ChessPiece(name=piece_name)
-                    board.set_square(chr(ord('a') + col_index), 8 - row_index, piece)
-
-        return board
-
+        values = [value for row in board_data for value in row]
+        for value in values:
+            if not -6 <= value <= 6:
+                raise ValueError(f"Invalid piece value: {value}")
+        squares = array('b', values)
 
+        return cls._from_squares(squares)
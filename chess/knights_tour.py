@@ -0,0 +1,302 @@
+# chess/knights_tour.py
+#
+# Knight's Tour on an m x n board.
+#
+# A tour visits every square exactly once with knight moves; a closed tour also
+# ends a knight move away from where it started. The moves of every square are
+# computed once per board size. Tours are found with Warnsdorff's rule -- move
+# to the square with the fewest onward moves -- breaking ties in favour of the
+# square farthest from the centre of the board, which keeps the rule working on
+# boards several hundred squares wide.
+#
+# Such tours end near the centre. A closed tour is therefore grown from a
+# central square, with the neighbours of that square left for last, and its end
+# is then walked next to the start with Posa rotations: if the last square is a
+# knight move away from the i-th one, reversing the path after the i-th square
+# gives a tour ending elsewhere. The cycle is finally rotated to begin on the
+# requested square.
+#
+# Boards that the known theorems rule out (Schwenk's for closed tours, Conrad
+# et al.'s for open ones, and colour parity) get None at once. Otherwise, if a
+# few greedy runs (with random tie-breaking after the first) do not produce a
+# tour, a backtracking search in Warnsdorff order (on the generic engine of
+# `backtracking.engine`) takes over, within a node budget that grows with the
+# board.
+#
+# Squares are numbered `row * cols + col`; tours are lists of (row, col) pairs.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import random
+
+from backtracking import SearchAborted, search
+
+__all__ = ["knight_moves", "find_tour", "is_tour", "tour_to_board"]
+
+KNIGHT_STEPS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+
+_TABLES = {}
+
+# Default move budget of the backtracking fallback, per square of the board
+NODES_PER_SQUARE = 12500
+MAX_NODES = 1000000
+
+
+def knight_moves(rows, cols):
+    """
+    Returns (once per board size) the squares a knight reaches from every square.
+
+    Returns:
+        tuple: For every square `row * cols + col`, a tuple of the squares one knight move away.
+    """
+    if (rows, cols) not in _TABLES:
+        table = []
+        for row in range(rows):
+            for col in range(cols):
+                table.append(tuple(
+                    (row + dr) * cols + col + dc
+                    for dr, dc in KNIGHT_STEPS
+                    if 0 <= row + dr < rows and 0 <= col + dc < cols
+                ))
+        _TABLES[rows, cols] = tuple(table)
+    return _TABLES[rows, cols]
+
+
+def _centre_distances(rows, cols):
+    # Twice the offsets from the centre keep the distances integral
+    return [
+        (2 * row - rows + 1) ** 2 + (2 * col - cols + 1) ** 2
+        for row in range(rows)
+        for col in range(cols)
+    ]
+
+
+def _warnsdorff(table, start, far, rand=None, closed=False):
+    """
+    Follows Warnsdorff's rule from `start` until the knight gets stuck.
+
+    With `closed`, the start square still counts as free for its neighbours, so
+    they are visited late and the tour is more likely to end next to it.
+
+    Returns:
+        list: The squares visited, in order.
+    """
+    degree = [len(moves) for moves in table]
+    visited = bytearray(len(table))
+    path = [start]
+    visited[start] = 1
+    square = start
+    while True:
+        best = None
+        keep = closed and square == start
+        for nxt in table[square]:
+            if not visited[nxt]:
+                if not keep:
+                    degree[nxt] -= 1
+                key = (degree[nxt], -far[nxt], rand() if rand else 0)
+                if best is None or key < best_key:
+                    best, best_key = nxt, key
+        if best is None:
+            return path
+        visited[best] = 1
+        path.append(best)
+        square = best
+
+
+def _close(path, table, rand, max_rotations):
+    """
+    Turns a tour into a closed one, in place, with Posa rotations.
+
+    Returns:
+        bool: True if the last square of `path` is now a knight move away from the first.
+    """
+    size = len(path)
+    ends = set(table[path[0]])
+    where = [0] * size
+    for i, square in enumerate(path):
+        where[square] = i
+
+    for _ in range(max_rotations):
+        if path[-1] in ends:
+            return True
+        pivots = [where[nxt] for nxt in table[path[-1]] if where[nxt] < size - 2]
+        if not pivots:
+            return False
+        i = pivots[int(rand() * len(pivots))]
+        path[i + 1:] = path[:i:-1]
+        for j in range(i + 1, size):
+            where[path[j]] = j
+    return path[-1] in ends
+
+
+class _TourProblem:
+    """
+    A knight's tour for the generic backtracking engine: the variables are the
+    move numbers and the values the unvisited squares a knight move away from the
+    last one, fewest onward moves first (Warnsdorff order).
+    """
+
+    __slots__ = ("table", "path", "closed", "ends", "degree", "visited")
+
+    def __init__(self, table, start, closed):
+        self.table = table
+        self.path = []
+        self.closed = closed
+        self.ends = set(table[start]) if closed else None
+        self.degree = [len(moves) for moves in table]
+        self.visited = bytearray(len(table))
+        self.assign(0, start)
+
+    def select(self):
+        path = self.path
+        if len(path) == len(self.table) and (not self.closed or path[-1] in self.ends):
+            return None
+        return len(path)
+
+    def order(self, step):
+        degree, visited = self.degree, self.visited
+        # Fewest onward moves first; ties go to the later moves of the table
+        candidates = [nxt for nxt in reversed(self.table[self.path[-1]]) if not visited[nxt]]
+        return sorted(candidates, key=degree.__getitem__)
+
+    def assign(self, step, square):
+        self.visited[square] = 1
+        for nxt in self.table[square]:
+            self.degree[nxt] -= 1
+        self.path.append(square)
+        return True
+
+    def undo(self, step, square):
+        self.path.pop()
+        self.visited[square] = 0
+        for nxt in self.table[square]:
+            self.degree[nxt] += 1
+
+    def solution(self):
+        return list(self.path)
+
+
+def _has_no_tour(rows, cols, start, closed):
+    """
+    Tells whether a theorem rules out a (closed) tour of the board from `start`.
+    """
+    m, n = sorted((rows, cols))
+    if m * n == 1:
+        return closed
+    if closed:
+        # Schwenk: a closed tour exists unless both sides are odd, the shorter is 1, 2 or 4,
+        # or the board is 3 x 4, 3 x 6 or 3 x 8
+        return (m % 2 and n % 2) or m in (1, 2, 4) or (m == 3 and n in (4, 6, 8))
+    # Conrad et al.: an open tour exists unless the shorter side is 1 or 2, or the board
+    # is 3 x 3, 3 x 5, 3 x 6 or 4 x 4
+    if m in (1, 2) or (m == 3 and n in (3, 5, 6)) or (m == 4 and n == 4):
+        return True
+    # A knight alternates colours, so on a board with an odd number of squares a tour
+    # starts (and ends) on the colour with one square more
+    return bool(m * n % 2 and sum(start) % 2)
+
+
+def _backtrack(table, start, closed, max_nodes):
+    """
+    Searches for a tour from `start` with the backtracking engine, trying moves in Warnsdorff order.
+
+    Returns:
+        list or None: The squares of the tour, or None if none was found within `max_nodes` moves.
+    """
+    try:
+        return search(_TourProblem(table, start, closed), max_nodes=max_nodes)
+    except SearchAborted:
+        return None
+
+
+def find_tour(rows=8, cols=None, start=(0, 0), closed=False, attempts=8, max_rotations=5000, max_nodes=None, seed=None):
+    """
+    Finds a knight's tour of an m x n board.
+
+    Parameters:
+        rows (int): Number of rows of the board.
+        cols (int, optional): Number of columns, defaults to `rows`.
+        start (tuple): The (row, col) square the tour starts from.
+        closed (bool): Whether the last square must be a knight move away from the first.
+        attempts (int): Number of Warnsdorff runs before falling back to backtracking.
+        max_rotations (int): Posa rotations tried per run to close a tour.
+        max_nodes (int, optional): Move budget of the backtracking fallback; by default
+            `NODES_PER_SQUARE` per square of the board, at most `MAX_NODES`.
+        seed (optional): Seed of the random tie-breaking of the retries.
+
+    Returns:
+        list or None: The (row, col) squares of the tour in order, or None if no tour was found.
+    """
+    cols = rows if cols is None else cols
+    if not (0 <= start[0] < rows and 0 <= start[1] < cols):
+        raise ValueError("The start square is off the board")
+
+    if _has_no_tour(rows, cols, start, closed):
+        return None
+
+    table = knight_moves(rows, cols)
+    size = rows * cols
+    first = start[0] * cols + start[1]
+    far = _centre_distances(rows, cols)
+    if max_nodes is None:
+        max_nodes = min(NODES_PER_SQUARE * size, MAX_NODES)
+
+    rand = random.Random(seed).random
+    centre = (rows // 2) * cols + cols // 2
+    for attempt in range(attempts):
+        if not closed:
+            path = _warnsdorff(table, first, far, rand if attempt else None)
+            if len(path) == size:
+                break
+            continue
+
+        path = _warnsdorff(table, centre, far, rand if attempt else None, closed=True)
+        if len(path) == size and _close(path, table, rand, max_rotations):
+            k = path.index(first)
+            path = path[k:] + path[:k]
+            break
+    else:
+        path = _backtrack(table, first, closed, max_nodes)
+        if path is None:
+            return None
+
+    return [divmod(square, cols) for square in path]
+
+
+def is_tour(tour, rows=8, cols=None, closed=False):
+    """
+    Checks that `tour` visits every square of the board once with knight moves.
+
+    Parameters:
+        tour (list): The (row, col) squares in order.
+        rows (int): Number of rows of the board.
+        cols (int, optional): Number of columns, defaults to `rows`.
+        closed (bool): Also require the last square to be a knight move away from the first.
+
+    Returns:
+        bool: True if `tour` is a (closed) knight's tour.
+    """
+    cols = rows if cols is None else cols
+    if len(tour) != rows * cols or len(set(tour)) != len(tour):
+        return False
+    if any(not (0 <= r < rows and 0 <= c < cols) for r, c in tour):
+        return False
+
+    steps = list(zip(tour, tour[1:] + tour[:1] if closed and len(tour) > 1 else tour[1:]))
+    return all(sorted((abs(r1 - r2), abs(c1 - c2))) == [1, 2] for (r1, c1), (r2, c2) in steps)
+
+
+def tour_to_board(tour, rows=8, cols=None):
+    """
+    Numbers the squares of a board in the order the tour visits them.
+
+    Returns:
+        list: A rows x cols list with the move number (1 for the start) on every square.
+    """
+    cols = rows if cols is None else cols
+    board = [[0] * cols for _ in range(rows)]
+    for number, (row, col) in enumerate(tour, 1):
+        board[row][col] = number
+    return board
@@ -0,0 +1,160 @@
+# chess/min_conflicts.py
+#
+# Local search for very large N-Queens boards.
+#
+# Backtracking cannot place queens on boards with thousands or millions of
+# columns, but a random permutation repaired by swapping queens can. The
+# solver follows the QS4 algorithm of Sosic and Gu: a permutation already keeps
+# every row and column to one queen, so only diagonals can collide. Queens are
+# first placed greedily, column by column, by swapping in a random remaining row
+# until the queen lands on two free diagonals; only the last few columns are
+# filled at random. A repair phase then swaps attacked queens with random ones
+# whenever that lowers the number of attacks.
+#
+# The queens and the number of queens on every diagonal live in `array('i')`
+# buffers -- about 20 bytes per column -- which the repair phase scans for
+# attacked queens through NumPy without copying.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import random
+from array import array
+
+import numpy as np
+
+__all__ = ["min_conflicts", "verify_queens"]
+
+
+def _random_columns(n):
+    """
+    Returns how many of the last columns QS4 fills at random instead of greedily.
+    """
+    for limit, count in ((10, 8), (100, 30), (10000, 50), (100000, 80)):
+        if n <= limit:
+            return min(count, n)
+    return 100
+
+
+def _attempt(n, rand, max_passes):
+    """
+    Runs one greedy placement and repair; returns the queens or None if the repair stalls.
+    """
+    queens = array("i", range(n))
+    up = array("i", [0]) * (2 * n - 1)  # queens on every diagonal col + row
+    down = array("i", [0]) * (2 * n - 1)  # queens on every diagonal col - row + n - 1
+    last = n - 1
+    greedy = n - _random_columns(n)
+
+    # Greedy placement: swap in random rows until the queen of column `col` is unattacked
+    for col in range(greedy):
+        span = n - col
+        for _ in range(4 * span):
+            other = col + int(rand() * span)
+            row = queens[other]
+            if not up[col + row] and not down[col - row + last]:
+                break
+        queens[col], queens[other] = row, queens[col]
+        up[col + row] += 1
+        down[col - row + last] += 1
+
+    # The last columns take random rows among the remaining ones
+    for col in range(greedy, n):
+        other = col + int(rand() * (n - col))
+        row = queens[other]
+        queens[col], queens[other] = row, queens[col]
+        up[col + row] += 1
+        down[col - row + last] += 1
+
+    def attacks(col):
+        row = queens[col]
+        return up[col + row] + down[col - row + last] - 2
+
+    def move(col, row, step):
+        up[col + row] += step
+        down[col - row + last] += step
+
+    cols = np.arange(n)
+    for _ in range(max_passes):
+        # Find the attacked queens with NumPy, straight from the arrays
+        rows = np.frombuffer(queens, dtype=np.intc)
+        attacked = np.flatnonzero(
+            (np.frombuffer(up, dtype=np.intc)[cols + rows] > 1)
+            | (np.frombuffer(down, dtype=np.intc)[cols - rows + last] > 1)
+        )
+        if not attacked.size:
+            return queens
+
+        for col in attacked.tolist():
+            for _ in range(16):
+                if not attacks(col):
+                    break
+                other = int(rand() * n)
+                if other == col:
+                    continue
+                row, other_row = queens[col], queens[other]
+                before = attacks(col) + attacks(other)
+                move(col, row, -1)
+                move(other, other_row, -1)
+                move(col, other_row, 1)
+                move(other, row, 1)
+                queens[col], queens[other] = other_row, row
+                if attacks(col) + attacks(other) >= before:
+                    # Not an improvement, swap back
+                    move(col, other_row, -1)
+                    move(other, row, -1)
+                    move(col, row, 1)
+                    move(other, other_row, 1)
+                    queens[col], queens[other] = row, other_row
+
+    return None
+
+
+def min_conflicts(n, seed=None, max_passes=100, max_restarts=100):
+    """
+    Places n non-attacking queens on an n x n board by local search.
+
+    Parameters:
+        n (int): The size of the board; any n except 2 and 3, which have no solution.
+        seed (optional): Seed of the private random number generator, for reproducible output.
+        max_passes (int): Repair passes over the attacked queens before restarting.
+        max_restarts (int): Number of fresh placements tried before giving up.
+
+    Returns:
+        array.array: The row of the queen in every column (an `array('i')` permutation).
+    """
+    if n in (2, 3) or n < 1:
+        raise ValueError(f"The {n}-queens problem has no solution")
+
+    rand = random.Random(seed).random
+    for _ in range(max_restarts):
+        queens = _attempt(n, rand, max_passes)
+        if queens is not None:
+            return queens
+    raise RuntimeError(f"No placement of {n} queens found after {max_restarts} restarts")
+
+
+def verify_queens(queens):
+    """
+    Checks a placement of queens with vectorized NumPy operations.
+
+    Parameters:
+        queens (array_like): The row of the queen in every column.
+
+    Returns:
+        bool: True if the rows form a permutation and no two queens share a diagonal.
+    """
+    rows = np.asarray(queens, dtype=np.int64)
+    if rows.ndim != 1:
+        return False
+    n = len(rows)
+    if n and (rows.min() < 0 or rows.max() >= n):
+        return False
+
+    cols = np.arange(n)
+    return bool(
+        (np.bincount(rows, minlength=n) == 1).all()
+        and np.bincount(cols + rows).max(initial=0) <= 1
+        and np.bincount(cols - rows + n - 1).max(initial=0) <= 1
+    )
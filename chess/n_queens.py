@@ -11,7 +11,13 @@
 # Author: Indrajit Ghosh
 # Created On: Apr 28, 2024
 # 
-import numpy as np
+# NumPy is imported by the functions that work on 0/1 boards, on first call, so
+# that the bitmask search (and `chess.n_queens_count`) runs without loading it.
+#
+from __future__ import annotations
+
+from backtracking.engine import search
+from backtracking.stats import SearchAborted
 
 def check_row_col_sum(array:np.ndarray):
     """
@@ -23,6 +29,8 @@ def check_row_col_sum(array:np.ndarray):
     Returns:
     bool: True if all row and column sums are not greater than 1, False otherwise.
     """
+    import numpy as np
+
     row_sum = np.sum(array, axis=1)
     col_sum = np.sum(array, axis=0)
 
@@ -45,6 +53,8 @@ def check_diagonals_sum(array:np.ndarray):
     Returns:
     bool: True if the sum of each diagonal is not greater than 1, False otherwise.
     """
+    import numpy as np
+
     n = len(array)
     for i in range(n):
         if np.trace(array, offset=i) > 1:
@@ -63,54 +73,337 @@ def is_valid(board):
     return check_row_col_sum(board) and check_diagonals_sum(board) and check_diagonals_sum(board[:, ::-1])
 
 
-def solve_n_queens(board: np.ndarray, col: int):
+def solve_n_queens(board: np.ndarray, col: int, stats=None):
     """
     Solves the N-Queens problem using backtracking algorithm.
 
     Places N queens on an N x N chessboard in such a way that no two queens
-    attack each other. This function attempts to find a solution by recursively
-    placing queens on the board, backtracking when a conflict arises.
+    attack each other. This function attempts to find a solution by placing
+    queens column by column on the board, backtracking when a conflict arises
+    (see `backtracking.engine`).
 
     Parameters:
         board (numpy.ndarray): An N x N numpy array representing the chessboard.
         col (int): The current column being considered for queen placement.
+        stats (SearchStats, optional): Counters of the search (rows tried, queens taken
+            back, deepest column, time in the "search" phase); its hooks, if set, are
+            told about every queen placed and removed.
 
     Returns:
         bool: True if a solution is found, False otherwise.
+
+    Raises:
+        SearchAborted: If more than `stats.limit` rows had to be tried.
     """
-    n = len(board)
+    problem = _BoardQueens(board, col)
+    if stats is None:
+        return search(problem) is not None
+    with stats.phase("search"):
+        return search(problem, stats=stats) is not None
+
+
+class _BoardQueens:
+    """
+    The N-Queens problem on a 0/1 board for the backtracking engine: the variables
+    are the columns from `col` on, the values their rows, and every placement is
+    checked against the whole board with `is_valid`.
+    """
+
+    __slots__ = ("board", "col", "_rows")
+
+    def __init__(self, board, col):
+        self.board = board
+        self.col = col
+        self._rows = range(len(board))  # shared by every column
+
+    def select(self):
+        # Base case: If all queens are placed and no conflicts, we are done
+        n = len(self.board)
+        if self.board.sum() == n and is_valid(self.board):
+            return None
+        return self.col
+
+    def order(self, col):
+        return self._rows if col < len(self.board) else ()
+
+    def assign(self, col, row):
+        self.board[row][col] = 1
+        self.col = col + 1
+        return is_valid(self.board)
+
+    def undo(self, col, row):
+        self.board[row][col] = 0
+        self.col = col
+
+    def solution(self):
+        return self.board
+
+
+def _placed_masks(n: int, placed):
+    """
+    Returns the row, up-diagonal and down-diagonal bitmasks seen by the column after
+    the queens `placed` (one row per column), or None if two of them attack each other.
+    """
+    full = (1 << n) - 1
+    rows = up = down = 0
+    for row in placed:
+        bit = 1 << row
+        if (rows | up | down) & bit:
+            return None
+        rows |= bit
+        up = ((up | bit) << 1) & full
+        down = (down | bit) >> 1
+    return rows, up, down
 
-    # Base case: If all queens are placed and no conflicts, return True
-    if board.sum() == n and is_valid(board):
+
+class QueensProblem:
+    """
+    The N-Queens problem with bitmasks, for the generic backtracking engine.
+
+    The variables are the columns, left to right, and the values the free rows
+    of each column in ascending order, so `backtracking.search(QueensProblem(n), mode)`
+    finds the same solutions as `iter_solutions`, in any of the engine's modes.
+    Solutions are tuples with the row of the queen in every column.
+    """
+
+    __slots__ = ("n", "queens", "_full", "_masks")
+
+    def __init__(self, n: int, placed=()):
+        """
+        Parameters:
+            n (int): The size of the board.
+            placed (sequence): Rows of the queens already placed in the first columns.
+        """
+        self.n = n
+        self.queens = list(placed)
+        self._full = (1 << n) - 1
+        masks = _placed_masks(n, placed)
+        # Bitmasks of the occupied rows and diagonals seen by every column; None if `placed` clashes
+        self._masks = [masks]
+
+    def select(self):
+        if self._masks[-1] is None or len(self.queens) < self.n:
+            return len(self.queens)
+        return None
+
+    def order(self, col):
+        if self._masks[-1] is None:
+            return ()
+        rows, up, down = self._masks[-1]
+        free = self._full & ~(rows | up | down)
+        values = []
+        while free:
+            bit = free & -free
+            free ^= bit
+            values.append(bit.bit_length() - 1)
+        return values
+
+    def assign(self, col, row):
+        rows, up, down = self._masks[-1]
+        bit = 1 << row
+        self.queens.append(row)
+        self._masks.append((rows | bit, ((up | bit) << 1) & self._full, (down | bit) >> 1))
         return True
 
-    # Try placing a queen in each row of the current column
-    for row in range(n):
-        board[row][col] = 1
+    def undo(self, col, row):
+        self.queens.pop()
+        self._masks.pop()
+
+    def solution(self):
+        return tuple(self.queens)
 
-        # Check if the current placement is valid
-        if is_valid(board):
-            # Recursively try placing queens in the next column
-            if solve_n_queens(board, col + 1):
-                return True
 
-            # If placing a queen in the next column doesn't lead to a solution,
-            # backtrack by removing the current queen placement
-            board[row][col] = 0
+def count_completions(n: int, placed=()):
+    """
+    Counts the solutions of the N-Queens problem that start with the queens `placed`.
+
+    Parameters:
+        n (int): The size of the board.
+        placed (sequence): Rows of the queens already placed in the first columns.
+
+    Returns:
+        int: The number of solutions.
+    """
+    masks = _placed_masks(n, placed)
+    if masks is None:
+        return 0
+    rows, up, down = masks
+    full = (1 << n) - 1
+    if rows == full:
+        return 1
+
+    count = 0
+    stack = []
+    free = full & ~(rows | up | down)
+    while True:
+        if free:
+            bit = free & -free
+            free ^= bit
+            if rows | bit == full:
+                count += 1
+                continue
+            stack.append((free, rows, up, down))
+            rows |= bit
+            up = ((up | bit) << 1) & full
+            down = (down | bit) >> 1
+            free = full & ~(rows | up | down)
+        elif stack:
+            free, rows, up, down = stack.pop()
         else:
-            # If the current placement is invalid, backtrack by removing the queen
-            board[row][col] = 0
+            return count
 
-    # If no solution is found in this branch, return False
-    return False
+
+def iter_solutions(n: int, placed=(), stats=None):
+    """
+    Lazily enumerates the solutions of the N-Queens problem with integer bitmasks.
+
+    The occupied rows and both diagonal directions are kept as three bitmasks, so
+    the free squares of the next column are `~(rows | up | down)` and each node of
+    the search costs a few integer operations instead of a scan of the board. The
+    search runs on an explicit stack, so it is not limited by the recursion depth,
+    and it tries the rows of every column in ascending order: the solutions come in
+    lexicographic order and the first one is the solution found by `solve_n_queens`.
+
+    Only the current branch is held in memory, so the first k solutions can be taken
+    with `itertools.islice`, or all of them streamed to disk, for any board size.
+
+    Parameters:
+        n (int): The size of the board.
+        placed (sequence): Rows of the queens already placed in the first columns.
+        stats (SearchStats, optional): Counters of the search; its hooks, if set, are
+            told about every queen placed and removed.
+
+    Yields:
+        tuple: The row of the queen in every column; see `to_matrix` for the 0/1 board.
+    """
+    masks = _placed_masks(n, placed)
+    if masks is None:
+        return
+    rows, up, down = masks
+    full = (1 << n) - 1
+
+    queens = list(placed)
+    if len(queens) == n:
+        yield tuple(queens)
+        return
+
+    hooks = stats.hooks if stats is not None else None
+    stack = []
+    free = full & ~(rows | up | down)
+    while True:
+        if free:
+            # Place a queen on the lowest free row of the column
+            bit = free & -free
+            stack.append((free ^ bit, rows, up, down))
+            queens.append(bit.bit_length() - 1)
+            if stats is not None:
+                stats.nodes += 1
+                if stats.nodes > stats.limit:
+                    raise SearchAborted(f"Search stopped after {stats.limit} nodes")
+                if len(queens) > stats.max_depth:
+                    stats.max_depth = len(queens)
+                if hooks is not None:
+                    hooks.place(len(queens) - 1, len(queens) - 1, queens[-1])
+            if len(queens) == n:
+                yield tuple(queens)
+                free, rows, up, down = stack.pop()
+                row = queens.pop()
+                if hooks is not None:
+                    hooks.undo(len(queens), len(queens), row)
+                continue
+            rows |= bit
+            up = ((up | bit) << 1) & full
+            down = (down | bit) >> 1
+            free = full & ~(rows | up | down)
+        elif stack:
+            # Backtrack to the previous column
+            free, rows, up, down = stack.pop()
+            row = queens.pop()
+            if stats is not None:
+                stats.backtracks += 1
+                if hooks is not None:
+                    hooks.undo(len(queens), len(queens), row)
+        else:
+            return
+
+
+def first_solution(n: int, placed=(), stats=None):
+    """
+    Finds the first solution of the N-Queens problem, see `iter_solutions`.
+
+    Parameters:
+        n (int): The size of the board.
+        placed (sequence): Rows of the queens already placed in the first columns.
+        stats (SearchStats, optional): Counters of the search, with the time of its "search" phase.
+
+    Returns:
+        tuple or None: The row of the queen in every column, or None if there is no solution.
+    """
+    if stats is None:
+        return next(iter_solutions(n, placed), None)
+    with stats.phase("search"):
+        return next(iter_solutions(n, placed, stats), None)
+
+
+def to_matrix(solution, dtype=float):
+    """
+    Converts a solution given as the row of the queen in every column to the 0/1 board.
+
+    Parameters:
+        solution (sequence): The row of the queen in every column.
+        dtype: The data type of the board (float, like the boards of `solve_n_queens`).
+
+    Returns:
+        numpy.ndarray: The N x N board with a 1 on every queen.
+    """
+    import numpy as np
+
+    n = len(solution)
+    board = np.zeros((n, n), dtype=dtype)
+    board[list(solution), list(range(n))] = 1
+    return board
+
+
+def solve_n_queens_bitboard(board: np.ndarray, col: int = 0, stats=None):
+    """
+    Solves the N-Queens problem like `solve_n_queens`, using the bitmask search of
+    `iter_solutions`.
+
+    Parameters:
+        board (numpy.ndarray): An N x N numpy array representing the chessboard. The
+            columns before `col` must hold one queen each, the others must be empty.
+        col (int): The first column left to fill.
+        stats (SearchStats, optional): Counters of the search, see `solve_n_queens`.
+
+    Returns:
+        bool: True if a solution is found (and written to `board`), False otherwise.
+    """
+    import numpy as np
+
+    n = len(board)
+    placed = []
+    for c in range(col):
+        queens = np.flatnonzero(board[:, c])
+        if len(queens) != 1:
+            raise ValueError(f"Column {c} must hold exactly one queen")
+        placed.append(int(queens[0]))
+
+    solution = first_solution(n, placed, stats)
+    if solution is None:
+        return False
+
+    board[list(solution[col:]), list(range(col, n))] = 1
+    return True
 
 
 
 def main():
+    import numpy as np
+
     N = 12
     bo = np.zeros((N, N))
     
-    solve_n_queens(bo, 0)
+    solve_n_queens_bitboard(bo, 0)
     print(bo)
 
 
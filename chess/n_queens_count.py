@@ -0,0 +1,196 @@
+# chess/n_queens_count.py
+#
+# Counting all the solutions of the N-Queens problem on several cores.
+#
+# The search is split by the row of the queen in the first column. Reflecting
+# the board top to bottom maps the solutions with the first queen in row r to
+# those with the first queen in row n - 1 - r, so only the upper half of the
+# first column is searched and its counts are doubled. On odd boards the middle
+# row is its own mirror image; there the split goes one column further and the
+# upper half of the second column is searched instead.
+#
+# The subtrees are counted on a process pool. After each subtree the partial
+# counts are written to an optional JSON checkpoint, so an interrupted count
+# resumes where it stopped.
+#
+# The fundamental solutions (distinct under the 8 symmetries of the board) are
+# counted with Burnside's lemma: no reflection fixes a solution on a board
+# larger than 1x1, so only the few solutions fixed by a half turn or a quarter
+# turn are searched for, with a small search that places whole orbits at once.
+#
+# Usage:
+#   python -m chess.n_queens_count 14 --processes 4
+#   python -m chess.n_queens_count 17 --checkpoint queens17.json
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import argparse
+import json
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .n_queens import count_completions
+
+__all__ = ["QueensCount", "subtrees", "count_symmetric", "count_n_queens", "main"]
+
+QueensCount = namedtuple("QueensCount", ["n", "total", "fundamental"])
+QueensCount.__doc__ = """
+Result of `count_n_queens`.
+
+Attributes:
+    n (int): The size of the board.
+    total (int): The number of solutions.
+    fundamental (int): The number of solutions distinct under rotations and reflections.
+"""
+
+
+def subtrees(n):
+    """
+    Lists the subtrees searched to count the solutions of the n x n board.
+
+    Returns:
+        list: `(prefix, weight)` pairs; the total is the sum of `weight` times the
+              number of solutions starting with the rows `prefix`.
+    """
+    if n <= 1:
+        return [((), 1)]
+
+    half, odd = divmod(n, 2)
+    tasks = [((row,), 2) for row in range(half)]
+    if odd:
+        # The second queen cannot sit next to the middle row, nor in it
+        tasks += [((half, row), 2) for row in range(half - 1)]
+    return tasks
+
+
+def count_symmetric(n, quarter=False):
+    """
+    Counts the solutions that a half turn (or a quarter turn) of the board maps to themselves.
+
+    Parameters:
+        n (int): The size of the board.
+        quarter (bool): Count the solutions fixed by a quarter turn instead of a half turn.
+
+    Returns:
+        int: The number of symmetric solutions.
+    """
+    def orbit(col, row):
+        cells = [(col, row)]
+        while True:
+            col, row = (n - 1 - row, col) if quarter else (n - 1 - col, n - 1 - row)
+            if (col, row) == cells[0]:
+                return cells
+            cells.append((col, row))
+
+    queens = [-1] * n
+
+    def search(col, rows, up, down):
+        while col < n and queens[col] >= 0:
+            col += 1
+        if col == n:
+            return 1
+
+        count = 0
+        for row in range(n):
+            placed = []
+            r, u, d = rows, up, down
+            for c, q in orbit(col, row):
+                if queens[c] >= 0 or r >> q & 1 or u >> (q + c) & 1 or d >> (q - c + n - 1) & 1:
+                    break
+                queens[c] = q
+                placed.append(c)
+                r |= 1 << q
+                u |= 1 << (q + c)
+                d |= 1 << (q - c + n - 1)
+            else:
+                count += search(col + 1, r, u, d)
+            for c in placed:
+                queens[c] = -1
+        return count
+
+    return search(0, 0, 0, 0)
+
+
+def _load_checkpoint(path, n):
+    """
+    Returns the subtree counts saved in the checkpoint `path`, keyed by prefix.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("n") != n:
+        raise ValueError(f"The checkpoint {path} belongs to n = {data.get('n')}, not {n}")
+    return {tuple(prefix): count for prefix, count in data["counts"]}
+
+
+def _save_checkpoint(path, n, done):
+    # Write to a temporary file first so an interruption never leaves a truncated checkpoint
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"n": n, "counts": [[list(prefix), count] for prefix, count in done.items()]}, f)
+    os.replace(tmp, path)
+
+
+def count_n_queens(n, processes=None, checkpoint=None, progress=None):
+    """
+    Counts all the solutions of the N-Queens problem and its fundamental solutions.
+
+    Parameters:
+        n (int): The size of the board.
+        processes (int, optional): Number of worker processes, defaults to the CPU count.
+        checkpoint (str, optional): Path of a JSON file recording the counted subtrees;
+            counting resumes from it if it exists.
+        progress (callable, optional): Called as `progress(done, total)` after every subtree.
+
+    Returns:
+        QueensCount: The total and fundamental numbers of solutions.
+    """
+    tasks = subtrees(n)
+    weights = dict(tasks)
+    done = _load_checkpoint(checkpoint, n)
+    todo = [prefix for prefix, _ in tasks if prefix not in done]
+    if progress is not None:
+        progress(len(done), len(tasks))
+
+    if todo:
+        processes = processes or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(processes, len(todo))) as pool:
+            futures = {pool.submit(count_completions, n, prefix): prefix for prefix in todo}
+            for future in as_completed(futures):
+                done[futures[future]] = future.result()
+                if checkpoint:
+                    _save_checkpoint(checkpoint, n, done)
+                if progress is not None:
+                    progress(len(done), len(tasks))
+
+    total = sum(weights[prefix] * count for prefix, count in done.items())
+    if n <= 1:
+        return QueensCount(n, total, total)
+
+    # Burnside: average the number of solutions fixed by each of the 8 symmetries
+    half_turn = count_symmetric(n)
+    quarter_turn = count_symmetric(n, quarter=True)
+    return QueensCount(n, total, (total + half_turn + 2 * quarter_turn) // 8)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count the solutions of the N-Queens problem.")
+    parser.add_argument("n", type=int, help="size of the board")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--checkpoint", default=None, help="JSON file to save progress to and resume from")
+    args = parser.parse_args(argv)
+
+    def report(done, total):
+        print(f"\r{done}/{total} subtrees counted", end="\n" if done == total else "", file=sys.stderr, flush=True)
+
+    result = count_n_queens(args.n, args.processes, args.checkpoint, report)
+    print(f"n = {result.n}: {result.total} solutions, {result.fundamental} fundamental")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+# chess/positions.py
+#
+# Reading and writing chess positions in bulk.
+#
+# FEN (Forsyth-Edwards Notation) describes a position as text, rank 8 first,
+# with letters for the pieces (upper case for white) and digits for runs of
+# empty squares, e.g. the initial position is
+# "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1". Only the piece
+# placement is kept on a ChessBoard; the other fields are checked and dropped.
+#
+# The packed format stores the piece value of every square (see
+# `ChessPiece.chess_pieces`) as a 4-bit two's complement nibble, two squares per
+# byte in square order (a8, b8, ..., h1), low nibble first: 32 bytes per
+# position and no header, so the i-th position of a file starts at byte 32 * i
+# and files can be read in place through `mmap`.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import mmap
+from array import array
+
+from .chessboard import SQUARE_NAMES, ChessBoard, ChessPiece
+
+__all__ = [
+    "from_fen", "to_fen", "pack", "unpack", "write_positions", "read_positions",
+    "PositionFile", "PACKED_SIZE", "INITIAL_FEN",
+]
+
+PACKED_SIZE = 32
+
+INITIAL_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+_LETTERS = {'pawn': 'p', 'rook': 'r', 'knight': 'n', 'bishop': 'b', 'queen': 'q', 'king': 'k'}
+
+# FEN letter of every piece value, and the value of every FEN letter
+_LETTER_OF = {}
+for _name, _data in ChessPiece.chess_pieces.items():
+    _color, _kind = _name.split('_')
+    _LETTER_OF[_data['value']] = _LETTERS[_kind].upper() if _color == 'white' else _LETTERS[_kind]
+_VALUE_OF = {letter: value for value, letter in _LETTER_OF.items()}
+
+# Signed byte -> nibble, and nibble -> signed byte (0x80 marks the unused nibbles 7, 8 and 9)
+_TO_NIBBLE = bytes(b & 0x0F for b in range(256))
+_FROM_NIBBLE = bytes(
+    n if n <= 6 else (n - 16) & 0xFF if n >= 10 else 0x80
+    for n in range(16)
+) + bytes(240)
+_LOW_NIBBLES = int.from_bytes(b"\x0f" * PACKED_SIZE, "little")
+
+
+def from_fen(fen):
+    """
+    Creates a ChessBoard from a FEN string.
+
+    Parameters:
+        fen (str): A full FEN record, or just its piece placement field.
+
+    Returns:
+        ChessBoard: The board with the pieces of the position.
+    """
+    fields = fen.split()
+    if not fields or len(fields) > 6:
+        raise ValueError(f"Invalid FEN: {fen!r}")
+    if len(fields) > 1 and fields[1] not in ('w', 'b'):
+        raise ValueError(f"Invalid side to move in FEN: {fields[1]!r}")
+    if len(fields) > 2 and fields[2] != '-' and (
+        not set(fields[2]) <= set('KQkq') or len(set(fields[2])) != len(fields[2])
+    ):
+        raise ValueError(f"Invalid castling rights in FEN: {fields[2]!r}")
+    if len(fields) > 3 and fields[3] != '-' and fields[3] not in SQUARE_NAMES:
+        raise ValueError(f"Invalid en passant square in FEN: {fields[3]!r}")
+    if len(fields) > 4 and not (fields[4].isascii() and fields[4].isdigit()):
+        raise ValueError(f"Invalid halfmove clock in FEN: {fields[4]!r}")
+    if len(fields) > 5 and not (fields[5].isascii() and fields[5].isdigit() and int(fields[5]) >= 1):
+        raise ValueError(f"Invalid fullmove number in FEN: {fields[5]!r}")
+
+    ranks = fields[0].split('/')
+    if len(ranks) != 8:
+        raise ValueError("A FEN position must have 8 ranks")
+
+    squares = array('b')
+    for rank in ranks:
+        start = len(squares)
+        for char in rank:
+            if char in '12345678':
+                squares.extend(bytes(int(char)))
+            elif char in _VALUE_OF:
+                squares.append(_VALUE_OF[char])
+            else:
+                raise ValueError(f"Invalid character in FEN: {char!r}")
+        if len(squares) - start != 8:
+            raise ValueError(f"The FEN rank {rank!r} does not have 8 squares")
+
+    return ChessBoard._from_squares(squares)
+
+
+def to_fen(board, side='w', castling='-', en_passant='-', halfmove=0, fullmove=1):
+    """
+    Writes a ChessBoard as a FEN string.
+
+    Parameters:
+        board (ChessBoard): The board.
+        side (str): The side to move, 'w' or 'b'.
+        castling (str): The castling rights, e.g. 'KQkq', or '-'.
+        en_passant (str): The en passant target square, e.g. 'e3', or '-'.
+        halfmove (int): The halfmove clock.
+        fullmove (int): The fullmove number.
+
+    Returns:
+        str: The FEN record of the position.
+    """
+    squares = board._squares
+    ranks = []
+    for start in range(0, 64, 8):
+        rank = ""
+        empty = 0
+        for value in squares[start:start + 8]:
+            if value:
+                if empty:
+                    rank += str(empty)
+                    empty = 0
+                rank += _LETTER_OF[value]
+            else:
+                empty += 1
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+
+    return f"{'/'.join(ranks)} {side} {castling} {en_passant} {halfmove} {fullmove}"
+
+
+def pack(board):
+    """
+    Packs a ChessBoard into 32 bytes (see the module notes).
+    """
+    nibbles = board._squares.tobytes().translate(_TO_NIBBLE)
+    low = int.from_bytes(nibbles[0::2], "little")
+    high = int.from_bytes(nibbles[1::2], "little")
+    return (low | high << 4).to_bytes(PACKED_SIZE, "little")
+
+
+def unpack(data):
+    """
+    Unpacks 32 bytes written by `pack` into a ChessBoard.
+    """
+    if len(data) != PACKED_SIZE:
+        raise ValueError(f"A packed position has {PACKED_SIZE} bytes")
+
+    packed = int.from_bytes(data, "little")
+    nibbles = bytearray(64)
+    nibbles[0::2] = (packed & _LOW_NIBBLES).to_bytes(PACKED_SIZE, "little")
+    nibbles[1::2] = (packed >> 4 & _LOW_NIBBLES).to_bytes(PACKED_SIZE, "little")
+    values = nibbles.translate(_FROM_NIBBLE)
+    if 0x80 in values:
+        raise ValueError("Invalid piece value in packed position")
+    return ChessBoard._from_squares(array('b', values))
+
+
+def write_positions(path, boards, append=False):
+    """
+    Writes boards to a file in the packed format.
+
+    Parameters:
+        path (str): The file to write.
+        boards (iterable): The ChessBoard objects to write.
+        append (bool): Add to the end of an existing file instead of replacing it.
+
+    Returns:
+        int: The number of positions written.
+    """
+    count = 0
+    chunk = bytearray()
+    with open(path, "ab" if append else "wb") as f:
+        for board in boards:
+            chunk += pack(board)
+            count += 1
+            if len(chunk) >= 1 << 20:
+                f.write(chunk)
+                chunk.clear()
+        f.write(chunk)
+    return count
+
+
+def read_positions(path):
+    """
+    Reads every position of a packed file, one at a time.
+
+    Yields:
+        ChessBoard: The positions in file order.
+    """
+    with PositionFile(path) as positions:
+        yield from positions
+
+
+class PositionFile:
+    """
+    A packed position file mapped into memory, with random access to its positions.
+
+    Positions are decoded only when accessed; assigning a ChessBoard to an index
+    rewrites that position in place (the file must be opened with `writable=True`).
+    """
+
+    def __init__(self, path, writable=False):
+        """
+        Maps the file `path` into memory.
+
+        Parameters:
+            path (str): A file written by `write_positions`.
+            writable (bool): Whether positions may be overwritten.
+        """
+        self._file = open(path, "r+b" if writable else "rb")
+        size = self._file.seek(0, 2)
+        if size % PACKED_SIZE:
+            self._file.close()
+            raise ValueError(f"{path} is not a packed position file")
+        self._mmap = mmap.mmap(
+            self._file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        ) if size else None
+        self._count = size // PACKED_SIZE
+
+    def __len__(self):
+        return self._count
+
+    def _offset(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("position index out of range")
+        return PACKED_SIZE * i
+
+    def __getitem__(self, i):
+        offset = self._offset(i)
+        return unpack(self._mmap[offset:offset + PACKED_SIZE])
+
+    def __setitem__(self, i, board):
+        offset = self._offset(i)
+        self._mmap[offset:offset + PACKED_SIZE] = pack(board)
+
+    def __iter__(self):
+        for offset in range(0, PACKED_SIZE * self._count, PACKED_SIZE):
+            yield unpack(self._mmap[offset:offset + PACKED_SIZE])
+
+    def close(self):
+        """
+        Unmaps and closes the file.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
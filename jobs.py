@@ -0,0 +1,256 @@
+# jobs.py
+#
+# Background solve jobs for the web app.
+#
+# A job runs a solver function on a bounded thread pool and is looked up later
+# by its id. Every job owns a `SearchStats` whose node limit is the job's node
+# budget; the solver passes it on to the search, which raises `SearchAborted`
+# once the budget is spent. Cancelling a job, or reaching its deadline, drops
+# that limit to 0, so a running search stops at its next node.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import itertools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from sudoku.search import SearchAborted, SearchStats
+
+__all__ = ["Job", "JobManager", "JobQueueFull"]
+
+
+class JobQueueFull(Exception):
+    """
+    Raised by `JobManager.submit` when too many jobs are waiting to run.
+    """
+
+
+class Job:
+    """
+    A solver call running in the background.
+
+    Attributes:
+        id (str): The job id.
+        status (str): "queued", "running", "done", "failed", "timeout" or "cancelled".
+        result: The return value of the solver once the job is done.
+        error (str or None): Why the job failed, timed out or was cancelled.
+        stats (SearchStats): The counters (and node budget) of the job's search.
+        timeout (float or None): Seconds after submission by which the job must be
+            finished; time spent waiting in the queue counts, so it bounds the whole
+            wait of a client.
+        created (float): When the job was submitted (`time.time()`).
+        started (float or None): When the job started running.
+        finished (float or None): When the job finished.
+    """
+
+    FINISHED = ("done", "failed", "timeout", "cancelled")
+
+    def __init__(self, max_nodes=None, timeout=None):
+        self.id = uuid.uuid4().hex
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.stats = SearchStats(max_nodes)
+        self.timeout = timeout
+        self.created = time.time()
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self.started = None
+        self.finished = None
+        self._stop_reason = None
+        self._done = threading.Event()
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED
+
+    def stop(self, reason="cancelled", error="The job was cancelled."):
+        """
+        Asks the job to stop; a queued job never starts, a running search stops at its next node.
+
+        Returns:
+            bool: False if the job had already finished.
+        """
+        if self.is_finished:
+            return False
+        if self._stop_reason is None:
+            self._stop_reason = (reason, error)
+        self.stats.limit = 0
+        return True
+
+    def wait(self, timeout=None):
+        """
+        Waits until the job has finished.
+
+        Returns:
+            bool: True if the job has finished.
+        """
+        return self._done.wait(timeout)
+
+    def _run(self, fn, args):
+        if self._stop_reason is not None:
+            self._finish(*self._stop_reason)
+            return
+
+        remaining = None if self._deadline is None else self._deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            self._finish("timeout", f"The job waited in the queue for longer than {self.timeout:g} s.")
+            return
+
+        self.status = "running"
+        self.started = time.time()
+        timer = None
+        if remaining is not None:
+            timer = threading.Timer(
+                remaining, self.stop, ("timeout", f"The solver ran out of time ({self.timeout:g} s)."),
+            )
+            timer.daemon = True
+            timer.start()
+        try:
+            self.result = fn(self.stats, *args)
+        except SearchAborted:
+            if self._stop_reason is not None:
+                self._finish(*self._stop_reason)
+            else:
+                self._finish("timeout", f"The solver gave up after {self.stats.limit:g} nodes.")
+        except Exception as e:
+            self._finish("failed", f"{type(e).__name__}: {e}")
+        else:
+            self._finish("done")
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    def _finish(self, status, error=None):
+        self.error = error
+        self.finished = time.time()
+        self.status = status
+        self._done.set()
+
+    def to_dict(self):
+        """
+        Returns the job as a JSON-serializable dict.
+        """
+        return {
+            "id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "nodes": self.stats.nodes,
+            "stats": self.stats.to_dict(),
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+class JobManager:
+    """
+    Runs solver jobs on a bounded thread pool and keeps the most recent ones for polling.
+
+    Attributes:
+        max_workers (int): Number of jobs running at the same time.
+        max_queued (int): Number of jobs allowed to wait for a worker.
+        max_nodes (int or None): Default node budget of a job.
+        timeout (float or None): Default number of seconds a job may run.
+        keep (int): Number of finished jobs kept for polling.
+    """
+
+    def __init__(self, max_workers=2, max_queued=32, max_nodes=None, timeout=None, keep=1024):
+        """
+        Initializes the manager; worker threads start with the first job.
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_nodes = max_nodes
+        self.timeout = timeout
+        self.keep = keep
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="solve-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(("submitted", "rejected") + Job.FINISHED, 0)
+
+    def submit(self, fn, *args, max_nodes=None, timeout=None):
+        """
+        Starts a job calling `fn(stats, *args)`, where `stats` is the job's `SearchStats`.
+
+        Parameters:
+            fn (callable): The solver; it must pass `stats` on to the search.
+            *args: Further arguments of `fn`.
+            max_nodes (int, optional): Node budget, defaults to `self.max_nodes`.
+            timeout (float, optional): Seconds the job may run, defaults to `self.timeout`.
+
+        Returns:
+            Job: The new job.
+
+        Raises:
+            JobQueueFull: If `max_queued` jobs are already waiting.
+        """
+        job = Job(
+            max_nodes=self.max_nodes if max_nodes is None else max_nodes,
+            timeout=self.timeout if timeout is None else timeout,
+        )
+        with self._lock:
+            queued = sum(1 for j in self._jobs.values() if j.status == "queued")
+            if queued >= self.max_queued:
+                self._counts["rejected"] += 1
+                raise JobQueueFull(f"{queued} jobs are already waiting")
+            self._jobs[job.id] = job
+            self._counts["submitted"] += 1
+            self._evict()
+
+        future = self._pool.submit(job._run, fn, args)
+        future.add_done_callback(lambda _: self._count(job))
+        return job
+
+    def _count(self, job):
+        with self._lock:
+            self._counts[job.status] += 1
+
+    def _evict(self):
+        # Forget the oldest finished jobs beyond `keep`
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in itertools.islice(finished, max(0, len(finished) - self.keep)):
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        """
+        Returns the job with the given id, or None if it is unknown or was forgotten.
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancels a job.
+
+        Returns:
+            bool: True if the job was queued or running, False if it had finished or is unknown.
+        """
+        job = self.get(job_id)
+        return job is not None and job.stop()
+
+    def stats(self):
+        """
+        Returns the number of jobs per state and the totals since start.
+        """
+        with self._lock:
+            current = {}
+            for job in self._jobs.values():
+                current[job.status] = current.get(job.status, 0) + 1
+            return {"jobs": current, "totals": dict(self._counts), "max_workers": self.max_workers}
+
+    def shutdown(self, cancel=True):
+        """
+        Stops the worker threads, cancelling the unfinished jobs first if `cancel` is set.
+        """
+        if cancel:
+            with self._lock:
+                jobs = list(self._jobs.values())
+            for job in jobs:
+                job.stop()
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,169 @@
+# metrics.py
+#
+# Request and solver metrics of the web app, in the Prometheus text format.
+#
+# Every request is timed into a latency histogram of its route, and every
+# search reported with `observe_search` adds its node count to a histogram of
+# the route that started it, together with its backtracks, propagation steps,
+# deepest branch and time per phase. `render` returns all of it for scraping
+# from `/metrics`.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import threading
+from bisect import bisect_left
+
+__all__ = ["Histogram", "Metrics", "CONTENT_TYPE"]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """
+    Counts observations into buckets with fixed upper bounds.
+
+    Attributes:
+        bounds (tuple): The upper bounds of the buckets, in increasing order.
+        counts (list): Observations per bucket; the last one counts those above every bound.
+        sum (float): Sum of the observed values.
+        count (int): Number of observations.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        Returns (upper bound, observations up to it) pairs, ending with infinity.
+        """
+        total = 0
+        pairs = []
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value):
+    # Full precision: repr() is the shortest string that reads back as the same float
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """
+    Thread-safe registry of the app's request and search metrics.
+
+    Attributes:
+        prefix (str): Prefix of every metric name.
+    """
+
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    NODE_BUCKETS = (0, 10, 100, 1000, 10000, 100000, 1000000)
+
+    def __init__(self, prefix="backtrack"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._latency = {}  # route -> Histogram of seconds
+        self._requests = {}  # (route, status) -> count
+        self._nodes = {}  # route -> Histogram of nodes per search
+        self._totals = {}  # (counter, route) -> total over all searches
+        self._max_depth = {}  # route -> deepest branch of any search
+        self._phases = {}  # (route, phase) -> seconds
+
+    def observe_request(self, route, status, seconds):
+        """
+        Records a request to `route` answered with `status` after `seconds`.
+        """
+        with self._lock:
+            if route not in self._latency:
+                self._latency[route] = Histogram(self.LATENCY_BUCKETS)
+            self._latency[route].observe(seconds)
+            self._requests[route, status] = self._requests.get((route, status), 0) + 1
+
+    def observe_search(self, route, stats):
+        """
+        Records the `SearchStats` of a search started by a request to `route`.
+        """
+        with self._lock:
+            if route not in self._nodes:
+                self._nodes[route] = Histogram(self.NODE_BUCKETS)
+            self._nodes[route].observe(stats.nodes)
+            for counter in ("backtracks", "propagated", "eliminated"):
+                self._totals[counter, route] = self._totals.get((counter, route), 0) + getattr(stats, counter)
+            self._max_depth[route] = max(self._max_depth.get(route, 0), stats.max_depth)
+            for phase, seconds in stats.phases.items():
+                self._phases[route, phase] = self._phases.get((route, phase), 0.0) + seconds
+
+    def _histogram(self, lines, name, help, histograms):
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} histogram")
+        for route, histogram in sorted(histograms.items()):
+            for bound, count in histogram.cumulative():
+                lines.append(f"{name}_bucket{_labels(route=route, le=_number(bound))} {count}")
+            lines.append(f"{name}_sum{_labels(route=route)} {_number(histogram.sum)}")
+            lines.append(f"{name}_count{_labels(route=route)} {histogram.count}")
+
+    def render(self):
+        """
+        Returns every metric in the Prometheus text exposition format.
+        """
+        p = self.prefix
+        lines = []
+        with self._lock:
+            self._histogram(lines, f"{p}_request_duration_seconds", "Request latency by route.", self._latency)
+
+            lines.append(f"# HELP {p}_requests_total Requests by route and status code.")
+            lines.append(f"# TYPE {p}_requests_total counter")
+            for (route, status), count in sorted(self._requests.items()):
+                lines.append(f"{p}_requests_total{_labels(route=route, status=status)} {count}")
+
+            self._histogram(lines, f"{p}_search_nodes", "Search nodes expanded per solve, by route.", self._nodes)
+
+            for counter, help in (
+                ("backtracks", "Placements undone by the searches, by route."),
+                ("propagated", "Values fixed by constraint propagation, by route."),
+                ("eliminated", "Candidates eliminated by constraint propagation, by route."),
+            ):
+                lines.append(f"# HELP {p}_search_{counter}_total {help}")
+                lines.append(f"# TYPE {p}_search_{counter}_total counter")
+                for (name, route), total in sorted(self._totals.items()):
+                    if name == counter:
+                        lines.append(f"{p}_search_{counter}_total{_labels(route=route)} {total}")
+
+            lines.append(f"# HELP {p}_search_max_depth Deepest branch of any search, by route.")
+            lines.append(f"# TYPE {p}_search_max_depth gauge")
+            for route, depth in sorted(self._max_depth.items()):
+                lines.append(f"{p}_search_max_depth{_labels(route=route)} {depth}")
+
+            lines.append(f"# HELP {p}_search_phase_seconds_total Time spent in every phase of the searches, by route.")
+            lines.append(f"# TYPE {p}_search_phase_seconds_total counter")
+            for (route, phase), seconds in sorted(self._phases.items()):
+                lines.append(f"{p}_search_phase_seconds_total{_labels(route=route, phase=phase)} {_number(seconds)}")
+
+        return "\n".join(lines) + "\n"
@@ -1,7 +1,28 @@
 # Sudoku/__init__.py
 
-# Import statements
-from .model import *
+# Package-level names are imported from their submodules on first use (PEP 562),
+# so importing one submodule, e.g. `sudoku.state`, does not load the others
+import importlib
+
+_EXPORTS = {
+    "SudokuBoard": "model",
+    "PuzzleGenerator": "generator",
+    "rate_difficulty": "generator",
+    "DIFFICULTIES": "generator",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # Package-level variables
 version = "1.0"
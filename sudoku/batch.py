@@ -0,0 +1,186 @@
+# sudoku/batch.py
+#
+# Batch solving of Sudoku corpora over a process pool.
+#
+# Puzzles are read in the usual one-puzzle-per-line format (81 characters,
+# '0' or '.' for an empty cell; 256 or 625 characters with 'A' to 'P' or 'Y'
+# for 16x16 and 25x25 grids), grouped into chunks and shipped to worker
+# processes as byte strings of the cell values. Only a bounded number of
+# chunks is in flight at any time, so memory stays flat no matter how large
+# the input is.
+#
+# Usage:
+#   python -m sudoku.batch puzzles.txt -o solutions.txt --processes 4
+#   cat puzzles.txt | python -m sudoku.batch --unordered > solutions.txt
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from .model import SudokuBoard
+
+__all__ = ["encode", "decode", "solve_stream", "solve_file", "main", "UNSOLVABLE", "INVALID"]
+
+# Written in place of a solution
+UNSOLVABLE = "unsolvable"
+INVALID = "invalid"
+
+
+def encode(line):
+    """
+    Packs a puzzle line into bytes holding the cell values.
+
+    Returns:
+        bytes or None: The packed puzzle, or None if the line is not a valid puzzle.
+    """
+    try:
+        return bytes(SudokuBoard.from_string(line))
+    except ValueError:
+        return None
+
+
+def decode(cells):
+    """
+    Unpacks cell values into a one-character-per-cell string.
+    """
+    return SudokuBoard(cells).to_string()
+
+
+def _solve_chunk(chunk, engine):
+    """
+    Solves a chunk of packed puzzles in a worker process.
+
+    Returns:
+        list: One solution string, `UNSOLVABLE` or `INVALID` per puzzle.
+    """
+    results = []
+    for cells in chunk:
+        if cells is None:
+            results.append(INVALID)
+            continue
+        board = SudokuBoard(cells)
+        if board.solve(engine=engine):
+            results.append(board.to_string())
+        else:
+            results.append(UNSOLVABLE)
+    return results
+
+
+def solve_stream(lines, processes=None, chunk_size=256, ordered=True, engine="dlx"):
+    """
+    Solves a stream of puzzle lines on a process pool.
+
+    Parameters:
+        lines (iterable): Puzzle lines; a blank line is `INVALID` like any other
+            malformed line, so that result k always belongs to input line k.
+        processes (int, optional): Number of worker processes, defaults to the CPU count.
+        chunk_size (int): Number of puzzles sent to a worker at once.
+        ordered (bool): Yield results in input order (True) or as soon as they are done (False).
+        engine (str): Solver engine, see `SudokuBoard.solve`.
+
+    Yields:
+        tuple: `(line_number, result)` where `result` is the solution string,
+               `UNSOLVABLE` or `INVALID`, and `line_number` is 1-based.
+    """
+    processes = processes or os.cpu_count() or 1
+    max_pending = 2 * processes
+
+    numbered = enumerate(lines, 1)
+
+    def chunks():
+        while True:
+            chunk = list(islice(numbered, chunk_size))
+            if not chunk:
+                return
+            yield [n for n, _ in chunk], [encode(line) for _, line in chunk]
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = deque()
+        for numbers, chunk in chunks():
+            pending.append((numbers, pool.submit(_solve_chunk, chunk, engine)))
+
+            while len(pending) >= max_pending:
+                if ordered:
+                    numbers, future = pending.popleft()
+                    yield from zip(numbers, future.result())
+                else:
+                    yield from _drain_completed(pending)
+
+        while pending:
+            if ordered:
+                numbers, future = pending.popleft()
+                yield from zip(numbers, future.result())
+            else:
+                yield from _drain_completed(pending)
+
+
+def _drain_completed(pending):
+    """
+    Waits for at least one pending chunk and yields the results of all finished chunks.
+    """
+    done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+    for item in [item for item in pending if item[1] in done]:
+        pending.remove(item)
+        yield from zip(item[0], item[1].result())
+
+
+def solve_file(infile, outfile, ordered=True, **kwargs):
+    """
+    Solves every puzzle of a text stream and writes the results to another.
+
+    In input order line k holds the result of input line k (`INVALID` for a blank
+    line); in completion order every line is
+    `<line number>\\t<result>`.
+
+    Parameters:
+        infile (file): Readable text stream of puzzle lines.
+        outfile (file): Writable text stream for the results.
+        ordered (bool): Write results in input order (True) or in completion order (False).
+        **kwargs: Passed on to `solve_stream`.
+
+    Returns:
+        int: The number of puzzles processed.
+    """
+    count = 0
+    for number, result in solve_stream(infile, ordered=ordered, **kwargs):
+        outfile.write(f"{result}\n" if ordered else f"{number}\t{result}\n")
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of Sudoku puzzles, one puzzle string per line.")
+    parser.add_argument("input", nargs="?", default="-", help="puzzle file, '-' for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="solution file, '-' for stdout (default)")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-c", "--chunk-size", type=int, default=256, help="puzzles per worker task (default: 256)")
+    parser.add_argument("--unordered", action="store_true", help="write results as they complete, prefixed by the line number")
+    parser.add_argument("--engine", choices=("dlx", "backtrack"), default="dlx", help="solver engine (default: dlx)")
+    args = parser.parse_args(argv)
+
+    infile = sys.stdin if args.input == "-" else open(args.input)
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        solve_file(
+            infile, outfile,
+            ordered=not args.unordered,
+            processes=args.processes,
+            chunk_size=args.chunk_size,
+            engine=args.engine,
+        )
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+
+if __name__ == '__main__':
+    main()
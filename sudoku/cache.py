@@ -0,0 +1,300 @@
+# sudoku/cache.py
+#
+# LRU cache of Sudoku solutions keyed by a canonical form of the puzzle.
+#
+# Relabeling the digits, permuting the rows inside a band (or the columns inside
+# a stack), permuting the bands (or the stacks) and transposing the grid all map
+# a puzzle to an equivalent one whose solution is the image of the original
+# solution. `canonical_form` picks one representative of every such class, so
+# all the variants of a puzzle share a single cache entry.
+#
+# The representative is the lexicographically smallest grid (after relabeling
+# the digits in order of first appearance) among the arrangements that sort the
+# rows, bands, columns and stacks by invariants -- the clue counts of the lines
+# refined by the clue counts of the lines they cross. Only lines with equal
+# invariants have to be tried in every order, which keeps the candidates few.
+#
+# Only 9x9 puzzles are canonicalized; larger grids are solved directly.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from itertools import permutations, product
+
+from . import dlx
+
+__all__ = ["Transform", "canonical_form", "SolutionCache"]
+
+# Give up on canonicalizing (and bypass the cache) above this many tied arrangements
+MAX_CANDIDATES = 4096
+
+
+class Transform:
+    """
+    A symmetry of the Sudoku grid: optional transposition, then a row order, a
+    column order and a digit relabeling.
+
+    The transformed grid has `digits[grid[rows[i]][cols[j]]]` at row `i` and column `j`,
+    where `grid` is the input, transposed first if `transpose` is set.
+    """
+
+    __slots__ = ("transpose", "rows", "cols", "digits")
+
+    def __init__(self, transpose, rows, cols, digits):
+        self.transpose = transpose
+        self.rows = rows
+        self.cols = cols
+        self.digits = digits
+
+    def apply(self, cells):
+        """
+        Maps 81 cell values to their image under the transform.
+        """
+        grid = _transposed(cells) if self.transpose else cells
+        digits = self.digits
+        return [digits[grid[9 * r + c]] for r in self.rows for c in self.cols]
+
+    def invert(self, cells):
+        """
+        Maps 81 cell values of a transformed grid back to the original grid.
+        """
+        inverse = [0] * 10
+        for num in range(10):
+            inverse[self.digits[num]] = num
+
+        grid = [0] * 81
+        for i, r in enumerate(self.rows):
+            for j, c in enumerate(self.cols):
+                grid[9 * r + c] = inverse[cells[9 * i + j]]
+        return _transposed(grid) if self.transpose else grid
+
+
+def _phase(stats, name):
+    # Times a phase of the solve into `stats`, if there is one
+    return nullcontext() if stats is None else stats.phase(name)
+
+
+def _transposed(cells):
+    return [cells[9 * c + r] for r in range(9) for c in range(9)]
+
+
+def _tied_orders(items, key):
+    """
+    Lists every order of `items` sorted by `key`, with tied items in all possible orders.
+    """
+    items = sorted(items, key=key)
+    groups = []
+    for item in items:
+        if groups and key(groups[-1][0]) == key(item):
+            groups[-1].append(item)
+        else:
+            groups.append([item])
+    return [sum(choice, ()) for choice in product(*(list(permutations(g)) for g in groups))]
+
+
+def _line_orders(keys):
+    """
+    Lists the row (or column) orders consistent with sorting bands and lines by `keys`.
+    """
+    band_key = [tuple(sorted(keys[3 * b:3 * b + 3])) for b in range(3)]
+    within = [_tied_orders(range(3 * b, 3 * b + 3), keys.__getitem__) for b in range(3)]
+    orders = []
+    for bands in _tied_orders(range(3), band_key.__getitem__):
+        for parts in product(*(within[b] for b in bands)):
+            orders.append(sum(parts, ()))
+            if len(orders) > MAX_CANDIDATES:
+                return orders
+    return orders
+
+
+def _candidate_orders(cells):
+    """
+    Lists the row and column orders worth trying for one orientation of the grid.
+    """
+    filled = [[c for c in range(9) if cells[9 * r + c]] for r in range(9)]
+    filled_t = [[r for r in range(9) if cells[9 * r + c]] for c in range(9)]
+    row_count = [len(f) for f in filled]
+    col_count = [len(f) for f in filled_t]
+    row_keys = [(row_count[r], tuple(sorted(col_count[c] for c in filled[r]))) for r in range(9)]
+    col_keys = [(col_count[c], tuple(sorted(row_count[r] for r in filled_t[c]))) for c in range(9)]
+    return _line_orders(row_keys), _line_orders(col_keys)
+
+
+def canonical_form(cells):
+    """
+    Computes the canonical form of a puzzle.
+
+    Parameters:
+        cells (list): The 81 cell values in row-major order (0 denotes an empty cell).
+
+    Returns:
+        tuple: `(key, transform)` where `key` is the canonical grid as 81 bytes and
+               `transform` the `Transform` mapping `cells` to it, or None if the puzzle
+               has too many symmetric arrangements to canonicalize cheaply.
+    """
+    best = None
+    for transpose in (False, True):
+        grid = _transposed(cells) if transpose else cells
+        row_orders, col_orders = _candidate_orders(grid)
+        if len(row_orders) * len(col_orders) > MAX_CANDIDATES:
+            return None
+
+        for rows in row_orders:
+            row_cells = [grid[9 * r:9 * r + 9] for r in rows]
+            for cols in col_orders:
+                digits = [0] * 10
+                label = 0
+                out = bytearray(81)
+                i = 0
+                for row in row_cells:
+                    for c in cols:
+                        num = row[c]
+                        if num:
+                            if not digits[num]:
+                                label += 1
+                                digits[num] = label
+                            out[i] = digits[num]
+                        i += 1
+                if best is None or out < best[0]:
+                    best = (out, transpose, rows, cols, digits)
+
+    key, transpose, rows, cols, digits = best
+
+    # Digits missing from the puzzle take the remaining labels in increasing order
+    label = max(digits)
+    for num in range(1, 10):
+        if not digits[num]:
+            label += 1
+            digits[num] = label
+
+    return bytes(key), Transform(transpose, rows, cols, digits)
+
+
+class SolutionCache:
+    """
+    A bounded, thread-safe LRU cache of Sudoku solutions with an optional time-to-live.
+
+    Every entry stores the number of solutions of a canonical puzzle (capped at 2)
+    and one of its solutions, so a hit answers both "is it unique?" and "what is
+    the solution?" for every variant of the puzzle.
+
+    Attributes:
+        capacity (int): Maximum number of entries.
+        ttl (float or None): Seconds after which an entry expires, None to keep entries until evicted.
+    """
+
+    def __init__(self, capacity=1024, ttl=None):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+            capacity (int): Maximum number of entries.
+            ttl (float, optional): Seconds after which an entry expires.
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.uncacheable = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put(self, key, num_solutions, solution):
+        with self._lock:
+            self._entries[key] = (num_solutions, solution, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def solve(self, sudoku_board, stats=None):
+        """
+        Solves a SudokuBoard in place, reusing the cached solution of any equivalent puzzle.
+
+        Parameters:
+            sudoku_board (SudokuBoard): The board to solve; it is left unchanged if it has no solution.
+            stats (SearchStats, optional): Counters of the search on a cache miss, with the
+                time of the "canonicalize" and "search" phases; a search exceeding
+                `stats.limit` raises `SearchAborted` and caches nothing.
+
+        Returns:
+            int: The number of solutions of the board, capped at 2.
+        """
+        cells = bytes(sudoku_board)
+        with _phase(stats, "canonicalize"):
+            canonical = canonical_form(cells) if len(cells) == 81 else None
+        if canonical is None:
+            with self._lock:
+                self.uncacheable += 1
+            return self._solve(sudoku_board, cells, stats)[0]
+
+        key, transform = canonical
+        entry = self._get(key)
+        if entry is None:
+            num_solutions, solution = self._solve(sudoku_board, cells, stats)
+            self._put(key, num_solutions, solution and bytes(transform.apply(solution)))
+            return num_solutions
+
+        num_solutions, solution = entry[0], entry[1]
+        if solution:
+            sudoku_board._fill(transform.invert(solution))
+        return num_solutions
+
+    @staticmethod
+    def _solve(sudoku_board, cells, stats=None):
+        with _phase(stats, "search"):
+            solutions = list(dlx.iter_solutions(cells, box=sudoku_board.geometry.box, limit=2, stats=stats))
+        if not solutions:
+            return 0, None
+        sudoku_board._fill(solutions[0])
+        return len(solutions), solutions[0]
+
+    def stats(self):
+        """
+        Returns the cache counters and an estimate of its memory use.
+
+        Returns:
+            dict: Entries, capacity, hits, misses, hit rate, evictions, expirations,
+                  uncacheable puzzles and approximate memory in bytes.
+        """
+        with self._lock:
+            memory = sys.getsizeof(self._entries)
+            for key, entry in self._entries.items():
+                memory += sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(entry[1])
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "uncacheable": self.uncacheable,
+                "memory_bytes": memory,
+            }
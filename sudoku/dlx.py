@@ -0,0 +1,236 @@
+# sudoku/dlx.py
+#
+# Dancing Links (Knuth's Algorithm X) exact-cover engine for Sudoku.
+#
+# A Sudoku of box size `b` (an n x n grid with n = b * b) is the exact-cover
+# problem with 4 * n * n constraint columns -- every cell holds one digit, and
+# every row, column and box holds every digit once -- and n * n * n candidate
+# rows, one per (cell, digit) pair, each covering exactly four columns.
+#
+# The toroidal doubly linked lists are stored in parallel Python lists
+# (left/right/up/down/column/row-id per node) instead of one object per node.
+# The pristine matrix of each box size is built once and every solve works on
+# plain list copies of it.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from .search import SearchAborted
+
+__all__ = ["iter_solutions", "count_solutions"]
+
+_TEMPLATES = {}
+
+
+def _template(box):
+    """
+    Builds (once per box size) the linked-list arrays of the Sudoku exact-cover matrix.
+
+    Returns:
+        tuple: `(L, R, U, D, C, S, ROW)` where node 0 is the root, nodes
+               `1..4*n*n` are the column headers and the candidate row
+               `cell * n + digit - 1` owns the four consecutive nodes starting
+               at `1 + 4*n*n + 4 * row`.
+    """
+    if box in _TEMPLATES:
+        return _TEMPLATES[box]
+
+    n = box * box
+    cells = n * n
+    headers = 4 * cells
+
+    # Root and column headers form the horizontal header list
+    L = [h - 1 for h in range(headers + 1)]
+    L[0] = headers
+    R = [h + 1 for h in range(headers + 1)]
+    R[headers] = 0
+    U = list(range(headers + 1))
+    D = list(range(headers + 1))
+    C = list(range(headers + 1))
+    S = [0] * (headers + 1)
+    ROW = [-1] * (headers + 1)
+
+    for cell in range(cells):
+        r, c = divmod(cell, n)
+        b = box * (r // box) + c // box
+        for d in range(n):
+            columns = (
+                1 + cell,
+                1 + cells + r * n + d,
+                1 + 2 * cells + c * n + d,
+                1 + 3 * cells + b * n + d,
+            )
+            first = len(L)
+            for k, col in enumerate(columns):
+                node = first + k
+                L.append(first + (k - 1) % 4)
+                R.append(first + (k + 1) % 4)
+                # Append at the bottom of the column
+                U.append(U[col])
+                D.append(col)
+                D[U[col]] = node
+                U[col] = node
+                C.append(col)
+                ROW.append(cell * n + d)
+                S[col] += 1
+
+    _TEMPLATES[box] = (L, R, U, D, C, S, ROW)
+    return _TEMPLATES[box]
+
+
+def iter_solutions(cells, box=3, limit=None, stats=None):
+    """
+    Enumerates the solutions of a Sudoku grid.
+
+    Parameters:
+        cells (list): The n * n cell values in row-major order (0 denotes an empty cell).
+        box (int): The box size, 3 for the usual 9x9 grid.
+        limit (int, optional): Stop after this many solutions.
+        stats (SearchStats, optional): Counters updated with the number of rows tried;
+            `SearchAborted` is raised once they exceed `stats.limit`. Its hooks, if
+            set, are told about every (cell, digit) row selected and dropped.
+
+    Yields:
+        list: Every solution as a new list of n * n cell values in row-major order.
+    """
+    n = box * box
+    L, R, U, D, C, S, ROW = (list(a) for a in _template(box))
+    hooks = stats.hooks if stats is not None else None
+    first_node = 1 + 4 * n * n
+
+    def cover(c):
+        L[R[c]] = L[c]
+        R[L[c]] = R[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(c):
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        L[R[c]] = c
+        R[L[c]] = c
+
+    def choose():
+        # Column with the fewest remaining rows
+        best, size = R[0], S[R[0]]
+        c = R[best]
+        while c and size > 1:
+            if S[c] < size:
+                best, size = c, S[c]
+            c = R[c]
+        return best
+
+    # Select the rows of the clues; a clue whose column is gone conflicts with another clue
+    covered = [False] * (4 * n * n + 1)
+    for cell, num in enumerate(cells):
+        if num:
+            if not 1 <= num <= n:
+                return
+            node = first_node + 4 * (cell * n + num - 1)
+            for k in range(4):
+                if covered[C[node + k]]:
+                    return
+            for k in range(4):
+                covered[C[node + k]] = True
+                cover(C[node + k])
+
+    found = 0
+    if R[0] == 0:
+        yield list(cells)
+        return
+
+    chosen = []
+    c = choose()
+    cover(c)
+    r = D[c]
+    while True:
+        if r != c:
+            # Try the candidate row `r` of column `c`
+            chosen.append(r)
+            if stats is not None:
+                stats.nodes += 1
+                if stats.nodes > stats.limit:
+                    raise SearchAborted(f"Search stopped after {stats.limit} nodes")
+                if len(chosen) > stats.max_depth:
+                    stats.max_depth = len(chosen)
+            if hooks is not None:
+                cell, d = divmod(ROW[r], n)
+                hooks.place(len(chosen) - 1, cell, d + 1)
+            j = R[r]
+            while j != r:
+                cover(C[j])
+                j = R[j]
+
+            if R[0] != 0:
+                c = choose()
+                cover(c)
+                r = D[c]
+                continue
+
+            solution = list(cells)
+            for node in chosen:
+                cell, d = divmod(ROW[node], n)
+                solution[cell] = d + 1
+            yield solution
+            found += 1
+            if limit is not None and found >= limit:
+                return
+
+            # Undo `r` and move on to the next row of the same column
+            j = L[r]
+            while j != r:
+                uncover(C[j])
+                j = L[j]
+            chosen.pop()
+            if hooks is not None:
+                cell, d = divmod(ROW[r], n)
+                hooks.undo(len(chosen), cell, d + 1)
+            r = D[r]
+        else:
+            # Column `c` is exhausted: backtrack to the previous level
+            uncover(c)
+            if not chosen:
+                return
+            if stats is not None:
+                stats.backtracks += 1
+            r = chosen.pop()
+            if hooks is not None:
+                cell, d = divmod(ROW[r], n)
+                hooks.undo(len(chosen), cell, d + 1)
+            c = C[r]
+            j = L[r]
+            while j != r:
+                uncover(C[j])
+                j = L[j]
+            r = D[r]
+
+
+def count_solutions(cells, box=3, limit=None, stats=None):
+    """
+    Counts the solutions of a Sudoku grid, stopping early once `limit` is reached.
+
+    Parameters:
+        cells (list): The n * n cell values in row-major order (0 denotes an empty cell).
+        box (int): The box size, 3 for the usual 9x9 grid.
+        limit (int, optional): Stop counting at this many solutions.
+        stats (SearchStats, optional): Counters updated with the number of rows tried.
+
+    Returns:
+        int: The number of solutions, capped at `limit`.
+    """
+    return sum(1 for _ in iter_solutions(cells, box, limit, stats))
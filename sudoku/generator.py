@@ -0,0 +1,171 @@
+# sudoku/generator.py
+#
+# Fast generation of Sudoku puzzles with a unique solution.
+#
+# A random solved grid is produced by the propagating search with a shuffled
+# digit order. Clues are then removed one at a time in random order, and a
+# removal is kept only if the puzzle stays uniquely solvable. Uniqueness is
+# checked incrementally: when the clue `v` is removed from a cell, the puzzle
+# (which had a unique solution before) is still unique exactly when there is no
+# solution with a digit other than `v` in that cell, so a single search for one
+# solution, with `v` ruled out, decides it.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import random
+
+from .model import SudokuBoard
+from .propagation import propagate
+from .search import SearchStats, ascending, backtrack, most_constrained
+from .state import CandidateState, Geometry
+
+__all__ = ["PuzzleGenerator", "rate_difficulty", "DIFFICULTIES"]
+
+# Difficulty levels, from the weakest to the strongest technique needed to solve the puzzle
+DIFFICULTIES = ("easy", "medium", "hard")
+
+
+def rate_difficulty(cells):
+    """
+    Rates a puzzle by the logical techniques needed to solve it.
+
+    Parameters:
+        cells (list): The cell values in row-major order (0 denotes an empty cell).
+
+    Returns:
+        str: "easy" if naked and hidden singles solve it, "medium" if locked candidates
+             are needed as well, "hard" if it cannot be solved without guessing.
+    """
+    for difficulty, locked in (("easy", False), ("medium", True)):
+        state = CandidateState(cells)
+        if propagate(state, SearchStats(), locked=locked) and not state.empty:
+            return difficulty
+    return "hard"
+
+
+class PuzzleGenerator:
+    """
+    Generates random Sudoku puzzles that have exactly one solution.
+
+    Attributes:
+        clues (int or None): Target number of clues; None digs as many holes as possible.
+        difficulty (str or None): Target difficulty, one of `DIFFICULTIES`, or None for any.
+        geometry (Geometry): The grid being generated (9x9 by default).
+        max_attempts (int): Number of fresh grids tried per puzzle before giving up on the targets.
+    """
+
+    def __init__(self, clues=None, difficulty=None, seed=None, max_attempts=20, box=3):
+        """
+        Initializes the generator.
+
+        Parameters:
+            clues (int, optional): Target number of clues (17 to 81 for a 9x9 grid).
+            difficulty (str, optional): Target difficulty, one of `DIFFICULTIES`.
+            seed (optional): Seed of the private random number generator, for reproducible output.
+            max_attempts (int): Number of fresh grids tried per puzzle before giving up on the targets.
+            box (int): The box size; 3 for the usual 9x9 grid, 4 for 16x16, 5 for 25x25.
+        """
+        geometry = Geometry.of(box)
+        min_clues = 17 if box == 3 else geometry.n - 1
+        if clues is not None and not min_clues <= clues <= geometry.size:
+            raise ValueError(f"A unique Sudoku puzzle has between {min_clues} and {geometry.size} clues")
+        if difficulty is not None and difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty: {difficulty!r}")
+
+        self.clues = clues
+        self.difficulty = difficulty
+        self.geometry = geometry
+        self.max_attempts = max_attempts
+        self._random = random.Random(seed)
+
+    def solved_grid(self):
+        """
+        Generates a random solved grid.
+
+        Returns:
+            list: The cell values in row-major order.
+        """
+        shuffle = self._random.sample
+
+        def random_order(state, idx, mask):
+            digits = ascending(state, idx, mask)
+            return shuffle(digits, len(digits))
+
+        state = CandidateState(bytes(self.geometry.size))
+        backtrack(state, most_constrained, random_order, SearchStats(), propagate)
+        return state.cells
+
+    @staticmethod
+    def _has_other_solution(cells, idx, num):
+        """
+        Checks whether the puzzle `cells` has a solution with a digit other than `num` at `idx`.
+        """
+        state = CandidateState(cells)
+        state.elim[idx] = 1 << (num - 1)
+        stats = SearchStats()
+        return propagate(state, stats) and backtrack(state, most_constrained, ascending, stats, propagate)
+
+    def _dig(self, solution):
+        """
+        Removes clues from a solved grid while the solution stays unique.
+
+        Returns:
+            list: The puzzle cells.
+        """
+        puzzle = list(solution)
+        size = self.geometry.size
+        target = self.clues if self.clues is not None else 0
+        max_level = DIFFICULTIES.index(self.difficulty) if self.difficulty else len(DIFFICULTIES) - 1
+        clues = size
+
+        for idx in self._random.sample(range(size), size):
+            if clues <= target:
+                break
+
+            num = puzzle[idx]
+            puzzle[idx] = 0
+            if self._has_other_solution(puzzle, idx, num) or (
+                max_level < len(DIFFICULTIES) - 1 and DIFFICULTIES.index(rate_difficulty(puzzle)) > max_level
+            ):
+                puzzle[idx] = num
+            else:
+                clues -= 1
+
+        return puzzle
+
+    def generate_one(self):
+        """
+        Generates a single puzzle.
+
+        The targets are met on a best-effort basis: if none of `max_attempts` grids
+        yields a puzzle with exactly `clues` clues and the requested difficulty, the
+        last puzzle generated is returned.
+
+        Returns:
+            tuple: The puzzle and its solution as two SudokuBoard objects.
+        """
+        for _ in range(self.max_attempts):
+            solution = self.solved_grid()
+            puzzle = self._dig(solution)
+            if self.clues is not None and len(puzzle) - puzzle.count(0) != self.clues:
+                continue
+            if self.difficulty is not None and rate_difficulty(puzzle) != self.difficulty:
+                continue
+            break
+
+        return SudokuBoard(bytes(puzzle)), SudokuBoard(bytes(solution))
+
+    def generate(self, n):
+        """
+        Generates `n` puzzles, yielding each one as soon as it is ready.
+
+        Parameters:
+            n (int): Number of puzzles to generate.
+
+        Yields:
+            tuple: The puzzle and its solution as two SudokuBoard objects.
+        """
+        for _ in range(n):
+            yield self.generate_one()
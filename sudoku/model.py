@@ -4,41 +4,241 @@
 # Created on: Apr 27, 2024
 #
 
-import random
+from .state import CandidateState, Geometry
+from . import dlx
+from .propagation import propagate as propagate_constraints
+from .search import CELL_ORDERINGS, VALUE_ORDERINGS, SearchStats, backtrack
 
 __all__ = ["SudokuBoard"]
 
+# Translation tables between cell values and the one-character-per-cell string
+# format: digits 1 to 9, then the letters A to Z (either case) for 10 to 35
+_FROM_CHAR = bytes(
+    ord(ch) - 48 if "0" <= ch <= "9"
+    else ord(ch) - 55 if "A" <= ch <= "Z"
+    else ord(ch) - 87 if "a" <= ch <= "z"
+    else 0 if ch == "."
+    else 255
+    for ch in map(chr, range(256))
+)
+_TO_CHAR = bytes(48 + num if num < 10 else 55 + num if num < 36 else 63 for num in range(256))
+
+
+class _BoardRow:
+    """
+    A row of a SudokuBoard that reads and writes the board's cells.
+    """
+
+    __slots__ = ("_board", "_start")
+
+    def __init__(self, board, i):
+        self._board = board
+        self._start = board.geometry.n * i
+
+    def _index(self, j):
+        n = self._board.geometry.n
+        if not -n <= j < n:
+            raise IndexError("Sudoku row index out of range")
+        return self._start + j % n
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return list(self)[j]
+        return self._board._cells[self._index(j)]
+
+    def __setitem__(self, j, num):
+        self._board._cells[self._index(j)] = self._board._check_value(num)
+
+    def __len__(self):
+        return self._board.geometry.n
+
+    def __iter__(self):
+        n = self._board.geometry.n
+        return iter(self._board._cells[self._start:self._start + n])
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _BoardView:
+    """
+    The rows of a SudokuBoard, as returned by `SudokuBoard.board`.
+    """
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        n = self._board.geometry.n
+        if not -n <= i < n:
+            raise IndexError("Sudoku board index out of range")
+        return _BoardRow(self._board, i % n)
+
+    def __setitem__(self, i, row):
+        target = self[i]
+        values = list(row)
+        if len(values) != len(target):
+            raise ValueError(f"A row must have {len(target)} cells")
+        for j, num in enumerate(values):
+            target[j] = num
+
+    def __len__(self):
+        return self._board.geometry.n
+
+    def __iter__(self):
+        return (_BoardRow(self._board, i) for i in range(self._board.geometry.n))
+
+    def __eq__(self, other):
+        try:
+            return [list(row) for row in self] == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
+
 class SudokuBoard:
     """
     A class to represent a Sudoku board and provide methods for solving it.
 
+    The cells are stored row by row in a single `bytearray`, which is cheap to
+    copy, pickle and send to other processes. The `board` property still offers
+    the familiar list-of-rows view, and a board created from a list of rows
+    writes its solution back into that list, like the list-based board did.
+
+    Besides the usual 9x9 grid, any n x n grid with n = b * b is supported
+    (16x16 for boxes of size 4, 25x25 for boxes of size 5); the size is inferred
+    from the number of cells.
+
     Author: Indrajit Ghosh
     Created On: Apr 27, 2024
 
     Attributes:
-        _board (list): A 9x9 list representing the Sudoku board.
+        _cells (bytearray): The n * n cell values in row-major order (0 denotes an empty cell).
+        geometry (Geometry): The lookup tables of the grid (box size, side length, units, peers).
+        stats (SearchStats): Counters of the most recent call to `solve()`, None before the first one.
     """
 
+    __slots__ = ("_cells", "geometry", "stats", "_source")
+
     def __init__(self, board):
         """
         Initializes the SudokuBoard with a given board configuration.
 
         Parameters:
-            board (list): A 9x9 list representing the initial Sudoku board.
+            board (list or bytes): An n x n list representing the initial Sudoku board
+                (usually 9x9), or the n * n cell values in row-major order as a bytes-like object.
+
+        Raises:
+            ValueError: If the number of cells does not form a grid, or a cell value
+                is not between 0 and n.
         """
-        self._board = board
-        self._rows = len(board)
-        self._cols = len(board[0]) 
+        if isinstance(board, (bytes, bytearray, memoryview)):
+            cells = bytearray(board)
+            geometry = Geometry.for_size(len(cells))
+            valid = max(cells, default=0) <= geometry.n
+        else:
+            values = [num for row in board for num in row]
+            geometry = Geometry.for_size(len(values))
+            valid = all(0 <= num <= geometry.n for num in values)
+            cells = bytearray(values) if valid else None
+        if not valid:
+            raise ValueError(f"Sudoku cell values must be between 0 and {geometry.n}")
+
+        self.geometry = geometry
+        self._cells = cells
+        # The rows of a list-of-lists board receive the solution (see `_fill`)
+        self._source = board if isinstance(board, list) and all(isinstance(row, list) for row in board) else None
+        self.stats = None
+
+    def _check_value(self, num):
+        """
+        Returns `num` if it is a valid cell value, raises ValueError otherwise.
+        """
+        if not isinstance(num, int) or not 0 <= num <= self.geometry.n:
+            raise ValueError(f"Sudoku cell values must be between 0 and {self.geometry.n}")
+        return num
+
+    @classmethod
+    def from_string(cls, string):
+        """
+        Creates a SudokuBoard from the one-character-per-cell format ('0' or '.' for an
+        empty cell, 'A' to 'Z' for the values 10 to 35 of larger grids).
+
+        Parameters:
+            string (str): The cells row by row, e.g. "53..7....6..195...", 81 characters
+                for a 9x9 grid, 256 for 16x16 and so on.
+
+        Returns:
+            SudokuBoard: The board described by `string`.
+        """
+        cells = string.strip().encode("ascii", "replace").translate(_FROM_CHAR)
+        if max(cells, default=0) > Geometry.for_size(len(cells)).n:
+            raise ValueError("Invalid character in Sudoku string")
+        return cls(cells)
+
+    def to_string(self, empty="0"):
+        """
+        Returns the board in the one-character-per-cell format.
+
+        Parameters:
+            empty (str): Character used for empty cells.
+        """
+        string = self._cells.translate(_TO_CHAR).decode("ascii")
+        return string if empty == "0" else string.replace("0", empty)
+
+    def __bytes__(self):
+        return bytes(self._cells)
+
+    def __reduce__(self):
+        # Pickle as the raw cell values
+        return self.__class__, (bytes(self._cells),)
+
+    def __eq__(self, other):
+        if not isinstance(other, SudokuBoard):
+            return NotImplemented
+        return self._cells == other._cells
+
+    __hash__ = None
+
+    def copy(self):
+        """
+        Returns an independent copy of the board.
+        """
+        return self.__class__(self._cells)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self.copy()
 
     @property
     def board(self):
         """
         Gets the Sudoku board.
 
+        The rows read and write the board's cells, so `board.board[r][c] = v`
+        changes the board; use `list(row)` for a copy.
+
         Returns:
-            list: A 9x9 list representing the Sudoku board.
+            sequence: The n rows of the Sudoku board, each a sequence of n cell values.
         """
-        return self._board
+        return _BoardView(self)
 
     @board.setter
     def board(self, new_board):
@@ -46,27 +246,72 @@ class SudokuBoard:
         Sets the Sudoku board with a new configuration.
 
         Parameters:
-            new_board (list): A 9x9 list representing the new Sudoku board configuration.
+            new_board (list): An n x n list representing the new Sudoku board configuration.
+        """
+        other = self.__class__(new_board)
+        self._cells[:] = other._cells
+        self.geometry = other.geometry
+        self._source = other._source
+
+    def row(self, i):
+        """
+        Returns a zero-copy view of the row `i`.
+
+        Returns:
+            memoryview: The n cell values of the row; writing to it changes the board.
+        """
+        n = self.geometry.n
+        return memoryview(self._cells)[n * i:n * i + n]
+
+    def column(self, j):
         """
-        self._board = new_board
+        Returns a zero-copy view of the column `j`.
+
+        Returns:
+            memoryview: The n cell values of the column; writing to it changes the board.
+        """
+        return memoryview(self._cells)[j::self.geometry.n]
+
+    def box(self, k):
+        """
+        Returns zero-copy views of the box `k` (numbered row by row from 0 to n - 1).
+
+        Returns:
+            tuple: One memoryview per row of the box, holding its b cell values (3 for a 9x9 grid).
+        """
+        b, n = self.geometry.box, self.geometry.n
+        start = n * b * (k // b) + b * (k % b)
+        cells = memoryview(self._cells)
+        return tuple(cells[start + n * i:start + n * i + b] for i in range(b))
+
+    def to_numpy(self):
+        """
+        Returns a zero-copy n x n NumPy `uint8` view of the board.
+        """
+        import numpy as np
+
+        n = self.geometry.n
+        return np.frombuffer(self._cells, dtype=np.uint8).reshape(n, n)
 
     def __str__(self):
         """
         Returns a string representation of the Sudoku board.
         """
+        b, n = self.geometry.box, self.geometry.n
+        width = len(str(n))
         board_str = ""
-        for i in range(len(self._board)):
-            if i % 3 == 0 and i != 0:
-                board_str += "- - - - - - - - - - - - - \n"
+        for i in range(n):
+            if i % b == 0 and i != 0:
+                board_str += "- " * (((width + 1) * n + 3 * (b - 1)) // 2 + 1) + "\n"
 
-            for j in range(len(self._board[0])):
-                if j % 3 == 0 and j != 0:
+            for j in range(n):
+                if j % b == 0 and j != 0:
                     board_str += " | "
 
-                if j == 8:
-                    board_str += str(self._board[i][j]) + "\n"
+                if j == n - 1:
+                    board_str += str(self._cells[n * i + j]).rjust(width) + "\n"
                 else:
-                    board_str += str(self._board[i][j]) + " "
+                    board_str += str(self._cells[n * i + j]).rjust(width) + " "
 
         return board_str
 
@@ -78,12 +323,8 @@ class SudokuBoard:
             tuple: A tuple containing the row and column indices of an empty cell.
                    Returns None if no empty cell is found.
         """
-        for i in range(len(self._board)):
-            for j in range(len(self._board[0])):
-                if self._board[i][j] == 0:
-                    return i, j  # row, col
-
-        return None
+        idx = self._cells.find(0)
+        return None if idx < 0 else divmod(idx, self.geometry.n)  # row, col
 
     def is_valid(self, num, pos):
         """
@@ -98,51 +339,91 @@ class SudokuBoard:
         """
         row, col = pos
 
-        # Check whether `num` appears once in the row `pos[0]`
-        for j in range(len(self._board[0])):
-            if self._board[row][j] == num and j != col:  # If the number appears again in the same row
-                return False
-
-        # Check whether `num` appears once in the column `pos[1]`
-        for i in range(len(self._board)):
-            if self._board[i][col] == num and i != row:  # If the number appears again in the same column
-                return False
+        # Check whether `num` appears again in the same row, column or box
+        cells = self._cells
+        return all(cells[peer] != num for peer in self.geometry.peers[self.geometry.n * row + col])
 
-        # Check whether `num` appears once in the 3x3 square
-        # Determine the starting position of the square
-        a, b = pos[0] - (pos[0] % 3), pos[1] - (pos[1] % 3)
-        for i in range(3):  # Loop through the rows of the square
-            for j in range(3):  # Loop through the columns of the square
-                if self._board[a + i][b + j] == num and (a + i, b + j) != pos:  # If the number appears again in the square
-                    return False             
-        return True
-
-    def solve(self):
+    def solve(self, cell_order="mrv", value_order="ascending", propagate=True, engine="backtrack", max_nodes=None, hooks=None):
         """
         Solves the Sudoku board using backtracking.
 
+        The search runs on a `CandidateState`, so every candidate check and every
+        empty-cell lookup is a constant-time bit operation. The nodes explored, backtracks,
+        maximum depth, propagation steps and the time of every phase ("setup",
+        "propagate", "search") are recorded in `self.stats`.
+
+        Parameters:
+            cell_order (str or callable): Which empty cell to branch on next; "mrv" (fewest
+                candidates first, the default), "rowmajor" or a function `select(state) -> idx`.
+            value_order (str or callable): In which order to try the digits of that cell;
+                "ascending" (the default), "lcv" (least constraining value first) or a
+                function `order(state, idx, mask) -> list`.
+            propagate (bool): Whether to apply naked/hidden singles and locked candidates
+                before the search and after every branch decision.
+            engine (str): "backtrack" (the default) for the search configured by the
+                arguments above, or "dlx" for the Dancing Links exact-cover engine,
+                which ignores them.
+            max_nodes (int, optional): Give up after exploring this many nodes.
+            hooks (SearchHooks, optional): Callbacks for every digit the search places
+                and takes back.
+
         Returns:
             bool: True if the Sudoku board is solvable and solved successfully, False otherwise.
-        """
-        empty_cell = self.get_empty_cell()
 
-        # No empty cell found! This means the board is solved already (due to backtracking).
-        if not empty_cell:
-            return True
-        else:
-            row, col = empty_cell
-
-        # Place all the numbers through 1 to 9 on this empty cell and backtrack.
-        for num in range(1, 10):
-            if self.is_valid(num, (row, col)):
-                self._board[row][col] = num
+        Raises:
+            SearchAborted: If the search needed more than `max_nodes` nodes; the board is unchanged.
+        """
+        if engine == "dlx":
+            return self._solve_dlx(max_nodes, hooks)
+        if engine != "backtrack":
+            raise ValueError(f"Unknown engine: {engine!r}")
+
+        select = CELL_ORDERINGS.get(cell_order, cell_order)
+        order = VALUE_ORDERINGS.get(value_order, value_order)
+        if not callable(select) or not callable(order):
+            raise ValueError(f"Unknown ordering: {cell_order!r}, {value_order!r}")
+
+        stats = self.stats = SearchStats(max_nodes, hooks)
+        with stats.phase("setup"):
+            state = CandidateState(self._cells)
+        propagator = propagate_constraints if propagate else None
+        if not state.consistent:
+            return False
+        if propagator is not None:
+            with stats.phase("propagate"):
+                consistent = propagator(state, stats)
+            if not consistent:
+                return False
+        with stats.phase("search"):
+            solved = backtrack(state, select, order, stats, propagator)
+        if not solved:
+            return False
 
-                if self.solve():
-                    return True
+        self._fill(state.cells)
+        return True
 
-                self._board[row][col] = 0
+    def _solve_dlx(self, max_nodes=None, hooks=None):
+        """
+        Solves the Sudoku board with the Dancing Links engine.
+        """
+        stats = self.stats = SearchStats(max_nodes, hooks)
+        with stats.phase("search"):
+            solution = next(dlx.iter_solutions(self._cells, box=self.geometry.box, limit=1, stats=stats), None)
+        if solution is None:
+            return False
+        self._fill(solution)
+        return True
 
-        return False
+    def _fill(self, cells):
+        """
+        Overwrites the board with all its cell values in row-major order, and the
+        list the board was created from, if any.
+        """
+        self._cells[:] = bytes(cells)
+        if self._source is not None:
+            n = self.geometry.n
+            for i, row in enumerate(self._source):
+                row[:] = self._cells[n * i:n * i + n]
 
     def is_solved(self):
         """
@@ -151,76 +432,112 @@ class SudokuBoard:
         Returns:
             bool: True if the board is solved, False otherwise.
         """
-        # Check rows
-        for row in self._board:
-            if len(set(row)) != 9 or 0 in row:
-                return False
+        # A full grid without a repeated digit in any row, column or box
+        state = CandidateState(self._cells)
+        return state.consistent and not state.empty
 
-        # Check columns
-        for col in range(9):
-            column_values = [self._board[row][col] for row in range(9)]
-            if len(set(column_values)) != 9 or 0 in column_values:
-                return False
+    def find_conflicts(self):
+        """
+        Find the clues that clash with another clue in the same row, column or box.
 
-        # Check 3x3 subgrids
-        for i in range(0, 9, 3):
-            for j in range(0, 9, 3):
-                subgrid = [self._board[row][col] for row in range(i, i + 3) for col in range(j, j + 3)]
-                if len(set(subgrid)) != 9 or 0 in subgrid:
-                    return False
+        This is a single pass over the board and is meant to run before any search.
 
-        return True
+        Returns:
+            list: Sorted (row, col) positions of the conflicting clues, including clues
+                  outside the range 1 to n. Empty if the clues are consistent.
+        """
+        conflicts = set()
+        cells, n = self._cells, self.geometry.n
+        for unit in self.geometry.units:
+            seen = {}
+            for idx in unit:
+                num = cells[idx]
+                if num == 0:
+                    continue
+                if num > n:
+                    conflicts.add(idx)
+                elif num in seen:
+                    conflicts.update((idx, seen[num]))
+                else:
+                    seen[num] = idx
+
+        return [divmod(idx, n) for idx in sorted(conflicts)]
+
+    def count_solutions(self, limit=None, max_nodes=None):
+        """
+        Count the solutions of the Sudoku board without modifying it.
+
+        The Dancing Links engine stops as soon as `limit` solutions have been found, so
+        `count_solutions(limit=2)` returns quickly even for boards with many solutions.
+
+        Parameters:
+            limit (int, optional): Stop counting at this many solutions.
+            max_nodes (int, optional): Give up after exploring this many nodes.
+
+        Returns:
+            int: The number of solutions, capped at `limit`.
+
+        Raises:
+            SearchAborted: If counting needed more than `max_nodes` nodes.
+        """
+        if self.find_conflicts():
+            return 0
+
+        self.stats = SearchStats(max_nodes)
+        return dlx.count_solutions(self._cells, box=self.geometry.box, limit=limit, stats=self.stats)
+
+    def has_unique_solution(self):
+        """
+        Check whether the Sudoku board has exactly one solution.
+
+        Returns:
+            bool: True if the board has exactly one solution, False if it has none or several.
+        """
+        return self.count_solutions(limit=2) == 1
 
     @classmethod
-    def get_empty_board(cls):
+    def get_empty_board(cls, box=3):
         """
         Returns an empty SudokuBoard
+
+        Parameters:
+            box (int): The box size; 3 for the usual 9x9 grid, 4 for 16x16, 5 for 25x25.
         """
-        return cls([[0 for _ in range(9)] for _ in range(9)])
+        return cls(bytes(Geometry.of(box).size))
     
     @classmethod
-    def get_random_solved_board(cls):
+    def get_random_solved_board(cls, box=3):
         """
         Generates a random Sudoku board.
 
+        Parameters:
+            box (int): The box size; 3 for the usual 9x9 grid, 4 for 16x16, 5 for 25x25.
+
         Returns:
             SudokuBoard: A SudokuBoard object representing the random Sudoku board.
         """
-        # Start with an empty board
-        board = [[0 for _ in range(9)] for _ in range(9)]
-
-        # Fill the diagonal 3x3 squares with random numbers
-        for i in range(0, 9, 3):
-            nums = [1, 2, 3, 4, 5, 6, 7, 8, 9]
-            random.shuffle(nums)
-            for j in range(3):
-                for k in range(3):
-                    board[i + j][i + k] = nums.pop()
-
-        # Solve the board to get a valid Sudoku puzzle
-        sudoku = cls(board)
-        sudoku.solve()
-        return sudoku
+        from .generator import PuzzleGenerator
+
+        return cls(bytes(PuzzleGenerator(box=box).solved_grid()))
     
     @classmethod
-    def get_random_puzzle(cls):
+    def get_random_puzzle(cls, clues=None, difficulty=None, box=3):
         """
-        Generates a random Sudoku puzzle.
+        Generates a random Sudoku puzzle with a unique solution.
+
+        Parameters:
+            clues (int, optional): Target number of clues; by default about half of the
+                numbers are kept (41 for a 9x9 grid).
+            difficulty (str, optional): Target difficulty, "easy", "medium" or "hard".
+            box (int): The box size; 3 for the usual 9x9 grid, 4 for 16x16, 5 for 25x25.
 
         Returns:
             SudokuBoard: A SudokuBoard object representing the random Sudoku puzzle.
         """
-        # Generate a random solved Sudoku board
-        solved_board = cls.get_random_solved_board().board
-
-        # Create a copy of the solved board
-        puzzle_board = [row[:] for row in solved_board]
-
-        # Randomly remove numbers to create the puzzle
-        for i in range(81 // 2):  # Remove half of the numbers
-            row, col = random.randint(0, 8), random.randint(0, 8)
-            while puzzle_board[row][col] == 0:
-                row, col = random.randint(0, 8), random.randint(0, 8)
-            puzzle_board[row][col] = 0
+        from .generator import PuzzleGenerator
 
-        return cls(puzzle_board)
\ No newline at end of file
+        if clues is None:
+            size = Geometry.of(box).size
+            clues = size - size // 2
+        puzzle, _ = PuzzleGenerator(clues=clues, difficulty=difficulty, box=box).generate_one()
+        return puzzle
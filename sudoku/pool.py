@@ -0,0 +1,140 @@
+# sudoku/pool.py
+#
+# In-process pool of pre-generated puzzle/solution pairs.
+#
+# A daemon thread keeps the pool topped up: whenever the number of ready puzzles
+# drops to the low-water mark it generates puzzles until the pool is full again.
+# Taking a puzzle is then a constant-time dequeue; only when the pool is empty
+# (a miss) is a puzzle generated on the caller's thread. The thread is started
+# by the first `get()` (or an explicit `start()`), so creating a pool is free.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import threading
+from collections import deque
+
+from .generator import PuzzleGenerator
+
+__all__ = ["PuzzlePool"]
+
+
+class PuzzlePool:
+    """
+    A bounded pool of ready-made (puzzle, solution) pairs refilled in the background.
+
+    Attributes:
+        capacity (int): Maximum number of ready puzzles.
+        low_water (int): The refill starts when this many puzzles or fewer are left.
+        hits (int): Number of `get()` calls served from the pool.
+        misses (int): Number of `get()` calls that had to generate a puzzle themselves.
+    """
+
+    def __init__(self, capacity=32, low_water=8, generator=None):
+        """
+        Initializes the pool; the background worker is launched by the first `get()`
+        or by `start()`.
+
+        Parameters:
+            capacity (int): Maximum number of ready puzzles.
+            low_water (int): The refill starts when this many puzzles or fewer are left.
+            generator (PuzzleGenerator, optional): Source of the puzzles; a default
+                `PuzzleGenerator()` is used if omitted.
+        """
+        if not 0 <= low_water < capacity:
+            raise ValueError("low_water must be at least 0 and below capacity")
+
+        self.capacity = capacity
+        self.low_water = low_water
+        self.hits = 0
+        self.misses = 0
+        self._generator = generator or PuzzleGenerator()
+        self._generator_lock = threading.Lock()
+        self._lock = threading.Lock()  # guards the counters and the worker
+        self._ready = deque()
+        self._refill = threading.Event()
+        self._stopped = threading.Event()
+        self._worker = None
+
+    def __len__(self):
+        return len(self._ready)
+
+    def start(self):
+        """
+        Launches the background worker (once) and returns the pool.
+        """
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="sudoku-puzzle-pool", daemon=True)
+                self._refill.set()
+                self._worker.start()
+        return self
+
+    def stop(self, timeout=None):
+        """
+        Stops the background worker after the puzzle it is currently generating.
+        """
+        self._stopped.set()
+        self._refill.set()
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.join(timeout)
+
+    def _generate(self):
+        # PuzzleGenerator keeps its own random state, so it must not be shared concurrently
+        with self._generator_lock:
+            return self._generator.generate_one()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._refill.wait()
+            self._refill.clear()
+            while not self._stopped.is_set() and len(self._ready) < self.capacity:
+                self._ready.append(self._generate())
+
+    def get(self):
+        """
+        Takes a puzzle from the pool, generating one on the spot if the pool is empty.
+
+        The first call starts the background worker, unless the pool is stopped.
+
+        Returns:
+            tuple: The puzzle and its solution as two SudokuBoard objects.
+        """
+        if self._worker is None and not self._stopped.is_set():
+            self.start()
+        try:
+            pair = self._ready.popleft()
+        except IndexError:
+            pair = None
+        with self._lock:
+            if pair is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if pair is None:
+            pair = self._generate()
+
+        if len(self._ready) <= self.low_water:
+            self._refill.set()
+        return pair
+
+    def stats(self):
+        """
+        Returns the pool counters.
+
+        Returns:
+            dict: The number of ready puzzles, the capacity, hits, misses and hit rate.
+        """
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "ready": len(self._ready),
+            "capacity": self.capacity,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
@@ -0,0 +1,193 @@
+# sudoku/propagation.py
+#
+# Logical constraint propagation on a `CandidateState`.
+#
+# The rules are applied cheapest first until none of them makes progress:
+#   - naked singles:  a cell with a single candidate gets that digit;
+#   - hidden singles: a digit with a single possible cell in a unit goes there;
+#   - locked candidates: if the candidates of a digit inside a box all lie on one
+#     row/column (pointing), or those inside a row/column all lie in one box
+#     (claiming), the digit is eliminated from the rest of that row/column or box.
+#
+# Every change goes through `CandidateState.assign`/`eliminate`, so a caller can
+# roll propagation back with `CandidateState.undo`.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+__all__ = ["propagate"]
+
+_SEGMENTS = {}
+
+
+def _segments(geometry):
+    """
+    Builds (once per box size) the intersections of every box with its rows and columns.
+
+    Returns:
+        tuple: One `(cells, line_siblings, box_siblings, line_rest, box_rest)` entry per
+               segment, where the siblings are the other segments of the same line and
+               of the same box, and the rests are the cells of the line outside the box
+               and of the box outside the line.
+    """
+    if geometry.box in _SEGMENTS:
+        return _SEGMENTS[geometry.box]
+
+    box, n = geometry.box, geometry.n
+    box_of = geometry.box_of
+
+    # Segment `kind * n * box + line * box + part` is where the line meets its `part`-th box
+    segments = []
+    for kind in range(2):
+        for line in range(n):
+            unit = geometry.units[kind * n + line]
+            for part in range(box):
+                segments.append(unit[part * box:(part + 1) * box])
+
+    per_kind = n * box
+    table = []
+    for s, cells in enumerate(segments):
+        kind, line = divmod(s, per_kind)
+        line //= box
+        unit = geometry.units[kind * n + line]
+        b = box_of[cells[0]]
+        line_siblings = tuple(
+            t for t in range(kind * per_kind + line * box, kind * per_kind + (line + 1) * box) if t != s
+        )
+        box_siblings = tuple(
+            t for t in range(kind * per_kind, (kind + 1) * per_kind)
+            if t != s and box_of[segments[t][0]] == b
+        )
+        line_rest = tuple(idx for idx in unit if box_of[idx] != b)
+        box_rest = tuple(idx for idx in geometry.units[2 * n + b] if idx not in unit)
+        table.append((cells, line_siblings, box_siblings, line_rest, box_rest))
+
+    _SEGMENTS[geometry.box] = tuple(table)
+    return _SEGMENTS[geometry.box]
+
+
+def _naked_singles(state, stats):
+    cells = state.cells
+    progress = False
+    for idx in state.empty[:]:
+        if cells[idx]:
+            continue
+        mask = state.candidates(idx)
+        if not mask:
+            return None
+        if not mask & (mask - 1):
+            state.assign(idx, mask.bit_length())
+            stats.propagated += 1
+            progress = True
+    return progress
+
+
+def _hidden_singles(state, stats):
+    # Candidates only shrink while singles are placed, so the snapshot taken here is a
+    # superset of the live candidates: a digit missing from a unit that it shows in a
+    # single cell is either a genuine hidden single or has no cell left at all.
+    cells = state.cells
+    candidates = state.candidates
+    masks = state.all_candidates()
+    full = state.geometry.full
+    progress = False
+    for unit in state.geometry.units:
+        once = twice = placed = 0
+        for idx in unit:
+            num = cells[idx]
+            if num:
+                placed |= 1 << (num - 1)
+            else:
+                mask = masks[idx]
+                twice |= once & mask
+                once |= mask
+
+        # Some missing digit has no cell left in this unit
+        if once | placed != full:
+            return None
+
+        singles = once & ~(twice | placed)
+        while singles:
+            bit = singles & -singles
+            singles ^= bit
+            for idx in unit:
+                if not cells[idx] and candidates(idx) & bit:
+                    state.assign(idx, bit.bit_length())
+                    stats.propagated += 1
+                    progress = True
+                    break
+            else:
+                # The only cell for this digit was taken by another hidden single
+                return None
+    return progress
+
+
+def _locked_candidates(state, stats):
+    cells = state.cells
+    candidates = state.candidates
+    masks = state.all_candidates()
+    segments = _segments(state.geometry)
+    seg_masks = []
+    for segment in segments:
+        mask = 0
+        for idx in segment[0]:
+            mask |= masks[idx]
+        seg_masks.append(mask)
+
+    progress = False
+    for s, (_, line_siblings, box_siblings, line_rest, box_rest) in enumerate(segments):
+        mask = seg_masks[s]
+        if not mask:
+            continue
+        others = 0
+        for t in box_siblings:
+            others |= seg_masks[t]
+        pointing = mask & ~others
+        others = 0
+        for t in line_siblings:
+            others |= seg_masks[t]
+        claiming = mask & ~others
+
+        for digits, rest in ((pointing, line_rest), (claiming, box_rest)):
+            if not digits:
+                continue
+            for idx in rest:
+                if not cells[idx]:
+                    hit = candidates(idx) & digits
+                    if hit:
+                        state.eliminate(idx, hit)
+                        stats.eliminated += 1
+                        progress = True
+    return progress
+
+
+def propagate(state, stats, locked=True):
+    """
+    Applies naked singles, hidden singles and (optionally) locked candidates to
+    `state` until a fixed point is reached.
+
+    Parameters:
+        state (CandidateState): The constraint state to be narrowed in place.
+        stats (SearchStats): Counters updated with the number of forced placements and eliminations.
+        locked (bool): Whether to apply the pointing/claiming rules as well.
+
+    Returns:
+        bool: False if a contradiction was found (a cell or a unit digit without any
+              candidate left), True otherwise.
+    """
+    while True:
+        progress = _naked_singles(state, stats)
+        if progress is None:
+            return False
+        if progress:
+            continue
+
+        progress = _hidden_singles(state, stats)
+        if progress is None:
+            return False
+        if progress:
+            continue
+
+        if not (locked and _locked_candidates(state, stats)):
+            return True
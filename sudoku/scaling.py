@@ -0,0 +1,93 @@
+# sudoku/scaling.py
+#
+# Timing of the Sudoku engines at every grid size.
+#
+# For each box size a few puzzles are generated (keeping half of the clues, the
+# same density as the web app's 9x9 puzzles) and solved with both engines. The
+# table printed at the end is the one published in the README.
+#
+# Usage:
+#   python -m sudoku.scaling
+#   python -m sudoku.scaling --boxes 3 4 --puzzles 20 --seed 1
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import argparse
+import time
+from statistics import median
+
+from .generator import PuzzleGenerator
+from .state import Geometry
+
+__all__ = ["time_size", "main"]
+
+ENGINES = ("backtrack", "dlx")
+
+
+def time_size(box, puzzles=5, seed=None):
+    """
+    Generates and solves `puzzles` puzzles of box size `box`.
+
+    Parameters:
+        box (int): The box size; 3 for 9x9, 4 for 16x16, 5 for 25x25.
+        puzzles (int): Number of puzzles to time.
+        seed (optional): Seed of the puzzle generator.
+
+    Returns:
+        dict: Median seconds to generate a solved grid, to generate a puzzle and to
+              solve it with each engine, plus the median node count of each engine.
+    """
+    size = Geometry.of(box).size
+    generator = PuzzleGenerator(clues=size - size // 2, seed=seed, max_attempts=1, box=box)
+    grid_times, puzzle_times = [], []
+    solve_times = {engine: [] for engine in ENGINES}
+    nodes = {engine: [] for engine in ENGINES}
+
+    for _ in range(puzzles):
+        start = time.perf_counter()
+        generator.solved_grid()
+        grid_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        puzzle, solution = generator.generate_one()
+        puzzle_times.append(time.perf_counter() - start)
+
+        for engine in ENGINES:
+            board = puzzle.copy()
+            start = time.perf_counter()
+            if not board.solve(engine=engine) or board != solution:
+                raise RuntimeError(f"The {engine} engine failed on a {box * box}x{box * box} puzzle")
+            solve_times[engine].append(time.perf_counter() - start)
+            nodes[engine].append(board.stats.nodes)
+
+    result = {"grid": median(grid_times), "puzzle": median(puzzle_times)}
+    for engine in ENGINES:
+        result[engine] = median(solve_times[engine])
+        result[engine + "_nodes"] = median(nodes[engine])
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the Sudoku engines at every grid size.")
+    parser.add_argument("--boxes", type=int, nargs="+", default=[3, 4, 5], help="box sizes to time (default: 3 4 5)")
+    parser.add_argument("--puzzles", type=int, default=5, help="puzzles per size (default: 5)")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the puzzle generator")
+    args = parser.parse_args(argv)
+
+    print("| Grid | Solved grid | Puzzle (half the clues) | backtrack + propagation | dlx |")
+    print("|---|---|---|---|---|")
+    for box in args.boxes:
+        n = box * box
+        result = time_size(box, args.puzzles, args.seed)
+        print(
+            f"| {n}x{n} | {1000 * result['grid']:.1f} ms | {1000 * result['puzzle']:.1f} ms "
+            f"| {1000 * result['backtrack']:.1f} ms ({result['backtrack_nodes']:.0f} nodes) "
+            f"| {1000 * result['dlx']:.1f} ms ({result['dlx_nodes']:.0f} nodes) |",
+            flush=True,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+# sudoku/search.py
+#
+# Backtracking search over a `CandidateState` with pluggable cell and digit ordering.
+#
+# A cell ordering is a function `select(state) -> idx` returning the empty cell to
+# branch on next, and a digit ordering is a function `order(state, idx, mask) -> list`
+# returning the candidate digits of that cell in the order they should be tried.
+# The search itself is the generic engine of `backtracking.engine`, which
+# `SudokuProblem` connects to the state.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from backtracking.engine import search
+from backtracking.stats import SearchAborted, SearchHooks, SearchStats
+
+__all__ = [
+    "SearchStats",
+    "SearchAborted",
+    "SearchHooks",
+    "first_empty",
+    "most_constrained",
+    "ascending",
+    "least_constraining",
+    "CELL_ORDERINGS",
+    "VALUE_ORDERINGS",
+    "SudokuProblem",
+    "backtrack",
+]
+
+
+def first_empty(state):
+    """
+    Branches on the first empty cell in row-major order (the classic order).
+    """
+    return state.next_empty()
+
+
+def most_constrained(state):
+    """
+    Minimum remaining values: branches on the empty cell with the fewest candidates.
+    """
+    best, best_count = -1, state.geometry.n + 1
+    # `state.candidates` inlined, since this runs over every empty cell at every node
+    rows, cols, boxes, elim = state.rows, state.cols, state.boxes, state.elim
+    row_of, col_of, box_of = state.geometry.row_of, state.geometry.col_of, state.geometry.box_of
+    full = state.geometry.full
+    for idx in state.empty:
+        count = (full & ~(rows[row_of[idx]] | cols[col_of[idx]] | boxes[box_of[idx]] | elim[idx])).bit_count()
+        if count < best_count:
+            best, best_count = idx, count
+            if count <= 1:  # Cannot do better than a forced (or dead) cell
+                break
+    return best
+
+
+def ascending(state, idx, mask):
+    """
+    Tries the candidate digits in increasing order.
+    """
+    digits = []
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        digits.append(bit.bit_length())
+    return digits
+
+
+def least_constraining(state, idx, mask):
+    """
+    Least constraining value: tries first the digits that remove the fewest
+    candidates from the empty peers of the cell `idx`.
+    """
+    peer_masks = [state.candidates(peer) for peer in state.geometry.peers[idx] if state.cells[peer] == 0]
+    digits = ascending(state, idx, mask)
+    return sorted(digits, key=lambda num: sum(1 for m in peer_masks if m >> (num - 1) & 1))
+
+
+CELL_ORDERINGS = {
+    "rowmajor": first_empty,
+    "mrv": most_constrained,
+}
+
+VALUE_ORDERINGS = {
+    "ascending": ascending,
+    "lcv": least_constraining,
+}
+
+
+class SudokuProblem:
+    """
+    A `CandidateState` as a problem of the generic backtracking engine: the
+    variables are the empty cells and the values their candidate digits.
+
+    Attributes:
+        state (CandidateState): The constraint state being completed in place.
+        stats (SearchStats): Counters passed on to `propagate`.
+        log (list or None): If a list, every cell filled or emptied is appended to it
+            as an `(idx, num)` pair, with `num` 0 for an emptied cell.
+    """
+
+    __slots__ = ("state", "stats", "log", "_select", "_order", "_propagate", "_marks")
+
+    def __init__(self, state, select, order, stats, propagate=None, log=None):
+        self.state = state
+        self.stats = stats
+        self.log = log
+        self._select = select
+        self._order = order
+        self._propagate = propagate
+        self._marks = []
+
+    def select(self):
+        idx = self._select(self.state)
+        return None if idx < 0 else idx
+
+    def order(self, idx):
+        state = self.state
+        return self._order(state, idx, state.candidates(idx))
+
+    def assign(self, idx, num):
+        state = self.state
+        mark = len(state.trail)
+        self._marks.append(mark)
+        state.assign(idx, num)
+        consistent = self._propagate is None or self._propagate(state, self.stats)
+        if self.log is not None:
+            self.log_placements(mark)
+        return consistent
+
+    def undo(self, idx, num):
+        state = self.state
+        mark = self._marks.pop()
+        if self.log is not None:
+            cells = state.trail[mark:]
+            self.log.extend((cell, 0) for cell in reversed(cells) if cell.__class__ is int)
+        state.undo(mark)
+
+    def log_placements(self, mark):
+        """
+        Appends to `log` the cells filled since the trail had length `mark`.
+        """
+        cells = self.state.cells
+        self.log.extend((cell, cells[cell]) for cell in self.state.trail[mark:] if cell.__class__ is int)
+
+    def solution(self):
+        return bytes(self.state.cells)
+
+
+def backtrack(state, select, order, stats, propagate=None):
+    """
+    Completes `state` in place by depth-first search (see `backtracking.engine`).
+
+    Parameters:
+        state (CandidateState): The constraint state to be completed.
+        select (callable): Cell ordering, see `CELL_ORDERINGS`.
+        order (callable): Digit ordering, see `VALUE_ORDERINGS`.
+        stats (SearchStats): Counters updated while searching; `stats.hooks`, if set, is
+            told about every digit placed and taken back.
+        propagate (callable, optional): Called as `propagate(state, stats)` after every
+            branch decision; returning False prunes the branch.
+
+    Returns:
+        bool: True if every empty cell could be filled, False otherwise.
+
+    Raises:
+        SearchAborted: If `stats.limit` nodes have been explored (the state is then left partially filled).
+    """
+    problem = SudokuProblem(state, select, order, stats, propagate)
+    return search(problem, "first", stats=stats) is not None
@@ -0,0 +1,255 @@
+# sudoku/state.py
+#
+# Incremental constraint state used by the Sudoku solvers.
+#
+# Every row, column and box keeps a bitmask of the digits already placed in it
+# (bit `num - 1` is set when `num` is present). Checking whether a digit may go
+# into a cell, or listing all candidates of a cell, is then a couple of bit
+# operations instead of a scan over the cell's row, column and box.
+#
+# Grids of any box size b are supported: the grid is n x n with n = b * b
+# (9x9 for b = 3, 16x16 for b = 4, 25x25 for b = 5) and holds the digits 1 to n.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from math import isqrt
+
+__all__ = ["Geometry", "CandidateState"]
+
+
+class Geometry:
+    """
+    Lookup tables of a Sudoku grid with a given box size, for the flat cell index
+    `idx = n * row + col`. Use `Geometry.of(box)` to get the shared instance.
+
+    Attributes:
+        box (int): The box size b.
+        n (int): The side length b * b, also the number of digits.
+        size (int): The number of cells n * n.
+        full (int): The bitmask of all n digits.
+        row_of (tuple): The row of every cell.
+        col_of (tuple): The column of every cell.
+        box_of (tuple): The box of every cell (boxes numbered row by row).
+        units (tuple): The 3n units (rows, then columns, then boxes) as tuples of cell indices.
+        peers (tuple): The cells sharing a row, column or box with every cell.
+    """
+
+    __slots__ = ("box", "n", "size", "full", "row_of", "col_of", "box_of", "units", "peers")
+
+    _instances = {}
+
+    def __init__(self, box):
+        n = box * box
+        size = n * n
+        self.box = box
+        self.n = n
+        self.size = size
+        self.full = (1 << n) - 1
+        self.row_of = tuple(idx // n for idx in range(size))
+        self.col_of = tuple(idx % n for idx in range(size))
+        self.box_of = tuple(box * (idx // (n * box)) + (idx % n) // box for idx in range(size))
+
+        rows = tuple(tuple(n * r + c for c in range(n)) for r in range(n))
+        cols = tuple(tuple(n * r + c for r in range(n)) for c in range(n))
+        boxes = [[] for _ in range(n)]
+        for idx in range(size):
+            boxes[self.box_of[idx]].append(idx)
+        self.units = rows + cols + tuple(tuple(b) for b in boxes)
+
+        self.peers = tuple(
+            tuple(sorted(
+                (set(rows[self.row_of[idx]]) | set(cols[self.col_of[idx]]) | set(boxes[self.box_of[idx]])) - {idx}
+            ))
+            for idx in range(size)
+        )
+
+    @classmethod
+    def of(cls, box):
+        """
+        Returns the (cached) geometry of the grid with box size `box`.
+        """
+        if box not in cls._instances:
+            if box < 1:
+                raise ValueError("The box size must be at least 1")
+            cls._instances[box] = cls(box)
+        return cls._instances[box]
+
+    @classmethod
+    def for_size(cls, size):
+        """
+        Returns the geometry of the grid with `size` cells (81, 256, 625, ...).
+        """
+        box = isqrt(isqrt(size))
+        if box ** 4 != size or box < 1:
+            raise ValueError(f"{size} cells do not form a Sudoku grid")
+        return cls.of(box)
+
+
+class CandidateState:
+    """
+    Row/column/box digit bitmasks of a Sudoku grid, updated incrementally.
+
+    Attributes:
+        geometry (Geometry): The lookup tables of the grid.
+        cells (list): The cell values in row-major order (0 denotes an empty cell).
+        rows (list): One digit bitmask per row.
+        cols (list): One digit bitmask per column.
+        boxes (list): One digit bitmask per box.
+        empty (list): Indices of the empty cells, in no particular order once cells are
+                      filled by propagation; undoing restores the order exactly, so the state
+                      after any sequence of assignments does not depend on what was undone.
+        empty_mask (int): The empty cells as a bitmask (bit `idx` for the cell `idx`).
+        elim (list): Per-cell bitmask of digits ruled out by inference rather than by a placed peer.
+        trail (list): Undo log of `assign` and `eliminate`, rolled back with `undo`.
+        consistent (bool): False if the initial clues already conflict with each other.
+    """
+
+    __slots__ = (
+        "geometry", "cells", "rows", "cols", "boxes", "elim", "empty", "empty_mask", "_where", "trail", "consistent",
+        "_row_of", "_col_of", "_box_of", "_full",
+    )
+
+    def __init__(self, cells):
+        """
+        Builds the bitmasks from the cells of a board.
+
+        Parameters:
+            cells (sequence): The cell values in row-major order (0 denotes an empty cell);
+                81 cells for a 9x9 grid, 256 for 16x16, 625 for 25x25 and so on.
+        """
+        geometry = self.geometry = Geometry.for_size(len(cells))
+        n = geometry.n
+        self._row_of = geometry.row_of
+        self._col_of = geometry.col_of
+        self._box_of = geometry.box_of
+        self._full = geometry.full
+
+        self.cells = list(cells)
+        self.rows = [0] * n
+        self.cols = [0] * n
+        self.boxes = [0] * n
+        self.elim = [0] * geometry.size
+        self.empty = []
+        self.empty_mask = 0
+        self._where = [-1] * geometry.size
+        self.trail = []
+        self.consistent = True
+
+        for idx in range(geometry.size - 1, -1, -1):
+            num = self.cells[idx]
+            if num == 0:
+                self._where[idx] = len(self.empty)
+                self.empty.append(idx)
+                self.empty_mask |= 1 << idx
+            elif 1 <= num <= n and self.consistent:
+                bit = 1 << (num - 1)
+                if (self.rows[self._row_of[idx]] | self.cols[self._col_of[idx]] | self.boxes[self._box_of[idx]]) & bit:
+                    self.consistent = False
+                self._set(idx, bit)
+            else:
+                self.consistent = False
+
+    def _set(self, idx, bit):
+        self.rows[self._row_of[idx]] |= bit
+        self.cols[self._col_of[idx]] |= bit
+        self.boxes[self._box_of[idx]] |= bit
+
+    def candidates(self, idx):
+        """
+        Returns the bitmask of digits that can still be placed at the cell `idx`.
+        """
+        return self._full & ~(
+            self.rows[self._row_of[idx]] | self.cols[self._col_of[idx]] | self.boxes[self._box_of[idx]] | self.elim[idx]
+        )
+
+    def all_candidates(self):
+        """
+        Returns the candidate bitmasks of all cells at once (0 for filled cells).
+        """
+        rows, cols, boxes, elim = self.rows, self.cols, self.boxes, self.elim
+        row_of, col_of, box_of, full = self._row_of, self._col_of, self._box_of, self._full
+        masks = [0] * len(self.cells)
+        for idx in self.empty:
+            masks[idx] = full & ~(rows[row_of[idx]] | cols[col_of[idx]] | boxes[box_of[idx]] | elim[idx])
+        return masks
+
+    def can_place(self, idx, num):
+        """
+        Checks whether `num` is still a candidate of the cell `idx`.
+        """
+        return bool(self.candidates(idx) & (1 << (num - 1)))
+
+    def next_empty(self):
+        """
+        Returns the index of the first empty cell in row-major order, or -1 if the grid is full.
+
+        This is the lowest bit of `empty_mask`, whatever order propagation filled the cells in.
+        """
+        mask = self.empty_mask
+        return (mask & -mask).bit_length() - 1
+
+    def place(self, idx, num):
+        """
+        Places `num` on the empty cell `idx`.
+        """
+        self.cells[idx] = num
+        self._set(idx, 1 << (num - 1))
+        self.empty_mask &= ~(1 << idx)
+
+        # Swap-remove `idx` from the list of empty cells; `_where[idx]` keeps its old
+        # position so that `remove` can put it back there
+        pos = self._where[idx]
+        last = self.empty.pop()
+        if last != idx:
+            self.empty[pos] = last
+            self._where[last] = pos
+
+    def remove(self, idx):
+        """
+        Empties the cell `idx`, undoing the latest `place` (undos must come in reverse order).
+        """
+        clear = ~(1 << (self.cells[idx] - 1))
+        self.cells[idx] = 0
+        self.rows[self._row_of[idx]] &= clear
+        self.cols[self._col_of[idx]] &= clear
+        self.boxes[self._box_of[idx]] &= clear
+        self.empty_mask |= 1 << idx
+
+        # Undo the swap-remove of `place`: the cell moved into `idx`'s slot goes back to the end
+        empty, where = self.empty, self._where
+        pos = where[idx]
+        if pos < len(empty):
+            moved = empty[pos]
+            where[moved] = len(empty)
+            empty.append(moved)
+            empty[pos] = idx
+        else:
+            empty.append(idx)
+
+    def assign(self, idx, num):
+        """
+        Places `num` on the empty cell `idx` and records it on the trail.
+        """
+        self.place(idx, num)
+        self.trail.append(idx)
+
+    def eliminate(self, idx, mask):
+        """
+        Rules out the digits of `mask` for the cell `idx` and records it on the trail.
+        """
+        self.trail.append((idx, self.elim[idx]))
+        self.elim[idx] |= mask
+
+    def undo(self, mark):
+        """
+        Rolls back every `assign` and `eliminate` made since the trail had length `mark`.
+        """
+        trail = self.trail
+        while len(trail) > mark:
+            entry = trail.pop()
+            if entry.__class__ is int:
+                self.remove(entry)
+            else:
+                self.elim[entry[0]] = entry[1]
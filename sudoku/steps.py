@@ -0,0 +1,84 @@
+# sudoku/steps.py
+#
+# Step-by-step solving of a Sudoku board, for showing the search as it runs.
+#
+# `SudokuStepper` is a `backtracking.Stepper` over a `SudokuProblem` that logs
+# every cell the search fills (by a branch decision or by propagation) and
+# every cell it empties again. `advance` runs a few nodes, and `diffs` hands
+# over the cell changes made since the previous call, in order, so a client
+# can replay them on its copy of the board. The number of filled cells is kept
+# up to date from the same changes.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from backtracking.stepper import Stepper
+from backtracking.stats import SearchStats
+
+from .propagation import propagate as propagate_constraints
+from .search import CELL_ORDERINGS, VALUE_ORDERINGS, SudokuProblem
+from .state import CandidateState
+
+__all__ = ["SudokuStepper"]
+
+
+class SudokuStepper(Stepper):
+    """
+    Solves a board a few nodes at a time, logging every cell filled and emptied.
+
+    Attributes:
+        filled (int): Number of filled cells once the changes returned by `diffs` are applied.
+        size (int): Number of cells of the board.
+        consistent (bool): False if the clues clash, or propagation alone proves
+            the board has no solution; the stepper is then done from the start.
+    """
+
+    def __init__(self, cells, cell_order="mrv", value_order="ascending", propagate=True, max_nodes=None, snapshot=None):
+        """
+        Parameters:
+            cells (sequence): The cell values of the board in row-major order (0 for empty).
+            cell_order (str or callable): Cell ordering, see `SudokuBoard.solve`.
+            value_order (str or callable): Digit ordering, see `SudokuBoard.solve`.
+            propagate (bool): Whether to apply constraint propagation after every decision.
+            max_nodes (int, optional): Node budget, see `Stepper.advance`.
+            snapshot (bytes, optional): Resume from the `snapshot()` of a stepper on the
+                same board with the same options.
+        """
+        select = CELL_ORDERINGS.get(cell_order, cell_order)
+        order = VALUE_ORDERINGS.get(value_order, value_order)
+        if not callable(select) or not callable(order):
+            raise ValueError(f"Unknown ordering: {cell_order!r}, {value_order!r}")
+
+        stats = SearchStats(max_nodes)
+        state = CandidateState(cells)
+        self.size = len(state.cells)
+        self.filled = self.size - len(state.empty)
+        self._log = []
+        propagator = propagate_constraints if propagate else None
+        problem = SudokuProblem(state, select, order, stats, propagator, log=self._log)
+
+        # Propagation before the search is logged like any other change
+        self.consistent = state.consistent and (propagator is None or propagator(state, stats))
+        problem.log_placements(0)
+        super().__init__(problem, stats, snapshot if self.consistent else None)
+        if not self.consistent:
+            self.done, self.solution = True, None
+
+    @property
+    def cells(self):
+        """The cell values of the board as it stands."""
+        return self.problem.state.cells
+
+    def diffs(self):
+        """
+        Returns the cell changes since the previous call and clears the log.
+
+        Returns:
+            list: `(idx, num)` pairs in the order they happened; `num` is 0 for an emptied cell.
+        """
+        changes = self._log[:]
+        self._log.clear()
+        for _, num in changes:
+            self.filled += 1 if num else -1
+        return changes
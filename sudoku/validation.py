@@ -0,0 +1,129 @@
+# sudoku/validation.py
+#
+# Vectorized validation of many Sudoku grids at once with NumPy.
+#
+# Every cell value `v` is turned into the bit `1 << (v - 1)` (0 for an empty cell),
+# and each row, column and box is reduced both with a bitwise OR and with a sum.
+# The two agree exactly when no digit is repeated in the unit, and the OR equals
+# the full mask exactly when the unit holds every digit. Both reductions run over
+# the whole batch at once; only the boards found inconsistent go through the more
+# expensive per-digit counting that locates the conflicting cells.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+from collections import namedtuple
+from math import isqrt
+
+import numpy as np
+
+__all__ = ["BatchValidation", "validate_boards"]
+
+BatchValidation = namedtuple("BatchValidation", ["solved", "consistent", "conflicts"])
+BatchValidation.__doc__ = """
+Result of `validate_boards` for N boards of size n x n.
+
+Attributes:
+    solved (numpy.ndarray): (N,) bool, the board is full and breaks no rule.
+    consistent (numpy.ndarray): (N,) bool, no digit repeats in a row, column or box
+        and every value lies between 0 and n (the board may still be incomplete).
+    conflicts (numpy.ndarray): (N, n, n) bool, the cells holding a repeated digit or
+        an out-of-range value.
+"""
+
+_UNIT_TABLES = {}
+
+
+def _unit_tables(box):
+    """
+    Returns (once per box size) the cell indices of all units and, for rows, columns
+    and boxes separately, the permutation mapping unit order back to cell order.
+    """
+    if box not in _UNIT_TABLES:
+        n = box * box
+        cells = np.arange(n * n).reshape(n, n)
+        rows = cells
+        cols = cells.T
+        boxes = cells.reshape(box, box, box, box).transpose(0, 2, 1, 3).reshape(n, n)
+        units = np.concatenate([rows, cols, boxes])
+        inverse = [np.argsort(group.ravel()) for group in (rows, cols, boxes)]
+        _UNIT_TABLES[box] = (units, inverse)
+    return _UNIT_TABLES[box]
+
+
+def _bit_dtype(n):
+    # Sums of up to n bits below 1 << (n + 1) must not overflow
+    if n * (1 << (n + 1)) < 1 << 16:
+        return np.uint16
+    if n * (1 << (n + 1)) < 1 << 32:
+        return np.uint32
+    return np.uint64
+
+
+def validate_boards(boards, chunk_size=65536):
+    """
+    Checks a batch of Sudoku boards with vectorized NumPy operations.
+
+    Parameters:
+        boards (array_like): Integer array of shape (N, n, n) or (N, n * n), where n is
+            a square (9 for the usual grid) and 0 denotes an empty cell.
+        chunk_size (int): Number of boards processed per vectorized step, bounding
+            the temporary memory.
+
+    Returns:
+        BatchValidation: Per-board solved and consistent flags and per-cell conflicts.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim == 3:
+        n = boards.shape[1]
+        if boards.shape[2] != n:
+            raise ValueError("Boards must be square")
+    elif boards.ndim == 2:
+        n = isqrt(boards.shape[1])
+        if n * n != boards.shape[1]:
+            raise ValueError("Flat boards must have n * n cells")
+    else:
+        raise ValueError("Expected an array of shape (N, n, n) or (N, n * n)")
+
+    box = isqrt(n)
+    if box * box != n:
+        raise ValueError("The board size must be a perfect square")
+
+    total = boards.shape[0]
+    flat = boards.reshape(total, n * n)
+    units, inverse = _unit_tables(box)
+    dtype = _bit_dtype(n)
+    full = dtype((1 << n) - 1)
+
+    solved = np.empty(total, dtype=bool)
+    consistent = np.empty(total, dtype=bool)
+    conflicts = np.zeros((total, n * n), dtype=bool)
+
+    for start in range(0, total, chunk_size):
+        chunk = flat[start:start + chunk_size]
+        # Negative and too large values both become the out-of-range bit 1 << n
+        values = np.where((chunk < 0) | (chunk > n), n + 1, chunk).astype(dtype)
+        bits = (dtype(1) << values[:, units]) >> dtype(1)
+
+        unit_or = np.bitwise_or.reduce(bits, axis=2)
+        unit_sum = bits.sum(axis=2, dtype=dtype)
+        bad = (unit_or != unit_sum).any(axis=1) | (unit_or > full).any(axis=1)
+
+        end = start + len(chunk)
+        consistent[start:end] = ~bad
+        solved[start:end] = ~bad & (unit_or == full).all(axis=1)
+
+        # Locate the conflicts, for the inconsistent boards only
+        which = np.flatnonzero(bad)
+        if which.size:
+            sub = values[which]
+            digits = sub[:, units, None] == np.arange(1, n + 1, dtype=dtype)
+            repeated = digits.sum(axis=2) > 1
+            in_conflict = (digits & repeated[:, :, None, :]).any(axis=3)
+            cells = sub > n
+            for group, order in enumerate(inverse):
+                cells |= in_conflict[:, group * n:(group + 1) * n].reshape(len(which), n * n)[:, order]
+            conflicts[start + which] = cells
+
+    return BatchValidation(solved, consistent, conflicts.reshape(total, n, n))
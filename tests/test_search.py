@@ -0,0 +1,26 @@
+# tests/test_search.py
+#
+# The cell orderings of the Sudoku search.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import pytest
+
+from benchmarks.run import load_corpus
+from sudoku.model import SudokuBoard
+from sudoku.search import first_empty
+
+
+@pytest.mark.parametrize("corpus", ["sudoku_easy.txt", "sudoku_hard.txt", "sudoku_hardest.txt", "sudoku_unsolvable.txt"])
+def test_rowmajor_branches_on_the_first_empty_cell(corpus):
+    # "rowmajor" is the classic order the node counts of the other orderings are compared
+    # with, so it must pick the first empty cell, also after propagation filled cells out of order
+    def select(state):
+        idx = first_empty(state)
+        assert idx == (state.cells.index(0) if 0 in state.cells else -1)
+        return idx
+
+    for puzzle in load_corpus(corpus):
+        SudokuBoard.from_string(puzzle).solve(cell_order=select)
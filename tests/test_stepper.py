@@ -0,0 +1,90 @@
+# tests/test_stepper.py
+#
+# Snapshots of the step-wise search: resuming from any step must finish the
+# search exactly as the uninterrupted run does.
+#
+# Author: Indrajit Ghosh
+# Created on: Oct 18, 2026
+#
+
+import pytest
+
+from sudoku.model import SudokuBoard
+from sudoku.steps import SudokuStepper
+
+EASY = "......15..3...1.749.5.8........76..949..5.2....7......2.1.......7..6..8...6..4..."
+HARDEST = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+HARD = "1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3.."
+UNSOLVABLE = "..1.29...2.......4....36...8.4...9.......76..7...8...1.37.6..5..9.5.1.6.65....4.."
+
+CASES = [
+    (HARD, {}),
+    (UNSOLVABLE, {}),
+    (EASY, {"propagate": False}),
+    (HARDEST, {"cell_order": "rowmajor", "value_order": "lcv"}),
+]
+
+
+def _stepper(puzzle, snapshot=None, **options):
+    return SudokuStepper(bytes(SudokuBoard.from_string(puzzle)), snapshot=snapshot, **options)
+
+
+@pytest.mark.parametrize("puzzle, options", CASES)
+def test_resume_from_every_step(puzzle, options):
+    expected = _stepper(puzzle, **options)
+    expected.run()
+
+    stepper = _stepper(puzzle, **options)
+    while True:
+        resumed = _stepper(puzzle, stepper.snapshot(), **options)
+        assert resumed.done == stepper.done
+        assert resumed.depth == stepper.depth
+        assert resumed.run() == expected.solution
+        # The replayed state picks the same variables, so the rest of the path is the same
+        assert stepper.stats.nodes + resumed.stats.nodes == expected.stats.nodes
+        if stepper.done:
+            break
+        stepper.advance(1)
+
+    assert stepper.solution == expected.solution
+
+
+def test_snapshot_at_the_solution():
+    stepper = _stepper(HARDEST)
+    solution = stepper.run()
+    assert solution is not None
+
+    resumed = _stepper(HARDEST, stepper.snapshot())
+    assert resumed.done
+    assert resumed.solution == solution
+    assert resumed.cells == stepper.cells
+
+
+def test_snapshot_of_an_exhausted_search():
+    stepper = _stepper(UNSOLVABLE)
+    assert stepper.run() is None
+
+    resumed = _stepper(UNSOLVABLE, stepper.snapshot())
+    assert resumed.done and resumed.solution is None
+    assert resumed.progress == 1.0
+
+
+@pytest.mark.parametrize("snapshot", [
+    b"B\x00\x00\x01",          # cell 0 is a clue, not the cell the search picks
+    b"B\x00",                  # running, but no decision
+    b"B\x02\x0a\x01",          # exhausted, with a decision
+    b"B\x03",                  # unknown state
+    b"X\x00\x0a\x01",          # unknown typecode
+    b"B\x00\x0a",              # truncated pair
+    b"B",
+])
+def test_invalid_snapshots_are_rejected(snapshot):
+    with pytest.raises(ValueError):
+        _stepper(HARDEST, snapshot)
+
+
+def test_position_out_of_range_is_rejected():
+    stepper = _stepper(HARDEST)
+    var = stepper._variables[0]
+    with pytest.raises(ValueError):
+        _stepper(HARDEST, bytes([ord("B"), 0, var, 10]))